@@ -0,0 +1,5 @@
+#!/bin/sh
+# Runs once when the primary's data directory is initialised: lets the
+# postgres-replica service stream WAL with the regular credentials.
+set -e
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -33,6 +33,9 @@ while retry_count < max_retries:
 
 echo "Database connection established"
 
+echo "Applying database migrations..."
+python3 -m product_importer.cli init-db
+
 # Start the application
 echo "Starting uvicorn server..."
 exec uvicorn product_importer.main:app --host 0.0.0.0 --port ${PORT:-8000}
@@ -0,0 +1,44 @@
+"""Admin endpoints, enabled by configuring ``admin_token``."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from product_importer.core.profiling import admin_token_valid
+from product_importer.db.deps import get_db
+from product_importer.db.storage_deps import get_storage
+from product_importer.schemas.profile import ProfileListResponse, ProfileResponse
+from product_importer.services.profile_service import ProfileService
+
+
+def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    if not admin_token_valid(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+def get_service(db: Session = Depends(get_db)) -> ProfileService:
+    return ProfileService(db, get_storage())
+
+
+@router.get("/profiles", response_model=ProfileListResponse, summary="Stored profiles")
+def list_profiles(
+    subject: str | None = Query(default=None, description="Upload job id or 'METHOD /path'"),
+    limit: int = Query(default=50, ge=1, le=500),
+    service: ProfileService = Depends(get_service),
+) -> ProfileListResponse:
+    items = service.list_profiles(subject=subject, limit=limit)
+    return ProfileListResponse(items=[ProfileResponse.model_validate(item) for item in items])
+
+
+@router.get("/profiles/{profile_id}", summary="Download a profile as collapsed stacks")
+def download_profile(profile_id: str, service: ProfileService = Depends(get_service)) -> Response:
+    try:
+        artifact = service.get(profile_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    headers = {"Content-Disposition": f'attachment; filename="{artifact.id}.collapsed"'}
+    return Response(content=service.content(artifact), media_type="text/plain", headers=headers)
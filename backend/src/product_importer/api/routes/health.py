@@ -1,6 +1,10 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
+
+from product_importer.db.session import AsyncSessionLocal
+from product_importer.schemas.health import ReadinessResponse
+from product_importer.services.admission import AdmissionController
 
 router = APIRouter()
 
@@ -8,3 +12,30 @@ router = APIRouter()
 @router.get("/", summary="Liveness probe")
 def liveness() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/ready", response_model=ReadinessResponse, summary="Readiness probe")
+async def readiness(response: Response) -> ReadinessResponse:
+    """503 only while the primary database or the broker is unreachable.
+
+    A slow database sets ``degraded`` and a deep upload backlog only flips
+    ``accepting_uploads``; reads keep being served. The primary is checked even when
+    a replica is configured, since it is what writes and uploads depend on.
+    """
+
+    async with AsyncSessionLocal() as db:
+        decision = await AdmissionController(db).evaluate()
+    if not decision.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    signals = decision.signals
+    return ReadinessResponse(
+        ready=decision.ready,
+        degraded=decision.degraded,
+        accepting_uploads=decision.admitted,
+        reasons=list(decision.reasons),
+        active_uploads=signals.active_uploads,
+        queue_depth=signals.queue_depth,
+        db_latency_ms=signals.db_latency_ms,
+        database_ok=signals.database_ok,
+        broker_ok=signals.broker_ok,
+    )
@@ -0,0 +1,18 @@
+"""Prometheus metrics exposition."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Response
+
+from product_importer.core.metrics import render_latest
+
+router = APIRouter()
+
+
+@router.get("", summary="Prometheus metrics", include_in_schema=False)
+def metrics() -> Response:
+    rendered = render_latest()
+    if rendered is None:
+        raise HTTPException(status_code=503, detail="prometheus_client is not installed")
+    body, content_type = rendered
+    return Response(content=body, media_type=content_type)
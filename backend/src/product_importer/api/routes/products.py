@@ -2,79 +2,191 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from product_importer.db.deps import get_db
+from product_importer.db.deps import get_async_db
+from product_importer.db.routing import use_replica
+from product_importer.db.session import db_session
 from product_importer.schemas.product import (
+    BulkDeleteJobResponse,
     BulkDeleteRequest,
-    BulkDeleteResponse,
+    ExportFormat,
+    ProductBatchRequest,
+    ProductBatchResponse,
+    ProductCacheStatsResponse,
     ProductCreate,
+    ProductFacetsResponse,
     ProductListResponse,
+    ProductLookupRequest,
+    ProductLookupResponse,
     ProductResponse,
     ProductUpdate,
+    TotalMode,
 )
-from product_importer.services.product_service import ProductService
+from product_importer.services.catalog_cache import cache_stats
+from product_importer.services.product_service import AsyncProductService, ProductService
 
 router = APIRouter()
 
 
-def get_service(db: Session = Depends(get_db)) -> ProductService:
-    return ProductService(db)
+def get_service(db: AsyncSession = Depends(get_async_db)) -> AsyncProductService:
+    return AsyncProductService(db)
+
+
+def _etag_response(request: Request, body: bytes) -> Response:
+    """Serve a pre-serialized JSON body, answering 304 when the client's copy is current."""
+
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/", response_model=ProductListResponse, summary="List products")
-def list_products(
+async def list_products(
+    request: Request,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=25, ge=1, le=100),
     sku: str | None = None,
     query: str | None = None,
     is_active: bool | None = None,
-    service: ProductService = Depends(get_service),
-) -> ProductListResponse:
-    items, total = service.list_products(
-        page=page,
-        page_size=page_size,
-        sku=sku,
-        query=query,
-        is_active=is_active,
-    )
-    return ProductListResponse(items=items, total=total, page=page, page_size=page_size)
+    total_mode: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="exact counts (cached), planner estimates, or no total at all",
+    ),
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated product fields to return, e.g. sku,name,price",
+    ),
+    service: AsyncProductService = Depends(get_service),
+) -> Response:
+    selected = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+    try:
+        body = await service.list_json(
+            page=page,
+            page_size=page_size,
+            sku=sku,
+            query=query,
+            is_active=is_active,
+            total_mode=total_mode,
+            fields=selected,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _etag_response(request, body)
+
+
+@router.get("/cache/stats", response_model=ProductCacheStatsResponse, summary="Read cache counters")
+def product_cache_stats() -> ProductCacheStatsResponse:
+    return ProductCacheStatsResponse(**cache_stats())
+
+
+@router.get("/facets", response_model=ProductFacetsResponse, summary="Catalog facet counts")
+async def product_facets(service: AsyncProductService = Depends(get_service)) -> ProductFacetsResponse:
+    return await service.facets()
+
+
+@router.get("/by-sku/{sku}", response_model=ProductResponse, summary="Get a product by SKU")
+async def retrieve_product_by_sku(
+    sku: str,
+    service: AsyncProductService = Depends(get_service),
+) -> ProductResponse:
+    try:
+        return await service.get_by_sku(sku)
+    except NoResultFound as exc:
+        raise HTTPException(status_code=404, detail="Product not found") from exc
+
+
+@router.post("/lookup", response_model=ProductLookupResponse, summary="Get many products by SKU")
+async def lookup_products(
+    payload: ProductLookupRequest,
+    service: AsyncProductService = Depends(get_service),
+) -> ProductLookupResponse:
+    return await service.lookup_skus(payload.skus)
 
 
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
-def create_product(
+async def create_product(
     payload: ProductCreate,
-    service: ProductService = Depends(get_service),
+    service: AsyncProductService = Depends(get_service),
 ) -> ProductResponse:
     try:
-        product = service.create(payload)
+        product = await service.create(payload)
     except IntegrityError as exc:
         raise HTTPException(status_code=400, detail="SKU must be unique") from exc
     return product
 
 
+@router.get("/export", summary="Stream the catalog as CSV or NDJSON")
+def export_products(
+    request: Request,
+    format: ExportFormat = Query(default=ExportFormat.CSV),
+    gzip: bool = Query(default=False, description="gzip-compress the stream"),
+    sku: str | None = None,
+    query: str | None = None,
+    is_active: bool | None = None,
+) -> StreamingResponse:
+    # The stream outlives the request-scoped session, so it owns its own.
+    read_only = use_replica(request)
+
+    def stream():
+        with db_session(read_only=read_only) as session:
+            for chunk in ProductService(session).export(
+                fmt=format,
+                compress=gzip,
+                sku=sku,
+                query=query,
+                is_active=is_active,
+            ):
+                if chunk:
+                    yield chunk
+
+    media_type = "text/csv" if format is ExportFormat.CSV else "application/x-ndjson"
+    filename = f"products.{format.value}" + (".gz" if gzip else "")
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        media_type = "application/gzip"
+    return StreamingResponse(stream(), media_type=media_type, headers=headers)
+
+
+@router.post("/batch", response_model=ProductBatchResponse, summary="Batch create/update/delete by SKU")
+async def batch_products(
+    payload: ProductBatchRequest,
+    service: AsyncProductService = Depends(get_service),
+) -> ProductBatchResponse:
+    return await service.batch(payload.items)
+
+
 @router.get("/{product_id}", response_model=ProductResponse)
-def retrieve_product(
+async def retrieve_product(
     product_id: int,
-    service: ProductService = Depends(get_service),
-) -> ProductResponse:
+    request: Request,
+    service: AsyncProductService = Depends(get_service),
+) -> Response:
     try:
-        return service.get(product_id)
+        return _etag_response(request, await service.get_json(product_id))
     except NoResultFound as exc:
         raise HTTPException(status_code=404, detail="Product not found") from exc
 
 
 @router.put("/{product_id}", response_model=ProductResponse)
 @router.patch("/{product_id}", response_model=ProductResponse)
-def update_product(
+async def update_product(
     product_id: int,
     payload: ProductUpdate,
-    service: ProductService = Depends(get_service),
+    service: AsyncProductService = Depends(get_service),
 ) -> ProductResponse:
     try:
-        return service.update(product_id, payload)
+        return await service.update(product_id, payload)
     except NoResultFound as exc:
         raise HTTPException(status_code=404, detail="Product not found") from exc
 
@@ -85,22 +197,37 @@ def update_product(
     response_class=Response,
     response_model=None,
 )
-def delete_product(
+async def delete_product(
     product_id: int,
-    service: ProductService = Depends(get_service),
+    service: AsyncProductService = Depends(get_service),
 ) -> None:
     try:
-        service.delete(product_id)
+        await service.delete(product_id)
     except NoResultFound as exc:
         raise HTTPException(status_code=404, detail="Product not found") from exc
 
 
-@router.post("/bulk-delete", response_model=BulkDeleteResponse)
-def bulk_delete(
+@router.post(
+    "/bulk-delete",
+    response_model=BulkDeleteJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start a background catalog wipe",
+)
+async def bulk_delete(
     payload: BulkDeleteRequest,
-    service: ProductService = Depends(get_service),
-) -> BulkDeleteResponse:
+    service: AsyncProductService = Depends(get_service),
+) -> BulkDeleteJobResponse:
     if payload.confirmation_text.strip().upper() != "DELETE ALL":
         raise HTTPException(status_code=400, detail="Confirmation text mismatch")
-    deleted = service.bulk_delete()
-    return BulkDeleteResponse(deleted_count=deleted)
+    return await service.start_bulk_delete()
+
+
+@router.get("/bulk-delete/{job_id}", response_model=BulkDeleteJobResponse, summary="Bulk delete progress")
+async def bulk_delete_status(
+    job_id: str,
+    service: AsyncProductService = Depends(get_service),
+) -> BulkDeleteJobResponse:
+    try:
+        return await service.get_delete_job(job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
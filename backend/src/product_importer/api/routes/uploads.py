@@ -2,47 +2,57 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, UploadFile
 
-from product_importer.db.deps import get_db
+from product_importer.core.profiling import admin_token_valid
+from product_importer.db.deps import get_async_db
 from product_importer.db.storage_deps import get_storage
 from product_importer.schemas.upload import UploadInitResponse, UploadJobListResponse, UploadJobResponse
-from product_importer.services.s3_storage import S3Storage
-from product_importer.services.storage import FileStorage
-from product_importer.services.upload_service import UploadService
+from product_importer.services.storage import StorageBackend
+from product_importer.services.upload_service import AsyncUploadService, UploadService
 
 router = APIRouter()
 
 
 def get_service(
-    db=Depends(get_db),
-    storage: FileStorage | S3Storage = Depends(get_storage),
-) -> UploadService:
-    return UploadService(db, storage)
-
-
-@router.post("/", response_model=UploadInitResponse, summary="Start upload")
+    db=Depends(get_async_db),
+    storage: StorageBackend = Depends(get_storage),
+) -> AsyncUploadService:
+    return AsyncUploadService(db, storage)
+
+
+@router.post(
+    "/",
+    response_model=UploadInitResponse,
+    summary="Start upload",
+    # Enforced by UploadAdmissionMiddleware before the body is read.
+    responses={429: {"description": "Ingestion backlog or database overloaded; see Retry-After"}},
+)
 async def upload_file(
     file: UploadFile = File(...),
-    service: UploadService = Depends(get_service),
+    profile: bool = Query(default=False, description="Profile the ingestion run (admin only)"),
+    x_admin_token: str | None = Header(default=None),
+    service: AsyncUploadService = Depends(get_service),
 ) -> UploadInitResponse:
     if not file.filename or not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are supported")
+    if profile and not admin_token_valid(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required to profile an upload")
 
-    job = service.enqueue(file)
+    job = await service.enqueue(file, profile=profile)
     return UploadInitResponse(job_id=job.id, status=job.status)
 
 
 @router.get("/{job_id}", response_model=UploadJobResponse, summary="Get job status")
-def job_status(job_id: str, service: UploadService = Depends(get_service)) -> UploadJobResponse:
+async def job_status(job_id: str, service: AsyncUploadService = Depends(get_service)) -> UploadJobResponse:
     try:
-        job = service.get_job(job_id)
+        job = await service.get_job(job_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return UploadService.serialize(job)
 
 
 @router.get("/", response_model=UploadJobListResponse, summary="Recent jobs")
-def recent_jobs(service: UploadService = Depends(get_service)) -> UploadJobListResponse:
-    jobs = service.list_jobs()
+async def recent_jobs(service: AsyncUploadService = Depends(get_service)) -> UploadJobListResponse:
+    jobs = await service.list_jobs()
     return UploadJobListResponse(items=UploadService.serialize_many(jobs))
@@ -4,50 +4,80 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+import redis
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from product_importer.db.deps import get_db
+from product_importer.core.config import get_settings
+from product_importer.db.deps import get_async_db
 from product_importer.schemas.webhook import (
+    WebhookCircuitResponse,
     WebhookCreate,
     WebhookDeliveryResponse,
+    WebhookFleetStatsResponse,
     WebhookListResponse,
     WebhookResponse,
+    WebhookStatsResponse,
     WebhookTestResponse,
     WebhookUpdate,
 )
-from product_importer.services.webhook_service import WebhookService
+from product_importer.services.webhook_service import AsyncWebhookService, WebhookService
+from product_importer.services.webhook_stats import AsyncWebhookStatsService
 
+settings = get_settings()
 router = APIRouter()
 
 
-def get_service(db: Session = Depends(get_db)) -> WebhookService:
-    return WebhookService(db)
+def get_service(db: AsyncSession = Depends(get_async_db)) -> AsyncWebhookService:
+    return AsyncWebhookService(db)
+
+
+def get_stats_service(db: AsyncSession = Depends(get_async_db)) -> AsyncWebhookStatsService:
+    return AsyncWebhookStatsService(db)
+
+
+def window_minutes(
+    window_minutes: int = Query(
+        default=60,
+        ge=1,
+        le=settings.webhook_stats_retention_days * 24 * 60,
+        description="Length of the trailing window, in minutes",
+    ),
+) -> int:
+    return window_minutes
 
 
 @router.get("/", response_model=WebhookListResponse)
-def list_webhooks(service: WebhookService = Depends(get_service)) -> WebhookListResponse:
-    hooks = service.list_webhooks()
+async def list_webhooks(service: AsyncWebhookService = Depends(get_service)) -> WebhookListResponse:
+    hooks = await service.list_webhooks()
     return WebhookListResponse(items=WebhookService.serialize_many(hooks))
 
 
 @router.post("/", response_model=WebhookResponse, status_code=status.HTTP_201_CREATED)
-def create_webhook(
+async def create_webhook(
     payload: WebhookCreate,
-    service: WebhookService = Depends(get_service),
+    service: AsyncWebhookService = Depends(get_service),
 ) -> WebhookResponse:
     try:
-        hook = service.create(payload)
+        hook = await service.create(payload)
         return WebhookService.serialize(hook)
     except IntegrityError as exc:
         raise HTTPException(status_code=400, detail="Duplicate webhook") from exc
 
 
+@router.get("/stats", response_model=WebhookFleetStatsResponse, summary="Delivery stats for all webhooks")
+async def fleet_stats(
+    minutes: int = Depends(window_minutes),
+    stats: AsyncWebhookStatsService = Depends(get_stats_service),
+) -> WebhookFleetStatsResponse:
+    return await stats.fleet_stats(minutes)
+
+
 @router.get("/{webhook_id}", response_model=WebhookResponse)
-def get_webhook(webhook_id: UUID, service: WebhookService = Depends(get_service)) -> WebhookResponse:
+async def get_webhook(webhook_id: UUID, service: AsyncWebhookService = Depends(get_service)) -> WebhookResponse:
     try:
-        hook = service.get(webhook_id)
+        hook = await service.get(webhook_id)
         return WebhookService.serialize(hook)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -55,13 +85,13 @@ def get_webhook(webhook_id: UUID, service: WebhookService = Depends(get_service)
 
 @router.put("/{webhook_id}", response_model=WebhookResponse)
 @router.patch("/{webhook_id}", response_model=WebhookResponse)
-def update_webhook(
+async def update_webhook(
     webhook_id: UUID,
     payload: WebhookUpdate,
-    service: WebhookService = Depends(get_service),
+    service: AsyncWebhookService = Depends(get_service),
 ) -> WebhookResponse:
     try:
-        hook = service.update(webhook_id, payload)
+        hook = await service.update(webhook_id, payload)
         return WebhookService.serialize(hook)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -73,16 +103,16 @@ def update_webhook(
     response_model=None,
     response_class=Response,
 )
-def delete_webhook(webhook_id: UUID, service: WebhookService = Depends(get_service)) -> Response:
+async def delete_webhook(webhook_id: UUID, service: AsyncWebhookService = Depends(get_service)) -> Response:
     try:
-        service.delete(webhook_id)
+        await service.delete(webhook_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post("/{webhook_id}/test", response_model=WebhookTestResponse)
-async def test_webhook(webhook_id: UUID, service: WebhookService = Depends(get_service)) -> WebhookTestResponse:
+async def test_webhook(webhook_id: UUID, service: AsyncWebhookService = Depends(get_service)) -> WebhookTestResponse:
     try:
         result = await service.test_webhook(webhook_id)
         return WebhookTestResponse(**result)
@@ -90,10 +120,48 @@ async def test_webhook(webhook_id: UUID, service: WebhookService = Depends(get_s
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@router.get("/{webhook_id}/circuit", response_model=WebhookCircuitResponse, summary="Circuit breaker state")
+async def webhook_circuit(
+    webhook_id: UUID, service: AsyncWebhookService = Depends(get_service)
+) -> WebhookCircuitResponse:
+    try:
+        return await service.circuit(webhook_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except redis.RedisError as exc:
+        raise HTTPException(status_code=503, detail="Circuit state unavailable") from exc
+
+
+@router.post("/{webhook_id}/circuit/reset", response_model=WebhookCircuitResponse, summary="Close the circuit")
+async def reset_webhook_circuit(
+    webhook_id: UUID, service: AsyncWebhookService = Depends(get_service)
+) -> WebhookCircuitResponse:
+    try:
+        return await service.reset_circuit(webhook_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except redis.RedisError as exc:
+        raise HTTPException(status_code=503, detail="Circuit state unavailable") from exc
+
+
+@router.get("/{webhook_id}/stats", response_model=WebhookStatsResponse, summary="Delivery stats for a webhook")
+async def webhook_stats(
+    webhook_id: UUID,
+    minutes: int = Depends(window_minutes),
+    service: AsyncWebhookService = Depends(get_service),
+    stats: AsyncWebhookStatsService = Depends(get_stats_service),
+) -> WebhookStatsResponse:
+    try:
+        await service.get(webhook_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return await stats.webhook_stats(webhook_id, minutes)
+
+
 @router.get("/{webhook_id}/deliveries", response_model=list[WebhookDeliveryResponse])
-def webhook_deliveries(webhook_id: UUID, service: WebhookService = Depends(get_service)) -> list[WebhookDeliveryResponse]:
+async def webhook_deliveries(webhook_id: UUID, service: AsyncWebhookService = Depends(get_service)) -> list[WebhookDeliveryResponse]:
     try:
-        deliveries = service.list_deliveries(webhook_id)
+        deliveries = await service.list_deliveries(webhook_id)
         return WebhookService.serialize_deliveries(deliveries)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
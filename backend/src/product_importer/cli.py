@@ -0,0 +1,122 @@
+"""Operational commands: schema setup and startup benchmarks.
+
+Run with ``python -m product_importer.cli --help`` (or ``product-importer`` when the
+package is installed).
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import typer
+
+app = typer.Typer(help="Product Importer maintenance commands.", no_args_is_help=True)
+
+# What each process imports before it can serve: the ASGI app, and a worker's Celery
+# app plus every task module it autodiscovers.
+STARTUP_TARGETS = {
+    "api": "import product_importer.main",
+    "worker": (
+        "from product_importer.workers.celery_app import celery_app; "
+        "celery_app.loader.import_default_modules()"
+    ),
+}
+
+_TIMED = "import time; _t = time.perf_counter(); {code}; print(time.perf_counter() - _t)"
+
+
+@app.command("init-db")
+def init_db(revision: str = typer.Option("head", help="Alembic revision to upgrade to")) -> None:
+    """Create or upgrade the database schema by running Alembic migrations."""
+
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", str(Path(__file__).parent / "migrations"))
+    command.upgrade(config, revision)
+    typer.echo(f"Database schema upgraded to {revision}")
+
+
+def _import_seconds(code: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _TIMED.format(code=code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _slowest_imports(code: str, top: int) -> list[tuple[str, float]]:
+    """Packages ranked by the time spent executing their own modules at import.
+
+    Sums ``python -X importtime`` self times per top-level package, so a dependency
+    pulled in deep inside the app's import graph is still charged to itself.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    totals: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue
+        package = name.strip().split(".", 1)[0]
+        totals[package] = totals.get(package, 0.0) + int(self_us) / 1_000_000
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+@app.command("bench-startup")
+def bench_startup(
+    runs: int = typer.Option(5, min=1, help="Fresh interpreters per target"),
+    top: int = typer.Option(5, min=0, help="Slowest packages to list per target"),
+    max_seconds: float | None = typer.Option(
+        None, help="Fail when a target's median import time exceeds this budget"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print results as JSON"),
+) -> None:
+    """Measure cold-start import time of the API app and the Celery worker."""
+
+    results = {}
+    for target, code in STARTUP_TARGETS.items():
+        samples = [_import_seconds(code) for _ in range(runs)]
+        results[target] = {
+            "median_seconds": round(statistics.median(samples), 4),
+            "min_seconds": round(min(samples), 4),
+            "max_seconds": round(max(samples), 4),
+            "slowest_imports": {name: round(seconds, 4) for name, seconds in _slowest_imports(code, top)},
+        }
+
+    if as_json:
+        typer.echo(json.dumps(results, indent=2))
+    else:
+        for target, result in results.items():
+            typer.echo(
+                f"{target}: median {result['median_seconds']:.3f}s "
+                f"(min {result['min_seconds']:.3f}s, max {result['max_seconds']:.3f}s)"
+            )
+            for name, seconds in result["slowest_imports"].items():
+                typer.echo(f"  {name:<24} {seconds:.3f}s")
+
+    over_budget = [
+        target for target, result in results.items()
+        if max_seconds is not None and result["median_seconds"] > max_seconds
+    ]
+    if over_budget:
+        typer.echo(f"Startup budget of {max_seconds}s exceeded by: {', '.join(over_budget)}", err=True)
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -27,9 +27,60 @@ class Settings(BaseSettings):
     database_url: str
     postgres_schema: str = Field(default="product_app")
 
+    # Optional read replica for GET traffic; clients that just wrote are pinned to the
+    # primary for read_replica_pin_seconds to avoid reading stale data.
+    database_read_url: str | None = Field(default=None)
+    read_replica_pin_seconds: int = Field(default=10)
+
+    # Connection pools are per process. Prefork worker children run one task at a time
+    # and get their own, smaller pools. With db_pgbouncer (PgBouncer in transaction
+    # mode) client-side pooling and prepared statements are disabled.
+    db_pool_size: int = Field(default=5)
+    db_max_overflow: int = Field(default=10)
+    db_pool_recycle_seconds: int = Field(default=1800)
+    db_pool_timeout_seconds: float = Field(default=30.0)
+    worker_db_pool_size: int = Field(default=2)
+    worker_db_max_overflow: int = Field(default=2)
+    db_pgbouncer: bool = Field(default=False)
+
     redis_url: str = Field(default="redis://localhost:6379/0")
     celery_broker_url: str | None = None
     celery_result_backend: str | None = None
+    redis_socket_timeout: float = Field(default=0.5)
+
+    # Product read caching
+    product_count_cache_ttl_seconds: int = Field(default=300)
+    product_cache_ttl_seconds: int = Field(default=300)
+    product_export_batch_size: int = Field(default=5000)
+
+    # Upload admission control: POST /uploads/ answers 429 with Retry-After while any
+    # limit is reached (0 disables that check). Signals are cached per process.
+    admission_max_active_uploads: int = Field(default=20)
+    admission_max_queue_depth: int = Field(default=1000)
+    admission_max_db_latency_ms: float = Field(default=500.0)
+    admission_retry_after_seconds: int = Field(default=30)
+    admission_cache_seconds: float = Field(default=2.0)
+    admission_stale_job_seconds: int = Field(default=21600)
+
+    # Background bulk delete
+    bulk_delete_batch_size: int = Field(default=5000)
+    bulk_delete_throttle_ms: int = Field(default=50)
+    bulk_delete_lock_timeout_ms: int = Field(default=2000)
+
+    # Catalog facets: how often writers' deltas are folded into the summary, and the
+    # drift-correcting full recount
+    facet_fold_interval_seconds: int = Field(default=10)
+    facet_rebuild_interval_seconds: int = Field(default=3600)
+
+    # Metrics: Celery queues whose depth is reported, and the port worker pools serve
+    # /metrics on (0 disables the worker exporter).
+    metrics_celery_queues: str = Field(default="celery")
+    worker_metrics_port: int = Field(default=9808)
+
+    # Admin endpoints and opt-in profiling are disabled unless admin_token is set.
+    # Profiled requests and ingestion jobs sample every thread's stack at this interval.
+    admin_token: str | None = Field(default=None)
+    profiling_interval_ms: float = Field(default=5.0)
 
     # Storage configuration
     storage_backend: str = Field(default="s3")  # "local" or "s3"
@@ -45,6 +96,47 @@ class Settings(BaseSettings):
     
     webhook_request_timeout: float = Field(default=5.0)
     webhook_max_retries: int = Field(default=3)
+    # Deliveries in flight per event, and the shared connection pool's size.
+    webhook_dispatch_concurrency: int = Field(default=20)
+    webhook_max_connections: int = Field(default=100)
+    webhook_max_keepalive_connections: int = Field(default=20)
+    # Upper bound on how long a process serves webhook subscriptions from memory if
+    # it misses an invalidation message.
+    webhook_subscription_ttl_seconds: int = Field(default=60)
+    # Failed deliveries are retried individually with exponential backoff and jitter,
+    # up to webhook_max_retries times.
+    webhook_retry_base_seconds: float = Field(default=30.0)
+    webhook_retry_max_backoff_seconds: float = Field(default=3600.0)
+    webhook_retry_batch_size: int = Field(default=100)
+    webhook_retry_sweep_interval_seconds: int = Field(default=15)
+    # How long a sweep may hold claimed retries while delivering them before another
+    # sweep may pick them up again.
+    webhook_retry_lease_seconds: float = Field(default=300.0)
+    # Circuit breaker: open after this many consecutive failures, probe again after
+    # the cooldown. Token bucket per webhook (rate 0 disables rate limiting).
+    webhook_breaker_failure_threshold: int = Field(default=5)
+    webhook_breaker_cooldown_seconds: float = Field(default=30.0)
+    webhook_rate_limit_per_second: float = Field(default=10.0)
+    webhook_rate_limit_burst: int = Field(default=20)
+    # Delivery logs: "full" keeps payloads inline, "compressed" zlib-compresses them,
+    # "reference" stores each distinct payload once. Logs live in daily partitions
+    # that are dropped after webhook_log_retention_days.
+    webhook_log_payload_mode: str = Field(default="full")
+    webhook_log_retention_days: int = Field(default=30)
+    webhook_log_partitions_ahead: int = Field(default=3)
+    webhook_log_maintenance_interval_seconds: int = Field(default=3600)
+    # Per-minute latency rollups behind the webhook stats endpoints.
+    webhook_stats_retention_days: int = Field(default=30)
+
+    # Domain events are relayed from the outbox every interval. Consecutive per-product
+    # events of one type are merged into deliveries of up to event_coalesce_max_items
+    # items emitted within event_coalesce_window_seconds; 1 turns merging off. Import
+    # events carry at most import_event_max_skus SKUs.
+    outbox_relay_interval_seconds: float = Field(default=1.0)
+    outbox_relay_batch_size: int = Field(default=1000)
+    event_coalesce_max_items: int = Field(default=50)
+    event_coalesce_window_seconds: float = Field(default=5.0)
+    import_event_max_skus: int = Field(default=2000)
 
     class Config:
         env_file = ".env"
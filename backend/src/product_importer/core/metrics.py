@@ -0,0 +1,214 @@
+"""Prometheus metrics shared by the API and the Celery workers.
+
+``prometheus_client`` is optional (the ``metrics`` extra). Without it every metric
+below is a no-op and ``/metrics`` answers 503.
+
+Prefork Celery workers and multi-process API servers keep separate counters per
+process. Set ``PROMETHEUS_MULTIPROC_DIR`` (one directory per service, writable and
+empty at start) so each process writes its samples there and the exposition merges
+them; worker pools expose the merged view from the parent process on
+``worker_metrics_port``.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import redis
+from fastapi import Request, Response
+from loguru import logger
+
+from product_importer.core.config import get_settings
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+    from prometheus_client.core import GaugeMetricFamily
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+settings = get_settings()
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+class _NoopMetric:
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+
+def _metric(kind: str, name: str, documentation: str, labelnames: tuple[str, ...] = (), **kwargs):
+    if prometheus_client is None:
+        return _NoopMetric()
+    return getattr(prometheus_client, kind)(name, documentation, labelnames, **kwargs)
+
+
+HTTP_REQUEST_SECONDS = _metric(
+    "Histogram",
+    "http_request_duration_seconds",
+    "API request latency by route template",
+    ("method", "route", "status"),
+)
+DB_POOL_CHECKOUTS = _metric("Counter", "db_pool_checkouts_total", "Connections checked out", ("pool",))
+DB_POOL_WAIT_SECONDS = _metric(
+    "Histogram",
+    "db_pool_checkout_wait_seconds",
+    "Time spent obtaining a connection from the pool",
+    ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_POOL_IN_USE = _metric(
+    "Gauge",
+    "db_pool_connections_in_use",
+    "Connections currently checked out",
+    ("pool",),
+    multiprocess_mode="livesum",
+)
+INGESTION_ROWS = _metric("Counter", "ingestion_rows_total", "CSV rows upserted by ingestion")
+INGESTION_BATCH_SECONDS = _metric(
+    "Histogram",
+    "ingestion_batch_duration_seconds",
+    "Time to normalize, upsert and commit one ingestion batch",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+WEBHOOK_DELIVERY_SECONDS = _metric(
+    "Histogram",
+    "webhook_delivery_duration_seconds",
+    "Webhook delivery latency",
+    ("status",),
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+WEBHOOK_HELD_BACK = _metric(
+    "Counter",
+    "webhook_deliveries_held_back_total",
+    "Deliveries postponed by a circuit breaker or rate limit",
+    ("reason",),
+)
+
+
+def celery_queue_lengths() -> dict[str, int]:
+    """Messages waiting per Celery queue listed in ``metrics_celery_queues`` (Redis brokers only)."""
+
+    broker_url = settings.celery_broker_url or settings.redis_url
+    if not broker_url.startswith(("redis://", "rediss://")):
+        return {}
+    client = _broker_client(broker_url)
+    queues = [name.strip() for name in settings.metrics_celery_queues.split(",") if name.strip()]
+    pipe = client.pipeline(transaction=False)
+    for queue in queues:
+        pipe.llen(queue)
+    return dict(zip(queues, pipe.execute()))
+
+
+@lru_cache
+def _broker_client(url: str) -> redis.Redis:
+    return redis.Redis.from_url(
+        url,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_timeout,
+    )
+
+
+class _QueueDepthCollector:
+    """Reads Celery queue lengths from the broker at scrape time."""
+
+    def describe(self):
+        # Keeps registration from querying the broker.
+        return []
+
+    def collect(self):
+        family = GaugeMetricFamily("celery_queue_length", "Messages waiting in a Celery queue", labels=["queue"])
+        try:
+            lengths = celery_queue_lengths()
+        except redis.RedisError as exc:
+            logger.warning("Could not read Celery queue lengths: {}", exc)
+            lengths = {}
+        for queue, length in lengths.items():
+            family.add_metric([queue], length)
+        yield family
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+@lru_cache
+def _exposition_registry():
+    if multiprocess_enabled():
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    registry.register(_QueueDepthCollector())
+    return registry
+
+
+def render_latest() -> tuple[bytes, str] | None:
+    """Current metrics in the Prometheus text format, or None when unavailable."""
+
+    if prometheus_client is None:
+        return None
+    return prometheus_client.generate_latest(_exposition_registry()), prometheus_client.CONTENT_TYPE_LATEST
+
+
+async def track_request_metrics(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Record request latency labelled by route template rather than raw path."""
+
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.labels(
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status),
+        ).observe(time.perf_counter() - started)
+
+
+def start_worker_exporter() -> None:
+    """Serve merged worker metrics from the pool's parent process.
+
+    Called before the pool forks; stale sample files from a previous run are
+    removed so restarted counters start from zero. This process's own files are
+    kept: its metrics were created on import and write to them.
+    """
+
+    if prometheus_client is None or not settings.worker_metrics_port:
+        return
+    if not multiprocess_enabled():
+        logger.warning("{} is not set; prefork worker metrics will be incomplete", MULTIPROC_DIR_ENV)
+    else:
+        directory = Path(os.environ[MULTIPROC_DIR_ENV])
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in directory.glob("*.db"):
+            if not stale.stem.endswith(f"_{os.getpid()}"):
+                stale.unlink(missing_ok=True)
+    prometheus_client.start_http_server(settings.worker_metrics_port, registry=_exposition_registry())
+    logger.info("Worker metrics exposed on port {}", settings.worker_metrics_port)
+
+
+def mark_process_dead(pid: int) -> None:
+    if prometheus_client is not None and multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,141 @@
+"""Opt-in sampling profiler for ingestion jobs and API requests.
+
+Profiling is off unless ``admin_token`` is configured, and even then only runs for
+requests that carry ``X-Profile: 1`` with a valid ``X-Admin-Token`` (or uploads
+posted with ``profile=true``). Unprofiled requests pay for one header lookup.
+"""
+
+from __future__ import annotations
+
+import hmac
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Iterable
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from product_importer.core.config import get_settings
+
+settings = get_settings()
+
+ADMIN_TOKEN_HEADER = "x-admin-token"
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "x-profile-id"
+
+
+def admin_token_valid(token: str | None) -> bool:
+    if not settings.admin_token or not token:
+        return False
+    return hmac.compare_digest(token.encode(), settings.admin_token.encode())
+
+
+class SamplingProfiler:
+    """Samples the stacks of every thread in the process from a background thread.
+
+    Stacks are aggregated in collapsed format (``thread;outer;...;inner count``), which
+    flame graph tools read directly. Each stack starts with the thread name, so work
+    moved onto a threadpool stays distinguishable from the event loop.
+    """
+
+    def __init__(self, interval_ms: float | None = None) -> None:
+        self.interval = (interval_ms or settings.profiling_interval_ms) / 1000
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                frames: list[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    location = f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}"
+                    frames.append(f"{code.co_qualname} ({location})")
+                    frame = frame.f_back
+                frames.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(frames))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> bytes:
+        lines = (f"{stack} {count}" for stack, count in self.stacks.most_common())
+        return ("\n".join(lines) + "\n").encode()
+
+
+def _header(headers: Iterable[tuple[bytes, bytes]], name: bytes) -> str | None:
+    for key, value in headers:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class ProfilingMiddleware:
+    """Profile requests sent with ``X-Profile: 1`` by an admin.
+
+    The artifact is stored after the response has been sent; its id is returned in
+    ``X-Profile-Id`` for download through ``/admin/profiles``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = scope["headers"]
+        requested = _header(headers, PROFILE_HEADER.encode()) in ("1", "true")
+        if not requested or not admin_token_valid(_header(headers, ADMIN_TOKEN_HEADER.encode())):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4()
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                header = (PROFILE_ID_HEADER.encode(), str(profile_id).encode())
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        profiler = SamplingProfiler().start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.stop()
+            # Imported here so unprofiled processes never load the storage backends.
+            from product_importer.models.profile import ProfileKind
+            from product_importer.services.profile_service import store_profile
+
+            subject = f"{scope['method']} {scope['path']}"
+            await run_in_threadpool(
+                store_profile, ProfileKind.REQUEST, subject, profiler, profile_id=profile_id
+            )
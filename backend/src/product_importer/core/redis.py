@@ -0,0 +1,30 @@
+"""Shared Redis client used for caching and coordination."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import redis
+import redis.asyncio
+
+from product_importer.core.config import get_settings
+
+
+@lru_cache
+def get_redis() -> redis.Redis:
+    settings = get_settings()
+    return redis.Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_timeout,
+    )
+
+
+@lru_cache
+def get_async_redis() -> redis.asyncio.Redis:
+    settings = get_settings()
+    return redis.asyncio.Redis.from_url(
+        settings.redis_url,
+        socket_timeout=settings.redis_socket_timeout,
+        socket_connect_timeout=settings.redis_socket_timeout,
+    )
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from product_importer.db.session import SessionLocal
+from product_importer.db.routing import use_replica
+from product_importer.db.session import (
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    SessionLocal,
+)
 
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
+def get_db(request: Request) -> Generator[Session, None, None]:
+    db = ReadSessionLocal() if use_replica(request) else SessionLocal()
     try:
         yield db
         db.commit()
@@ -19,3 +27,15 @@ def get_db() -> Generator[Session, None, None]:
         raise
     finally:
         db.close()
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    db = AsyncReadSessionLocal() if use_replica(request) else AsyncSessionLocal()
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        await db.close()
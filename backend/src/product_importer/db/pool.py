@@ -0,0 +1,47 @@
+"""Connection pools that report checkout metrics."""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from product_importer.core.metrics import DB_POOL_CHECKOUTS, DB_POOL_IN_USE, DB_POOL_WAIT_SECONDS
+
+
+def _pool_name(pool) -> str:
+    return getattr(pool, "logging_name", None) or "default"
+
+
+class _MeteredPool:
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.labels(pool=_pool_name(self)).observe(time.perf_counter() - started)
+
+
+class MeteredQueuePool(_MeteredPool, QueuePool):
+    """``QueuePool`` that records how long each checkout waited."""
+
+
+class MeteredAsyncQueuePool(_MeteredPool, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records how long each checkout waited."""
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count checkouts and track connections in use, labelled by the pool's logging name."""
+
+    name = _pool_name(engine.pool)
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        DB_POOL_CHECKOUTS.labels(pool=name).inc()
+        DB_POOL_IN_USE.labels(pool=name).inc()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record) -> None:
+        DB_POOL_IN_USE.labels(pool=name).dec()
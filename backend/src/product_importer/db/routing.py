@@ -0,0 +1,58 @@
+"""Primary/replica routing for request-scoped database sessions."""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from product_importer.core.config import get_settings
+
+settings = get_settings()
+
+PRIMARY_PIN_COOKIE = "primary_pin"
+PRIMARY_PIN_HEADER = "x-read-primary"
+# Returned on writes with the pin window; cross-origin clients, whose requests carry
+# no cookies, send PRIMARY_PIN_HEADER for that long instead.
+PRIMARY_PIN_RESPONSE_HEADER = "x-primary-pin-seconds"
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def use_replica(request: Request) -> bool:
+    """Whether this request may read from the replica.
+
+    Writes always use the primary, and so does a client that wrote within the pin
+    window (tracked by a short-lived cookie) or that asks for it explicitly.
+    """
+
+    if not settings.database_read_url or request.method not in READ_METHODS:
+        return False
+    if PRIMARY_PIN_COOKIE in request.cookies:
+        return False
+    return request.headers.get(PRIMARY_PIN_HEADER, "").lower() not in ("1", "true")
+
+
+async def pin_writers_to_primary(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Mark clients that just wrote so their next reads avoid replica lag.
+
+    Same-origin clients get a pin cookie; cross-origin ones are told the pin window in
+    a header and echo ``X-Read-Primary`` until it ends.
+    """
+
+    response = await call_next(request)
+    if (
+        settings.database_read_url
+        and request.method not in READ_METHODS
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            PRIMARY_PIN_COOKIE,
+            "1",
+            max_age=settings.read_replica_pin_seconds,
+            httponly=True,
+            samesite="lax",
+        )
+        response.headers[PRIMARY_PIN_RESPONSE_HEADER] = str(settings.read_replica_pin_seconds)
+    return response
@@ -2,26 +2,211 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Callable
 
-from sqlalchemy import MetaData, create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from loguru import logger
+from sqlalchemy import MetaData, create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from product_importer.core.config import get_settings
+from product_importer.db.pool import MeteredAsyncQueuePool, MeteredQueuePool, instrument_engine
 
 settings = get_settings()
 
-db_engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=db_engine, autocommit=False, autoflush=False)
+
+def _async_database_url(url: str) -> str:
+    """Point a Postgres URL at psycopg 3, whose async mode backs the API engine."""
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+psycopg")
+    return parsed.render_as_string(hide_password=False)
+
+
+def _engine_options(url: str, pool_class: type) -> dict:
+    """Pool arguments shared by every engine, honouring per-process overrides."""
+
+    if settings.db_pgbouncer:
+        # PgBouncer in transaction mode already pools server connections and may hand
+        # each transaction to a different backend, so keep no client-side pool and
+        # disable psycopg 3's server-side prepared statements (other drivers make none).
+        options = {"poolclass": NullPool}
+        if make_url(url).get_driver_name() == "psycopg":
+            options["connect_args"] = {"prepare_threshold": None}
+        return options
+    return {
+        "poolclass": pool_class,
+        "pool_pre_ping": True,
+        "pool_size": _pool_overrides.get("pool_size", settings.db_pool_size),
+        "max_overflow": _pool_overrides.get("max_overflow", settings.db_max_overflow),
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+    }
+
+
+# Engines are created on first use so importing the app (API, worker, CLI, tests)
+# loads no database driver and opens no connections.
+_pool_overrides: dict[str, int] = {}
+_engines: list[Engine] = []
+
+
+@lru_cache
+def get_engine(*, read_only: bool = False) -> Engine:
+    """The sync engine, or the replica's when ``read_only`` and one is configured."""
+
+    if read_only and not settings.database_read_url:
+        return get_engine()
+    url = settings.database_read_url if read_only else settings.database_url
+    engine = create_engine(
+        url,
+        pool_logging_name="replica" if read_only else "primary",
+        **_engine_options(url, MeteredQueuePool),
+    )
+    instrument_engine(engine)
+    _engines.append(engine)
+    return engine
+
+
+@lru_cache
+def get_async_engine(*, read_only: bool = False) -> AsyncEngine:
+    """The async engine, or the replica's when ``read_only`` and one is configured."""
+
+    if read_only and not settings.database_read_url:
+        return get_async_engine()
+    url = _async_database_url(settings.database_read_url if read_only else settings.database_url)
+    engine = create_async_engine(
+        url,
+        pool_logging_name="async_replica" if read_only else "async_primary",
+        **_engine_options(url, MeteredAsyncQueuePool),
+    )
+    instrument_engine(engine.sync_engine)
+    _engines.append(engine.sync_engine)
+    return engine
+
+
+def reset_engines(*, pool_size: int | None = None, max_overflow: int | None = None) -> None:
+    """Forget engines inherited from a parent process and size pools for this one.
+
+    Meant for forked children (Celery's ``worker_process_init``): inherited pools are
+    dropped with ``close=False`` so the parent's sockets are left alone, and engines
+    are rebuilt lazily on next use with the given pool size.
+    """
+
+    for engine in _engines:
+        engine.dispose(close=False)
+    _engines.clear()
+    get_engine.cache_clear()
+    get_async_engine.cache_clear()
+    for factory in (SessionLocal, AsyncSessionLocal, ReadSessionLocal, AsyncReadSessionLocal):
+        factory.reset()
+    _pool_overrides.clear()
+    if pool_size is not None:
+        _pool_overrides["pool_size"] = pool_size
+    if max_overflow is not None:
+        _pool_overrides["max_overflow"] = max_overflow
+
+
+class DeferredCallbackAsyncSession(AsyncSession):
+    """AsyncSession whose after-commit callbacks run in a worker thread.
+
+    Callbacks are blocking client calls (Redis, the Celery broker). Run from the sync
+    session's commit they would stall the event loop, so they are collected there and
+    awaited in a thread once ``commit()`` returns.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sync_session.info[_DEFER_AFTER_COMMIT_KEY] = True
+
+    async def commit(self) -> None:
+        await super().commit()
+        callbacks = self.sync_session.info.pop(_COMMITTED_CALLBACKS_KEY, None)
+        if callbacks:
+            await asyncio.to_thread(_run_callbacks, callbacks)
+
+
+class _LazySessionmaker:
+    """Session factory that binds to its engine on the first session it creates."""
+
+    def __init__(
+        self,
+        maker: type[sessionmaker] | type[async_sessionmaker],
+        engine_factory,
+        *,
+        replica: bool = False,
+        **options,
+    ):
+        self._maker = maker
+        self._engine_factory = engine_factory
+        self._replica = replica
+        self._options = options
+        self._factory = None
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        self._factory = None
+
+    def __call__(self, **kwargs):
+        if self._factory is None:
+            with self._lock:
+                if self._factory is None:
+                    # Replica sessions are tagged so callers can tell their reads may lag.
+                    info = {_REPLICA_KEY: self._replica and bool(settings.database_read_url)}
+                    self._factory = self._maker(bind=self._engine_factory(), info=info, **self._options)
+        return self._factory(**kwargs)
+
+
+SessionLocal = _LazySessionmaker(sessionmaker, get_engine, autocommit=False, autoflush=False)
+AsyncSessionLocal = _LazySessionmaker(
+    async_sessionmaker,
+    get_async_engine,
+    class_=DeferredCallbackAsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+# Read-only traffic goes to the replica when one is configured, else to the primary.
+ReadSessionLocal = _LazySessionmaker(
+    sessionmaker, partial(get_engine, read_only=True), replica=True, autocommit=False, autoflush=False
+)
+AsyncReadSessionLocal = _LazySessionmaker(
+    async_sessionmaker,
+    partial(get_async_engine, read_only=True),
+    replica=True,
+    class_=DeferredCallbackAsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 metadata = MetaData(schema=settings.postgres_schema)
 Base = declarative_base(metadata=metadata)
 
+_REPLICA_KEY = "replica"
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+_DEFER_AFTER_COMMIT_KEY = "defer_after_commit_callbacks"
+_COMMITTED_CALLBACKS_KEY = "committed_callbacks"
+
+
+def is_replica_session(session: Session | AsyncSession) -> bool:
+    """Whether ``session`` reads from the replica, and so may see stale data."""
+
+    return session.info.get(_REPLICA_KEY, False)
+
 
 @contextmanager
-def db_session():
-    """Provide a transactional scope around a series of operations."""
+def db_session(*, read_only: bool = False):
+    """Provide a transactional scope around a series of operations.
 
-    session = SessionLocal()
+    ``read_only`` scopes use the read replica when one is configured.
+    """
+
+    session = ReadSessionLocal() if read_only else SessionLocal()
     try:
         yield session
         session.commit()
@@ -30,3 +215,37 @@ def db_session():
         raise
     finally:
         session.close()
+
+
+def run_after_commit(session: Session, callback: Callable[[], None], *, key: str | None = None) -> None:
+    """Run ``callback`` once the session's current transaction commits.
+
+    Callbacks registered under the same ``key`` are only run once per transaction and
+    are discarded if the transaction rolls back. On sessions owned by a
+    ``DeferredCallbackAsyncSession`` they run in a worker thread after the commit.
+    """
+
+    callbacks: dict = session.info.setdefault(_AFTER_COMMIT_KEY, {})
+    callbacks[key or id(callback)] = callback
+
+
+def _run_callbacks(callbacks: dict) -> None:
+    for callback in callbacks.values():
+        try:
+            callback()
+        except Exception:  # noqa: BLE001
+            logger.exception("After-commit callback failed")
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    callbacks = session.info.pop(_AFTER_COMMIT_KEY, {})
+    if callbacks and session.info.get(_DEFER_AFTER_COMMIT_KEY):
+        session.info.setdefault(_COMMITTED_CALLBACKS_KEY, {}).update(callbacks)
+        return
+    _run_callbacks(callbacks)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
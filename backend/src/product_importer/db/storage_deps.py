@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from product_importer.core.config import get_settings
-from product_importer.services.s3_storage import S3Storage
-from product_importer.services.storage import FileStorage
+from product_importer.services.storage import FileStorage, StorageBackend
 
 settings = get_settings()
 
 
-def get_storage() -> FileStorage | S3Storage:
-    """Get the configured storage backend."""
+@lru_cache
+def get_storage() -> StorageBackend:
+    """Get the configured storage backend.
+
+    Built on first use and shared afterwards, so boto3 is only imported (and the bucket
+    only checked) by processes that actually touch storage.
+    """
     if settings.storage_backend == "s3":
         if not settings.s3_bucket_name:
             raise ValueError("S3_BUCKET_NAME must be set when using S3 storage backend")
-        
+
+        from product_importer.services.s3_storage import S3Storage
+
         return S3Storage(
             bucket_name=settings.s3_bucket_name,
             endpoint_url=settings.s3_endpoint_url,
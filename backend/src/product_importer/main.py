@@ -6,66 +6,24 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import text
 
 from product_importer.api.routes import router as api_router
 from product_importer.core.config import get_settings
-from product_importer.db.session import Base, db_engine
+from product_importer.core.metrics import track_request_metrics
+from product_importer.core.profiling import ProfilingMiddleware
+from product_importer.core.serialization import JSON_RESPONSE_CLASS
+from product_importer.db.routing import PRIMARY_PIN_RESPONSE_HEADER, pin_writers_to_primary
+from product_importer.services.admission import UploadAdmissionMiddleware
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=settings.app_name, default_response_class=JSON_RESPONSE_CLASS)
 
-
-def _init_database() -> None:
-    """Initialize database schema and tables."""
-    try:
-        logger.info("Starting database initialization...")
-        logger.info(f"Database URL: {settings.database_url.split('@')[-1]}")  # Log without credentials
-        
-        schema_name = settings.postgres_schema
-        logger.info(f"Creating schema: {schema_name}")
-        
-        # Test connection first
-        with db_engine.connect() as conn:
-            result = conn.execute(text("SELECT version()"))
-            version = result.scalar()
-            logger.info(f"Connected to database: {version}")
-        
-        # Create extension and schema
-        with db_engine.begin() as conn:
-            conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
-            logger.info("Created citext extension")
-            
-            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema_name}"))
-            logger.info(f"Created schema: {schema_name}")
-        
-        # Create all tables
-        logger.info("Creating database tables...")
-        Base.metadata.create_all(bind=db_engine)
-        
-        # Verify tables were created
-        with db_engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    f"SELECT table_name FROM information_schema.tables "
-                    f"WHERE table_schema = '{schema_name}'"
-                )
-            )
-            tables = [row[0] for row in result]
-            logger.info(f"Created tables in schema '{schema_name}': {tables}")
-            
-        logger.info("Database initialization completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}", exc_info=True)
-        raise
-
-
-_init_database()
+# Added first so it runs innermost, with CORS headers still applied to its 429s.
+app.add_middleware(UploadAdmissionMiddleware)
 
 allowed_origins = settings.allowed_origins_list
 if allowed_origins:
@@ -75,8 +33,14 @@ if allowed_origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[PRIMARY_PIN_RESPONSE_HEADER],
     )
 
+app.middleware("http")(pin_writers_to_primary)
+app.middleware("http")(track_request_metrics)
+if settings.admin_token:
+    app.add_middleware(ProfilingMiddleware)
+
 app.include_router(api_router)
 
 
@@ -0,0 +1 @@
+"""Alembic migrations for the product importer schema."""
@@ -0,0 +1,48 @@
+"""Alembic environment wired to the application settings and models."""
+
+from __future__ import annotations
+
+from alembic import context
+from sqlalchemy import create_engine, pool, text
+
+from product_importer import models  # noqa: F401  (registers tables on the metadata)
+from product_importer.core.config import get_settings
+from product_importer.db.session import Base
+
+settings = get_settings()
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=settings.database_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        include_schemas=True,
+        version_table_schema=settings.postgres_schema,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    engine = create_engine(settings.database_url, poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        # The version table lives in the app schema, so it has to exist up front.
+        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {settings.postgres_schema}"))
+        connection.commit()
+
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_schemas=True,
+            version_table_schema=settings.postgres_schema,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,139 @@
+"""Baseline schema.
+
+Mirrors the tables that ``Base.metadata.create_all`` has been creating so far. Each
+table is only created when missing, so databases bootstrapped by the app upgrade
+cleanly.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+from product_importer.core.config import get_settings
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+# Products are pinned to this schema by the model regardless of configuration.
+PRODUCT_SCHEMA = "product_app"
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def _missing(table: str, schema: str) -> bool:
+    if context.is_offline_mode():
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table, schema=schema)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}")
+    op.execute(f"CREATE SCHEMA IF NOT EXISTS {PRODUCT_SCHEMA}")
+
+    if _missing("products", PRODUCT_SCHEMA):
+        op.create_table(
+            "products",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("sku", postgresql.CITEXT(), nullable=False, unique=True),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("description", sa.Text()),
+            sa.Column("price", sa.Numeric(12, 2), nullable=False),
+            sa.Column("currency", sa.String(3)),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            *_timestamps(),
+            schema=PRODUCT_SCHEMA,
+        )
+
+    if _missing("upload_jobs", SCHEMA):
+        op.create_table(
+            "upload_jobs",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("filename", sa.String(255), nullable=False),
+            sa.Column("storage_path", sa.String(512), nullable=False),
+            sa.Column("total_rows", sa.Integer()),
+            sa.Column("processed_rows", sa.Integer()),
+            sa.Column("status", sa.String(32), nullable=False),
+            sa.Column("error", sa.String(1024)),
+            *_timestamps(),
+            schema=SCHEMA,
+        )
+
+    if _missing("webhooks", SCHEMA):
+        op.create_table(
+            "webhooks",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("name", sa.String(120), nullable=False),
+            sa.Column("target_url", sa.String(512), nullable=False),
+            sa.Column("event", sa.String(64), nullable=False),
+            sa.Column("headers", sa.JSON()),
+            sa.Column("is_enabled", sa.Boolean()),
+            *_timestamps(),
+            schema=SCHEMA,
+        )
+
+    if _missing("webhook_delivery_logs", SCHEMA):
+        op.create_table(
+            "webhook_delivery_logs",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "webhook_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey(f"{PRODUCT_SCHEMA}.webhooks.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("event", sa.String(64), nullable=False),
+            sa.Column("payload", sa.JSON(), nullable=False),
+            sa.Column("response_code", sa.Integer()),
+            sa.Column("response_time_ms", sa.Integer()),
+            sa.Column("response_body", sa.Text()),
+            sa.Column("status", sa.String(16), nullable=False),
+            *_timestamps(),
+            schema=SCHEMA,
+        )
+
+    if _missing("product_delete_jobs", SCHEMA):
+        op.create_table(
+            "product_delete_jobs",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("strategy", sa.String(16)),
+            sa.Column("total_rows", sa.Integer()),
+            sa.Column("deleted_rows", sa.Integer()),
+            sa.Column("status", sa.String(32), nullable=False),
+            sa.Column("error", sa.String(1024)),
+            *_timestamps(),
+            schema=SCHEMA,
+        )
+
+    if _missing("catalog_facets", SCHEMA):
+        op.create_table(
+            "catalog_facets",
+            sa.Column("facet", sa.String(32), primary_key=True),
+            sa.Column("bucket", sa.String(64), primary_key=True),
+            sa.Column("count", sa.BigInteger(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            schema=SCHEMA,
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_facets", schema=SCHEMA)
+    op.drop_table("product_delete_jobs", schema=SCHEMA)
+    op.drop_table("webhook_delivery_logs", schema=SCHEMA)
+    op.drop_table("webhooks", schema=SCHEMA)
+    op.drop_table("upload_jobs", schema=SCHEMA)
+    op.drop_table("products", schema=PRODUCT_SCHEMA)
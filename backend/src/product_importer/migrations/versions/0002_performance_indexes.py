@@ -0,0 +1,82 @@
+"""Indexes for the hot listing and lookup paths.
+
+Built with CREATE INDEX CONCURRENTLY outside a transaction so they can be applied to
+a live, large table without blocking writes. A previous interrupted build leaves an
+INVALID index behind; it is dropped and rebuilt rather than skipped.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from product_importer.core.config import get_settings
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+PRODUCT_SCHEMA = "product_app"
+
+INDEXES = (
+    # Default listing order.
+    ("ix_products_created_at", "products", PRODUCT_SCHEMA, ["created_at"]),
+    # is_active filter combined with the default order.
+    ("ix_products_is_active_created_at", "products", PRODUCT_SCHEMA, ["is_active", "created_at"]),
+    ("ix_upload_jobs_created_at", "upload_jobs", SCHEMA, ["created_at"]),
+    (
+        "ix_webhook_delivery_logs_webhook_id_created_at",
+        "webhook_delivery_logs",
+        SCHEMA,
+        ["webhook_id", "created_at"],
+    ),
+)
+
+
+def _is_invalid(name: str, schema: str) -> bool:
+    if context.is_offline_mode():
+        return False
+    return bool(
+        op.get_bind().scalar(
+            sa.text(
+                "SELECT NOT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relname = :name AND n.nspname = :schema"
+            ),
+            {"name": name, "schema": schema},
+        )
+    )
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, schema, columns in INDEXES:
+            if _is_invalid(name, schema):
+                op.drop_index(name, table_name=table, schema=schema, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, schema, _ in INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
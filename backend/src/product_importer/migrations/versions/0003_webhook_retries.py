@@ -0,0 +1,57 @@
+"""Per-delivery webhook retry queue.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+from product_importer.core.config import get_settings
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+
+
+def _missing(table: str) -> bool:
+    # Tables may already exist on databases bootstrapped by the app's create_all.
+    if context.is_offline_mode():
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table, schema=SCHEMA)
+
+
+def upgrade() -> None:
+    if not _missing("webhook_retries"):
+        return
+    op.create_table(
+        "webhook_retries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "webhook_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("product_app.webhooks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("event", sa.String(64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema=SCHEMA,
+    )
+    op.create_index("ix_webhook_retries_next_attempt_at", "webhook_retries", ["next_attempt_at"], schema=SCHEMA)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhook_retries_next_attempt_at", table_name="webhook_retries", schema=SCHEMA)
+    op.drop_table("webhook_retries", schema=SCHEMA)
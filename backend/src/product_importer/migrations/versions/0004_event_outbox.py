@@ -0,0 +1,44 @@
+"""Transactional outbox for domain events.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from product_importer.core.config import get_settings
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+
+
+def _missing(table: str) -> bool:
+    # Tables may already exist on databases bootstrapped by the app's create_all.
+    if context.is_offline_mode():
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table, schema=SCHEMA)
+
+
+def upgrade() -> None:
+    if not _missing("event_outbox"):
+        return
+    op.create_table(
+        "event_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column("event", sa.String(64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_outbox", schema=SCHEMA)
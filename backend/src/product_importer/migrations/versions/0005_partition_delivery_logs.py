@@ -0,0 +1,191 @@
+"""Partition webhook delivery logs by day and add payload storage options.
+
+The existing table is renamed and a range-partitioned replacement with daily
+partitions covering the retention window takes its place. That swap commits before
+any rows move, so the old table is only locked briefly and new deliveries are logged
+throughout. Logs still inside the retention window are then copied over in batches,
+each committed on its own, and the old table is dropped. Logs older than
+``webhook_log_retention_days`` are not copied: upgrading discards them, as partition
+maintenance would have soon after.
+
+An interrupted copy is resumed by running the upgrade again.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta, timezone
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+from product_importer.core.config import get_settings
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+settings = get_settings()
+SCHEMA = settings.postgres_schema
+TABLE = "webhook_delivery_logs"
+LEGACY = f"{TABLE}_legacy"
+INDEX = "ix_webhook_delivery_logs_webhook_id_created_at"
+COPY_BATCH_SIZE = 10_000
+COLUMNS = (
+    "id, created_at, updated_at, webhook_id, event, payload, "
+    "response_code, response_time_ms, response_body, status"
+)
+
+
+def _day_start(day) -> str:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc).isoformat()
+
+
+def _webhook_id() -> sa.Column:
+    return sa.Column(
+        "webhook_id",
+        postgresql.UUID(as_uuid=True),
+        sa.ForeignKey("product_app.webhooks.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+
+def _already_partitioned() -> bool:
+    # Databases bootstrapped by the app's create_all already have the new layout.
+    if context.is_offline_mode():
+        return False
+    return bool(
+        op.get_bind().scalar(
+            sa.text(
+                "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relname = :table AND n.nspname = :schema"
+            ),
+            {"table": TABLE, "schema": SCHEMA},
+        )
+    )
+
+
+def _has_table(table: str) -> bool:
+    if context.is_offline_mode():
+        return True
+    return sa.inspect(op.get_bind()).has_table(table, schema=SCHEMA)
+
+
+def upgrade() -> None:
+    if not _already_partitioned():
+        _partition_logs()
+    if context.is_offline_mode() or not _has_table("webhook_payloads"):
+        op.create_table(
+            "webhook_payloads",
+            sa.Column("digest", sa.String(64), primary_key=True),
+            sa.Column("payload", sa.JSON(), nullable=False),
+            sa.Column(
+                "last_used_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+            ),
+            schema=SCHEMA,
+        )
+    if _has_table(LEGACY):
+        _copy_legacy_logs()
+
+
+def _retention_start():
+    return datetime.now(timezone.utc).date() - timedelta(days=settings.webhook_log_retention_days)
+
+
+def _partition_logs() -> None:
+    op.rename_table(TABLE, LEGACY, schema=SCHEMA)
+    op.execute(f"ALTER INDEX IF EXISTS {SCHEMA}.{INDEX} RENAME TO {INDEX}_legacy")
+
+    op.create_table(
+        TABLE,
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        _webhook_id(),
+        sa.Column("event", sa.String(64), nullable=False),
+        sa.Column("payload", sa.JSON()),
+        sa.Column("payload_compressed", sa.LargeBinary()),
+        sa.Column("payload_ref", sa.String(64)),
+        sa.Column("response_code", sa.Integer()),
+        sa.Column("response_time_ms", sa.Integer()),
+        sa.Column("response_body", sa.Text()),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        schema=SCHEMA,
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(INDEX, TABLE, ["webhook_id", "created_at"], schema=SCHEMA)
+
+    # No default partition: it would rule out DETACH PARTITION CONCURRENTLY when
+    # expired partitions are dropped.
+    today = datetime.now(timezone.utc).date()
+    day = _retention_start()
+    while day <= today + timedelta(days=settings.webhook_log_partitions_ahead):
+        op.execute(
+            f"CREATE TABLE {SCHEMA}.{TABLE}_p{day:%Y%m%d} PARTITION OF {SCHEMA}.{TABLE} "
+            f"FOR VALUES FROM ('{_day_start(day)}') TO ('{_day_start(day + timedelta(days=1))}')"
+        )
+        day += timedelta(days=1)
+
+
+def _copy_legacy_logs() -> None:
+    retained = f"created_at >= '{_day_start(_retention_start())}'"
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            op.execute(
+                f"INSERT INTO {SCHEMA}.{TABLE} ({COLUMNS}) "
+                f"SELECT {COLUMNS} FROM {SCHEMA}.{LEGACY} WHERE {retained}"
+            )
+        else:
+            # Keyset batches in primary key order; each statement commits on its own.
+            # ON CONFLICT makes re-running after an interruption safe.
+            bind = op.get_bind()
+            last = None
+            while True:
+                last = bind.scalar(
+                    sa.text(
+                        f"WITH batch AS (SELECT {COLUMNS} FROM {SCHEMA}.{LEGACY} "
+                        f"WHERE {retained} AND (CAST(:last AS uuid) IS NULL OR id > CAST(:last AS uuid)) "
+                        "ORDER BY id LIMIT :limit), "
+                        f"copied AS (INSERT INTO {SCHEMA}.{TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM batch "
+                        "ON CONFLICT DO NOTHING) "
+                        "SELECT id FROM batch ORDER BY id DESC LIMIT 1"
+                    ),
+                    {"last": last, "limit": COPY_BATCH_SIZE},
+                )
+                if last is None:
+                    break
+        op.drop_table(LEGACY, schema=SCHEMA)
+
+
+def downgrade() -> None:
+    op.drop_table("webhook_payloads", schema=SCHEMA)
+    op.rename_table(TABLE, LEGACY, schema=SCHEMA)
+    op.execute(f"ALTER INDEX IF EXISTS {SCHEMA}.{INDEX} RENAME TO {INDEX}_legacy")
+    op.create_table(
+        TABLE,
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        _webhook_id(),
+        sa.Column("event", sa.String(64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("response_code", sa.Integer()),
+        sa.Column("response_time_ms", sa.Integer()),
+        sa.Column("response_body", sa.Text()),
+        sa.Column("status", sa.String(16), nullable=False),
+        schema=SCHEMA,
+    )
+    op.create_index(INDEX, TABLE, ["webhook_id", "created_at"], schema=SCHEMA)
+    # Only inline payloads can be restored; compressed and referenced ones are dropped.
+    op.execute(
+        f"INSERT INTO {SCHEMA}.{TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {SCHEMA}.{LEGACY} "
+        "WHERE payload IS NOT NULL"
+    )
+    op.execute(f"DROP TABLE {SCHEMA}.{LEGACY} CASCADE")
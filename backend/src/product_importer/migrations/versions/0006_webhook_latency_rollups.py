@@ -0,0 +1,52 @@
+"""Per-minute webhook latency rollups.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+from product_importer.core.config import get_settings
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+
+
+def _missing(table: str) -> bool:
+    # Tables may already exist on databases bootstrapped by the app's create_all.
+    if context.is_offline_mode():
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table, schema=SCHEMA)
+
+
+def upgrade() -> None:
+    if not _missing("webhook_latency_rollups"):
+        return
+    op.create_table(
+        "webhook_latency_rollups",
+        sa.Column(
+            "webhook_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("product_app.webhooks.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("minute", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("le_ms", sa.Integer(), primary_key=True),
+        sa.Column("deliveries", sa.Integer(), nullable=False),
+        sa.Column("successes", sa.Integer(), nullable=False),
+        sa.Column("total_ms", sa.BigInteger(), nullable=False),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("webhook_latency_rollups", schema=SCHEMA)
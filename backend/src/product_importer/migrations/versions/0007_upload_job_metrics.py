@@ -0,0 +1,38 @@
+"""Ingestion run metrics on upload jobs.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from product_importer.core.config import get_settings
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+
+
+def _has_column(table: str, column: str) -> bool:
+    # The column may already exist on databases bootstrapped by the app's create_all.
+    if context.is_offline_mode():
+        return False
+    columns = sa.inspect(op.get_bind()).get_columns(table, schema=SCHEMA)
+    return any(existing["name"] == column for existing in columns)
+
+
+def upgrade() -> None:
+    if _has_column("upload_jobs", "metrics"):
+        return
+    op.add_column("upload_jobs", sa.Column("metrics", sa.JSON()), schema=SCHEMA)
+
+
+def downgrade() -> None:
+    op.drop_column("upload_jobs", "metrics", schema=SCHEMA)
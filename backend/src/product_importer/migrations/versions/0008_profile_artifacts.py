@@ -0,0 +1,51 @@
+"""Stored profiling artifacts.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+from sqlalchemy.dialects import postgresql
+
+from product_importer.core.config import get_settings
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+
+
+def _missing(table: str) -> bool:
+    # Tables may already exist on databases bootstrapped by the app's create_all.
+    if context.is_offline_mode():
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table, schema=SCHEMA)
+
+
+def upgrade() -> None:
+    if not _missing("profile_artifacts"):
+        return
+    op.create_table(
+        "profile_artifacts",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("kind", sa.String(16), nullable=False),
+        sa.Column("subject", sa.String(255), nullable=False),
+        sa.Column("storage_path", sa.String(512), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema=SCHEMA,
+    )
+    op.create_index("ix_profile_artifacts_created_at", "profile_artifacts", ["created_at"], schema=SCHEMA)
+    op.create_index("ix_profile_artifacts_subject", "profile_artifacts", ["subject"], schema=SCHEMA)
+
+
+def downgrade() -> None:
+    op.drop_table("profile_artifacts", schema=SCHEMA)
@@ -0,0 +1,45 @@
+"""Append-only catalog facet deltas.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from product_importer.core.config import get_settings
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+SCHEMA = get_settings().postgres_schema
+
+
+def _missing(table: str) -> bool:
+    # Tables may already exist on databases bootstrapped by the app's create_all.
+    if context.is_offline_mode():
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table, schema=SCHEMA)
+
+
+def upgrade() -> None:
+    if not _missing("catalog_facet_deltas"):
+        return
+    op.create_table(
+        "catalog_facet_deltas",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column("facet", sa.String(32), nullable=False),
+        sa.Column("bucket", sa.String(64), nullable=False),
+        sa.Column("delta", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_facet_deltas", schema=SCHEMA)
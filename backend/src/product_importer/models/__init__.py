@@ -1,12 +1,26 @@
 """SQLAlchemy models registry."""
 
+from .catalog_facet import CatalogFacet, CatalogFacetDelta
+from .delete_job import DeleteJobStatus, ProductDeleteJob
+from .outbox import OutboxEvent
 from .product import Product
+from .profile import ProfileArtifact, ProfileKind
 from .upload_job import UploadJob
-from .webhook import Webhook, WebhookDelivery
+from .webhook import Webhook, WebhookDelivery, WebhookLatencyRollup, WebhookPayload, WebhookRetry
 
 __all__ = [
+    "CatalogFacet",
+    "CatalogFacetDelta",
+    "DeleteJobStatus",
+    "OutboxEvent",
     "Product",
+    "ProductDeleteJob",
+    "ProfileArtifact",
+    "ProfileKind",
     "UploadJob",
     "Webhook",
     "WebhookDelivery",
+    "WebhookLatencyRollup",
+    "WebhookPayload",
+    "WebhookRetry",
 ]
@@ -0,0 +1,34 @@
+"""Background bulk-delete job tracking."""
+
+from __future__ import annotations
+
+import enum
+
+from sqlalchemy import Enum, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from product_importer.models.base import Base, TimestampMixin, UUIDPrimaryKey
+
+
+class DeleteJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    # Failed, and waiting for Celery to run it again.
+    RETRYING = "retrying"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ProductDeleteJob(UUIDPrimaryKey, TimestampMixin, Base):
+    __tablename__ = "product_delete_jobs"
+
+    strategy: Mapped[str | None] = mapped_column(String(16))
+    total_rows: Mapped[int | None] = mapped_column(Integer)
+    deleted_rows: Mapped[int] = mapped_column(Integer, default=0)
+    status: Mapped[DeleteJobStatus] = mapped_column(
+        Enum(DeleteJobStatus, native_enum=False, length=32), nullable=False
+    )
+    error: Mapped[str | None] = mapped_column(String(1024))
+
+
+ACTIVE_DELETE_JOB_STATUSES = (DeleteJobStatus.QUEUED, DeleteJobStatus.RUNNING, DeleteJobStatus.RETRYING)
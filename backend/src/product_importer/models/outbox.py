@@ -0,0 +1,27 @@
+"""Transactional outbox for domain events."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, BigInteger, DateTime, Identity, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from product_importer.models.base import Base
+
+
+class OutboxEvent(Base):
+    """An event written in the same transaction as the change it describes.
+
+    Rows are relayed to the webhook dispatcher and deleted once the transaction that
+    wrote them has committed, so rolled-back changes never publish anything.
+    """
+
+    __tablename__ = "event_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Numeric, String, Text
+from sqlalchemy import Boolean, Index, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,7 +11,11 @@ from product_importer.models.base import Base, TimestampMixin
 
 class Product(TimestampMixin, Base):
     __tablename__ = "products"
-    __table_args__ = {"schema": "product_app"}
+    __table_args__ = (
+        Index("ix_products_created_at", "created_at"),
+        Index("ix_products_is_active_created_at", "is_active", "created_at"),
+        {"schema": "product_app"},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     sku: Mapped[str] = mapped_column(CITEXT, unique=True, nullable=False)
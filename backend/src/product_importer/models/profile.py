@@ -0,0 +1,34 @@
+"""Stored profiling artifacts."""
+
+from __future__ import annotations
+
+import enum
+
+from sqlalchemy import Enum, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from product_importer.models.base import Base, TimestampMixin, UUIDPrimaryKey
+
+
+class ProfileKind(str, enum.Enum):
+    INGESTION = "ingestion"
+    REQUEST = "request"
+
+
+class ProfileArtifact(UUIDPrimaryKey, TimestampMixin, Base):
+    """A sampled profile whose collapsed stacks live in the storage backend."""
+
+    __tablename__ = "profile_artifacts"
+    __table_args__ = (
+        Index("ix_profile_artifacts_created_at", "created_at"),
+        Index("ix_profile_artifacts_subject", "subject"),
+    )
+
+    kind: Mapped[ProfileKind] = mapped_column(
+        Enum(ProfileKind, native_enum=False, length=16), nullable=False
+    )
+    # Upload job id for ingestion profiles, "METHOD /path" for requests.
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    storage_path: Mapped[str] = mapped_column(String(512), nullable=False)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
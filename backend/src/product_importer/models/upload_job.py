@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import enum
 
-from sqlalchemy import Enum, Integer, String
+from sqlalchemy import JSON, Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from product_importer.models.base import Base, TimestampMixin, UUIDPrimaryKey
@@ -22,6 +22,7 @@ class UploadStatus(str, enum.Enum):
 
 class UploadJob(UUIDPrimaryKey, TimestampMixin, Base):
     __tablename__ = "upload_jobs"
+    __table_args__ = (Index("ix_upload_jobs_created_at", "created_at"),)
 
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     storage_path: Mapped[str] = mapped_column(String(512), nullable=False)
@@ -31,3 +32,15 @@ class UploadJob(UUIDPrimaryKey, TimestampMixin, Base):
         Enum(UploadStatus, native_enum=False, length=32), nullable=False
     )
     error: Mapped[str | None] = mapped_column(String(1024))
+    # Per-stage timings and throughput of the latest ingestion run.
+    metrics: Mapped[dict | None] = mapped_column(JSON)
+
+
+# Statuses of uploads that are still waiting for, or holding, an ingestion worker.
+ACTIVE_UPLOAD_STATUSES = (
+    UploadStatus.RECEIVED,
+    UploadStatus.QUEUED,
+    UploadStatus.PARSING,
+    UploadStatus.VALIDATING,
+    UploadStatus.UPSERTING,
+)
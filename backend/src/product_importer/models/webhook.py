@@ -3,8 +3,21 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Boolean, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -21,15 +34,86 @@ class Webhook(UUIDPrimaryKey, TimestampMixin, Base):
     is_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
 
 
-class WebhookDelivery(UUIDPrimaryKey, TimestampMixin, Base):
+class WebhookDelivery(Base):
+    """One delivery attempt.
+
+    The table is range-partitioned by ``created_at`` (one partition per day) so old
+    logs are removed by dropping partitions; see ``DeliveryLogService``. Depending on
+    ``webhook_log_payload_mode`` the payload is kept inline, zlib-compressed, or as a
+    reference to a de-duplicated ``WebhookPayload`` row.
+    """
+
     __tablename__ = "webhook_delivery_logs"
+    __table_args__ = (
+        Index("ix_webhook_delivery_logs_webhook_id_created_at", "webhook_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Part of the primary key because Postgres requires the partition key in it.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     webhook_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("product_app.webhooks.id", ondelete="CASCADE"), nullable=False
     )
     event: Mapped[str] = mapped_column(String(64), nullable=False)
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    payload: Mapped[dict | None] = mapped_column(JSON)
+    payload_compressed: Mapped[bytes | None] = mapped_column(LargeBinary)
+    payload_ref: Mapped[str | None] = mapped_column(String(64))
     response_code: Mapped[int | None] = mapped_column(Integer)
     response_time_ms: Mapped[int | None] = mapped_column(Integer)
     response_body: Mapped[str | None] = mapped_column(Text)
     status: Mapped[str] = mapped_column(String(16), nullable=False)
+
+
+class WebhookPayload(Base):
+    """A delivered payload stored once and referenced by its SHA-256 digest."""
+
+    __tablename__ = "webhook_payloads"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class WebhookRetry(UUIDPrimaryKey, TimestampMixin, Base):
+    """A failed delivery waiting for its next attempt."""
+
+    __tablename__ = "webhook_retries"
+    __table_args__ = (Index("ix_webhook_retries_next_attempt_at", "next_attempt_at"),)
+
+    webhook_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("product_app.webhooks.id", ondelete="CASCADE"), nullable=False
+    )
+    event: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # Failed attempts so far, including the original delivery.
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text)
+
+
+class WebhookLatencyRollup(Base):
+    """Per-minute delivery counts for one webhook and latency histogram bucket.
+
+    Maintained incrementally as deliveries are logged, so statistics never scan the
+    raw delivery log.
+    """
+
+    __tablename__ = "webhook_latency_rollups"
+
+    webhook_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("product_app.webhooks.id", ondelete="CASCADE"), primary_key=True
+    )
+    minute: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    # Upper bound (inclusive, in ms) of the latency bucket this row counts.
+    le_ms: Mapped[int] = mapped_column(Integer, primary_key=True)
+    deliveries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    successes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,17 @@
+"""Schemas for health and readiness probes."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool
+    degraded: bool
+    accepting_uploads: bool
+    reasons: list[str]
+    active_uploads: int | None
+    queue_depth: int | None
+    db_latency_ms: float | None
+    database_ok: bool
+    broker_ok: bool
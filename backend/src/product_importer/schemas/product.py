@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import enum
 from datetime import datetime
 from typing import List, Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from product_importer.models.delete_job import DeleteJobStatus
+
+
+# Bounds of the products columns: String(255) names, Numeric(12, 2) prices and
+# String(3) currency codes.
+NAME_MAX_LENGTH = 255
+PRICE_LIMIT = 10**10
+CURRENCY_LENGTH = 3
+
 
 class ProductBase(BaseModel):
     sku: str = Field(..., description="Stock keeping unit, unique and case-insensitive")
-    name: str
+    name: str = Field(..., max_length=NAME_MAX_LENGTH)
     description: Optional[str] = None
-    price: float = 0
-    currency: str = "USD"
+    price: float = Field(default=0, gt=-PRICE_LIMIT, lt=PRICE_LIMIT)
+    currency: str = Field(default="USD", max_length=CURRENCY_LENGTH)
     is_active: bool = True
 
 
@@ -22,10 +33,10 @@ class ProductCreate(ProductBase):
 
 
 class ProductUpdate(BaseModel):
-    name: Optional[str] = None
+    name: Optional[str] = Field(default=None, max_length=NAME_MAX_LENGTH)
     description: Optional[str] = None
-    price: Optional[float] = None
-    currency: Optional[str] = None
+    price: Optional[float] = Field(default=None, gt=-PRICE_LIMIT, lt=PRICE_LIMIT)
+    currency: Optional[str] = Field(default=None, max_length=CURRENCY_LENGTH)
     is_active: Optional[bool] = None
 
 
@@ -38,18 +49,104 @@ class ProductResponse(ProductBase):
         from_attributes = True
 
 
+class TotalMode(str, enum.Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
 class ProductListResponse(BaseModel):
     items: List[ProductResponse]
-    total: int
+    total: Optional[int] = None
+    total_exact: bool = True
     page: int
     page_size: int
 
 
+class ProductCacheStatsResponse(BaseModel):
+    item_hits: int = 0
+    item_misses: int = 0
+    list_hits: int = 0
+    list_misses: int = 0
+
+
+class ProductLookupRequest(BaseModel):
+    skus: List[str] = Field(..., min_length=1, max_length=5000)
+
+
+class ProductLookupResponse(BaseModel):
+    items: List[ProductResponse]
+    missing: List[str]
+
+
+class FacetBucket(BaseModel):
+    value: str
+    count: int
+
+
+class ProductFacetsResponse(BaseModel):
+    total: int
+    currency: List[FacetBucket]
+    is_active: List[FacetBucket]
+    price_band: List[FacetBucket]
+
+
+class BatchOperation(str, enum.Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class ProductBatchItem(BaseModel):
+    op: BatchOperation
+    sku: str = Field(..., min_length=1)
+    name: Optional[str] = None
+    description: Optional[str] = None
+    price: Optional[float] = None
+    currency: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+class ProductBatchRequest(BaseModel):
+    items: List[ProductBatchItem] = Field(..., min_length=1, max_length=5000)
+
+
+class ProductBatchItemResult(BaseModel):
+    sku: str
+    op: BatchOperation
+    status: str = Field(..., description="created, updated, deleted or failed")
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class ProductBatchResponse(BaseModel):
+    results: List[ProductBatchItemResult]
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    failed: int = 0
+
+
 class BulkDeleteRequest(BaseModel):
     confirmation_text: str = Field(
         ..., description="User-entered confirmation text that must match DELETE ALL"
     )
 
 
-class BulkDeleteResponse(BaseModel):
-    deleted_count: int
+class BulkDeleteJobResponse(BaseModel):
+    id: UUID
+    status: DeleteJobStatus
+    strategy: Optional[str] = None
+    total_rows: Optional[int] = None
+    deleted_rows: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
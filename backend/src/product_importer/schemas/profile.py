@@ -0,0 +1,26 @@
+"""Schemas for stored profiling artifacts."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from product_importer.models.profile import ProfileKind
+
+
+class ProfileResponse(BaseModel):
+    id: UUID
+    kind: ProfileKind
+    subject: str
+    samples: int
+    duration_ms: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ProfileListResponse(BaseModel):
+    items: list[ProfileResponse]
@@ -10,6 +10,23 @@ from pydantic import BaseModel
 from product_importer.models.upload_job import UploadStatus
 
 
+class IngestionStageTimings(BaseModel):
+    download: float = 0.0
+    parse: float = 0.0
+    normalize: float = 0.0
+    sql: float = 0.0
+    commit: float = 0.0
+
+
+class UploadJobMetrics(BaseModel):
+    stages_ms: IngestionStageTimings
+    elapsed_ms: float
+    bytes_read: int
+    batches: int
+    rows: int
+    rows_per_second: float
+
+
 class UploadJobResponse(BaseModel):
     id: UUID
     filename: str
@@ -17,6 +34,7 @@ class UploadJobResponse(BaseModel):
     processed_rows: int
     status: UploadStatus
     error: str | None
+    metrics: UploadJobMetrics | None = None
     created_at: datetime
     updated_at: datetime
 
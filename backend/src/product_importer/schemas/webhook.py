@@ -59,3 +59,32 @@ class WebhookDeliveryResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class WebhookCircuitResponse(BaseModel):
+    state: str = Field(..., description="closed, open or half_open")
+    consecutive_failures: int
+    opened_at: datetime | None = None
+    short_circuited: int = Field(..., description="Deliveries held back while the circuit was open")
+    throttled: int = Field(..., description="Deliveries held back by the rate limit")
+
+    class Config:
+        from_attributes = True
+
+
+class WebhookStatsResponse(BaseModel):
+    webhook_id: UUID | None = None
+    window_minutes: int
+    deliveries: int
+    successes: int
+    success_rate: float | None = None
+    throughput_per_minute: float
+    avg_ms: float | None = None
+    p50_ms: int | None = Field(default=None, description="Estimated from a latency histogram")
+    p95_ms: int | None = None
+    p99_ms: int | None = None
+
+
+class WebhookFleetStatsResponse(BaseModel):
+    overall: WebhookStatsResponse
+    webhooks: list[WebhookStatsResponse] = Field(..., description="Slowest (by p95) first")
@@ -0,0 +1,164 @@
+"""Admission control for uploads, driven by backlog and database health."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import redis
+from loguru import logger
+from sqlalchemy import ColumnElement, and_, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from product_importer.core.config import get_settings
+from product_importer.core.metrics import celery_queue_lengths
+from product_importer.db.session import AsyncSessionLocal
+from product_importer.models.upload_job import ACTIVE_UPLOAD_STATUSES, UploadJob
+
+settings = get_settings()
+
+@dataclass(frozen=True)
+class AdmissionSignals:
+    """Load signals behind admission decisions; ``None`` means it could not be read."""
+
+    active_uploads: int | None
+    queue_depth: int | None
+    db_latency_ms: float | None
+    database_ok: bool
+    broker_ok: bool
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    admitted: bool
+    reasons: tuple[str, ...]
+    retry_after_seconds: int
+    signals: AdmissionSignals
+
+    @property
+    def ready(self) -> bool:
+        """Whether this instance can serve traffic at all, regardless of load."""
+
+        return self.signals.database_ok and self.signals.broker_ok
+
+    @property
+    def degraded(self) -> bool:
+        """Whether the database answers, but slower than ``admission_max_db_latency_ms``."""
+
+        return _over(self.signals.db_latency_ms, settings.admission_max_db_latency_ms)
+
+
+# Signals are shared by every request in the process for admission_cache_seconds, so
+# bursts of uploads or readiness probes cost one query and one broker round trip.
+_cached: tuple[float, AdmissionSignals] | None = None
+
+
+class AdmissionController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def signals(self) -> AdmissionSignals:
+        global _cached
+        now = time.monotonic()
+        if _cached is not None and now - _cached[0] < settings.admission_cache_seconds:
+            return _cached[1]
+        active_uploads, db_latency_ms = await self._active_uploads()
+        queue_depth, broker_ok = await self._queue_depth()
+        signals = AdmissionSignals(
+            active_uploads=active_uploads,
+            queue_depth=queue_depth,
+            db_latency_ms=db_latency_ms,
+            database_ok=active_uploads is not None,
+            broker_ok=broker_ok,
+        )
+        _cached = (now, signals)
+        return signals
+
+    async def evaluate(self) -> AdmissionDecision:
+        signals = await self.signals()
+        reasons: list[str] = []
+        if not signals.database_ok:
+            reasons.append("database unavailable")
+        if not signals.broker_ok:
+            reasons.append("task broker unavailable")
+        if _over(signals.active_uploads, settings.admission_max_active_uploads):
+            reasons.append(f"{signals.active_uploads} uploads already queued or running")
+        if _over(signals.queue_depth, settings.admission_max_queue_depth):
+            reasons.append(f"{signals.queue_depth} tasks waiting in the queue")
+        if _over(signals.db_latency_ms, settings.admission_max_db_latency_ms):
+            reasons.append(f"database latency {signals.db_latency_ms:.0f}ms")
+        return AdmissionDecision(
+            admitted=not reasons,
+            reasons=tuple(reasons),
+            retry_after_seconds=settings.admission_retry_after_seconds,
+            signals=signals,
+        )
+
+    async def _active_uploads(self) -> tuple[int | None, float | None]:
+        stmt = select(func.count()).select_from(UploadJob).where(active_upload_filter())
+        started = time.perf_counter()
+        try:
+            count = await self.db.scalar(stmt)
+        except SQLAlchemyError as exc:
+            await self.db.rollback()
+            logger.warning("Admission check could not reach the database: {}", exc)
+            return None, None
+        return int(count or 0), round((time.perf_counter() - started) * 1000, 1)
+
+    @staticmethod
+    async def _queue_depth() -> tuple[int | None, bool]:
+        """Total waiting tasks (None for brokers that cannot be measured) and broker health."""
+
+        try:
+            lengths = await run_in_threadpool(celery_queue_lengths)
+        except redis.RedisError as exc:
+            logger.warning("Admission check could not read queue depth: {}", exc)
+            return None, False
+        return (sum(lengths.values()) if lengths else None), True
+
+
+def active_upload_filter() -> ColumnElement[bool]:
+    """Uploads queued or running, ignoring jobs untouched for admission_stale_job_seconds.
+
+    Stale jobs are assumed dead (a worker crashed mid-run), not backlog.
+    """
+
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.admission_stale_job_seconds)
+    return and_(UploadJob.status.in_(ACTIVE_UPLOAD_STATUSES), UploadJob.updated_at >= cutoff)
+
+
+def _over(value: float | None, limit: float) -> bool:
+    return bool(limit) and value is not None and value >= limit
+
+
+class UploadAdmissionMiddleware:
+    """Turn uploads away with 429 while the ingestion backlog or database is overloaded.
+
+    Runs ahead of routing, so the multipart body of a refused upload is never read.
+    Signals come from the primary, which the upload would write to.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"].rstrip("/") != "/uploads":
+            await self.app(scope, receive, send)
+            return
+
+        async with AsyncSessionLocal() as db:
+            decision = await AdmissionController(db).evaluate()
+        if decision.admitted:
+            await self.app(scope, receive, send)
+            return
+        response = JSONResponse(
+            {"detail": f"Upload capacity exhausted ({'; '.join(decision.reasons)}), retry later"},
+            status_code=429,
+            headers={"Retry-After": str(decision.retry_after_seconds)},
+        )
+        await response(scope, receive, send)
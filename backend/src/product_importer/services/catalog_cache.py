@@ -0,0 +1,198 @@
+"""Redis-backed caching of product reads and catalog-wide derived data."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Iterable
+
+import redis
+from loguru import logger
+
+from product_importer.core.config import get_settings
+from product_importer.core.redis import get_async_redis, get_redis
+
+settings = get_settings()
+
+CATALOG_VERSION_KEY = "catalog:version"
+CACHE_STATS_KEY = "products:cache:stats"
+
+# Reads a cached response and records the hit or miss in the same round trip.
+_GET_AND_COUNT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    redis.call('HINCRBY', KEYS[2], ARGV[1] .. '_hits', 1)
+else
+    redis.call('HINCRBY', KEYS[2], ARGV[1] .. '_misses', 1)
+end
+return value
+"""
+
+
+def filters_key(filters: dict) -> str:
+    """Stable digest for a set of listing filters."""
+
+    encoded = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def catalog_version() -> int:
+    """Current catalog version; every product change moves it forward."""
+
+    try:
+        value = get_redis().get(CATALOG_VERSION_KEY)
+    except redis.RedisError as exc:
+        logger.warning("Catalog version unavailable: {}", exc)
+        return 0
+    return int(value or 0)
+
+
+def bump_catalog_version() -> None:
+    """Invalidate every cache entry derived from the current catalog contents."""
+
+    try:
+        get_redis().incr(CATALOG_VERSION_KEY)
+    except redis.RedisError as exc:
+        logger.warning("Failed to bump catalog version: {}", exc)
+
+
+def _count_key(version: int, key: str) -> str:
+    return f"products:count:{version}:{key}"
+
+
+def get_cached_count(version: int, key: str) -> int | None:
+    try:
+        value = get_redis().get(_count_key(version, key))
+    except redis.RedisError as exc:
+        logger.warning("Product count cache read failed: {}", exc)
+        return None
+    return int(value) if value is not None else None
+
+
+def set_cached_count(version: int, key: str, total: int) -> None:
+    try:
+        get_redis().set(_count_key(version, key), total, ex=settings.product_count_cache_ttl_seconds)
+    except redis.RedisError as exc:
+        logger.warning("Product count cache write failed: {}", exc)
+
+
+@lru_cache
+def _get_and_count():
+    return get_redis().register_script(_GET_AND_COUNT)
+
+
+def product_key(product_id: int) -> str:
+    return f"products:item:{product_id}"
+
+
+def list_key(version: int, key: str) -> str:
+    return f"products:list:{version}:{key}"
+
+
+def get_cached_response(key: str, kind: str) -> bytes | None:
+    """Return a cached JSON body, counting the lookup under ``kind`` (item or list)."""
+
+    try:
+        return _get_and_count()(keys=[key, CACHE_STATS_KEY], args=[kind])
+    except redis.RedisError as exc:
+        logger.warning("Product cache read failed: {}", exc)
+        return None
+
+
+def set_cached_response(key: str, body: bytes) -> None:
+    try:
+        get_redis().set(key, body, ex=settings.product_cache_ttl_seconds)
+    except redis.RedisError as exc:
+        logger.warning("Product cache write failed: {}", exc)
+
+
+def invalidate_products(product_ids: Iterable[int]) -> None:
+    """Drop cached single-product responses for the given ids."""
+
+    keys = [product_key(product_id) for product_id in product_ids]
+    if not keys:
+        return
+    try:
+        get_redis().unlink(*keys)
+    except redis.RedisError as exc:
+        logger.warning("Product cache invalidation failed: {}", exc)
+
+
+def purge_product_cache(batch_size: int = 1000) -> None:
+    """Drop every cached single-product response, e.g. after a catalog wipe."""
+
+    client = get_redis()
+    try:
+        batch: list[bytes] = []
+        for key in client.scan_iter(match="products:item:*", count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                client.unlink(*batch)
+                batch = []
+        if batch:
+            client.unlink(*batch)
+    except redis.RedisError as exc:
+        logger.warning("Product cache purge failed: {}", exc)
+
+
+def cache_stats() -> dict[str, int]:
+    try:
+        raw = get_redis().hgetall(CACHE_STATS_KEY)
+    except redis.RedisError as exc:
+        logger.warning("Product cache stats unavailable: {}", exc)
+        raw = {}
+    stats = {"item_hits": 0, "item_misses": 0, "list_hits": 0, "list_misses": 0}
+    for field, value in raw.items():
+        stats[field.decode() if isinstance(field, bytes) else field] = int(value)
+    return stats
+
+
+# Async counterparts used by the API request path.
+
+
+@lru_cache
+def _get_and_count_async():
+    return get_async_redis().register_script(_GET_AND_COUNT)
+
+
+async def catalog_version_async() -> int:
+    try:
+        value = await get_async_redis().get(CATALOG_VERSION_KEY)
+    except redis.RedisError as exc:
+        logger.warning("Catalog version unavailable: {}", exc)
+        return 0
+    return int(value or 0)
+
+
+async def get_cached_count_async(version: int, key: str) -> int | None:
+    try:
+        value = await get_async_redis().get(_count_key(version, key))
+    except redis.RedisError as exc:
+        logger.warning("Product count cache read failed: {}", exc)
+        return None
+    return int(value) if value is not None else None
+
+
+async def set_cached_count_async(version: int, key: str, total: int) -> None:
+    try:
+        await get_async_redis().set(
+            _count_key(version, key), total, ex=settings.product_count_cache_ttl_seconds
+        )
+    except redis.RedisError as exc:
+        logger.warning("Product count cache write failed: {}", exc)
+
+
+async def get_cached_response_async(key: str, kind: str) -> bytes | None:
+    try:
+        return await _get_and_count_async()(keys=[key, CACHE_STATS_KEY], args=[kind])
+    except redis.RedisError as exc:
+        logger.warning("Product cache read failed: {}", exc)
+        return None
+
+
+async def set_cached_response_async(key: str, body: bytes) -> None:
+    try:
+        await get_async_redis().set(key, body, ex=settings.product_cache_ttl_seconds)
+    except redis.RedisError as exc:
+        logger.warning("Product cache write failed: {}", exc)
@@ -0,0 +1,195 @@
+"""Webhook delivery log storage and retention."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Iterable, Mapping
+
+from loguru import logger
+from sqlalchemy import delete, func, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import Session
+
+from product_importer.core.config import get_settings
+from product_importer.core.serialization import dumps
+from product_importer.models.webhook import WebhookDelivery, WebhookPayload
+from product_importer.services.webhook_stats import prune_rollups, record_rollups
+
+settings = get_settings()
+
+PAYLOAD_MODES = ("full", "compressed", "reference")
+_PARTITION_SUFFIX = re.compile(r"_p(\d{8})$")
+# check_violation, raised for rows outside every partition's range.
+NO_PARTITION_SQLSTATE = "23514"
+
+
+def partition_name(day: date) -> str:
+    return f"{WebhookDelivery.__tablename__}_p{day:%Y%m%d}"
+
+
+def _day_start(day: date) -> str:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc).isoformat()
+
+
+class DeliveryLogService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.table = WebhookDelivery.__table__
+        self.schema = self.table.schema
+
+    def record(self, entries: Iterable[Mapping[str, Any]]) -> int:
+        """Insert delivery log rows in a single statement and update the latency rollups.
+
+        Each entry carries ``webhook_id``, ``event``, ``payload`` and the delivery
+        outcome. Payloads are encoded once per distinct payload object, since a
+        dispatch sends the same payload to every subscriber.
+        """
+
+        mode = settings.webhook_log_payload_mode
+        if mode not in PAYLOAD_MODES:
+            logger.warning("Unknown webhook_log_payload_mode {!r}; storing payloads in full", mode)
+            mode = "full"
+
+        encoded: dict[int, dict[str, Any]] = {}
+        references: dict[str, dict] = {}
+        rows = []
+        for entry in entries:
+            payload = entry["payload"]
+            columns = encoded.get(id(payload))
+            if columns is None:
+                columns = self._encode_payload(mode, payload, references)
+                encoded[id(payload)] = columns
+            rows.append(
+                {
+                    "webhook_id": entry["webhook_id"],
+                    "event": entry["event"],
+                    "response_code": entry.get("response_code"),
+                    "response_time_ms": entry.get("response_time_ms"),
+                    "response_body": entry.get("response_body"),
+                    "status": entry["status"],
+                    **columns,
+                }
+            )
+        if not rows:
+            return 0
+
+        if references:
+            stmt = pg_insert(WebhookPayload.__table__).values(
+                [{"digest": digest, "payload": payload} for digest, payload in sorted(references.items())]
+            )
+            self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[WebhookPayload.digest], set_={"last_used_at": func.now()}
+                )
+            )
+        try:
+            with self.db.begin_nested():
+                self.db.execute(insert(self.table), rows)
+        except IntegrityError as exc:
+            if getattr(exc.orig, "sqlstate", None) != NO_PARTITION_SQLSTATE:
+                raise
+            # Partition maintenance has fallen behind and today has no partition yet.
+            logger.warning("No delivery log partition for today; creating it")
+            self.ensure_partitions()
+            self.db.execute(insert(self.table), rows)
+        record_rollups(self.db, rows)
+        return len(rows)
+
+    @staticmethod
+    def _encode_payload(mode: str, payload: dict, references: dict[str, dict]) -> dict[str, Any]:
+        columns: dict[str, Any] = {"payload": None, "payload_compressed": None, "payload_ref": None}
+        if mode == "full":
+            columns["payload"] = payload
+        elif mode == "compressed":
+            columns["payload_compressed"] = zlib.compress(dumps(payload))
+        else:
+            digest = hashlib.sha256(dumps(payload)).hexdigest()
+            references[digest] = payload
+            columns["payload_ref"] = digest
+        return columns
+
+    def _partitions(self, connection=None) -> dict[date, str]:
+        rows = (connection or self.db).execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_namespace ns ON ns.oid = parent.relnamespace "
+                "WHERE parent.relname = :table AND ns.nspname = :schema"
+            ),
+            {"table": self.table.name, "schema": self.schema},
+        ).scalars()
+        partitions = {}
+        for name in rows:
+            match = _PARTITION_SUFFIX.search(name)
+            if match:
+                partitions[datetime.strptime(match.group(1), "%Y%m%d").date()] = name
+        return partitions
+
+    def ensure_partitions(self, today: date | None = None) -> list[str]:
+        """Create the daily partitions from ``today`` through the configured lookahead."""
+
+        today = today or datetime.now(timezone.utc).date()
+        existing = self._partitions()
+        created = []
+        for offset in range(settings.webhook_log_partitions_ahead + 1):
+            day = today + timedelta(days=offset)
+            if day in existing:
+                continue
+            name = partition_name(day)
+            try:
+                with self.db.begin_nested():
+                    self.db.execute(
+                        text(
+                            f"CREATE TABLE {self.schema}.{name} PARTITION OF {self.table.fullname} "
+                            f"FOR VALUES FROM ('{_day_start(day)}') TO ('{_day_start(day + timedelta(days=1))}')"
+                        )
+                    )
+            except DBAPIError as exc:
+                # Most likely another worker created it first.
+                logger.warning("Could not create delivery log partition {}: {}", name, exc.orig)
+                continue
+            created.append(name)
+        return created
+
+    def drop_expired(self, today: date | None = None) -> list[str]:
+        """Drop partitions older than the retention window.
+
+        Each one is first detached with ``DETACH PARTITION ... CONCURRENTLY``, so
+        deliveries keep being logged meanwhile. That cannot run inside a transaction,
+        so it uses an autocommit connection of its own. It also waits for every
+        transaction older than itself to finish, so call this before the session
+        begins one.
+        """
+
+        today = today or datetime.now(timezone.utc).date()
+        cutoff = today - timedelta(days=settings.webhook_log_retention_days)
+        with self.db.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            expired = [name for day, name in sorted(self._partitions(connection).items()) if day < cutoff]
+            pending = set(
+                connection.scalars(
+                    text(
+                        "SELECT child.relname FROM pg_inherits "
+                        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                        "WHERE pg_inherits.inhparent = CAST(:table AS regclass) "
+                        "AND pg_inherits.inhdetachpending"
+                    ),
+                    {"table": self.table.fullname},
+                )
+            )
+            for name in expired:
+                # A detach interrupted by a previous run has to be finalized instead.
+                mode = "FINALIZE" if name in pending else "CONCURRENTLY"
+                connection.execute(
+                    text(f"ALTER TABLE {self.table.fullname} DETACH PARTITION {self.schema}.{name} {mode}")
+                )
+                connection.execute(text(f"DROP TABLE {self.schema}.{name}"))
+
+        cutoff_at = datetime.combine(cutoff, time.min, tzinfo=timezone.utc)
+        self.db.execute(delete(WebhookPayload).where(WebhookPayload.last_used_at < cutoff_at))
+        prune_rollups(self.db, settings.webhook_stats_retention_days)
+        return expired
@@ -1,21 +1,73 @@
-"""Simple helper to emit domain events via Celery tasks."""
+"""Domain events, published through a transactional outbox.
+
+``emit_event`` only inserts an outbox row in the caller's transaction: writes pay no
+broker round trip, and events from rolled-back transactions never exist. The outbox
+relay later hands committed events to the webhook dispatcher in order, optionally
+merging runs of per-product events into a single delivery.
+"""
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+
 from loguru import logger
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from product_importer.core.config import get_settings
+from product_importer.models.outbox import OutboxEvent
+from product_importer.services.webhook_subscriptions import subscriptions
 
-try:
-    from product_importer.workers.tasks.webhooks import dispatch_webhook_event
-except ModuleNotFoundError:  # pragma: no cover
-    dispatch_webhook_event = None
+settings = get_settings()
 
+COALESCED_EVENTS = frozenset({"product.created", "product.updated", "product.deleted"})
 
-def emit_event(event: str, payload: dict) -> None:
-    """Send an asynchronous webhook dispatch task if the worker is available."""
 
-    if dispatch_webhook_event is None:
-        logger.warning("Webhook dispatch task not available; skipping event %s", event)
+def emit_event(session: Session, event: str, payload: dict) -> None:
+    """Record ``event`` for delivery once the session's transaction commits.
+
+    ``payload`` must be JSON-serializable.
+    """
+
+    if not subscriptions().has_subscribers(event, session):
+        logger.debug("No subscribers for event {}", event)
         return
+    session.execute(insert(OutboxEvent).values(event=event, payload=payload))
+
+
+def coalesced_payload(items: list[dict]) -> dict:
+    return {"count": len(items), "items": items}
+
+
+def _delivery(event: str, items: list[dict]) -> tuple[str, dict]:
+    # A lone event keeps the shape it was emitted with.
+    return event, items[0] if len(items) == 1 else coalesced_payload(items)
+
+
+def group_events(rows: Iterable[tuple[str, dict, datetime]]) -> Iterator[tuple[str, dict]]:
+    """Turn relayed ``(event, payload, emitted_at)`` rows into deliveries, in order.
+
+    With ``event_coalesce_max_items`` above 1, consecutive per-product events of the
+    same type are merged into ``{"count", "items"}`` payloads of at most that many
+    items, emitted within ``event_coalesce_window_seconds`` of the first one. Any other
+    event ends the run first, so deliveries never overtake each other.
+    """
 
-    logger.debug("Emitting event %s", event)
-    dispatch_webhook_event.delay(event, payload)
+    size = max(1, settings.event_coalesce_max_items)
+    window = timedelta(seconds=settings.event_coalesce_window_seconds)
+    run_event: str | None = None
+    run_started: datetime | None = None
+    run: list[dict] = []
+    for event, payload, emitted_at in rows:
+        if run and (event != run_event or len(run) >= size or emitted_at - run_started > window):
+            yield _delivery(run_event, run)
+            run = []
+        if size > 1 and event in COALESCED_EVENTS:
+            if not run:
+                run_event, run_started = event, emitted_at
+            run.append(payload)
+        else:
+            yield event, payload
+    if run:
+        yield _delivery(run_event, run)
@@ -0,0 +1,201 @@
+"""Catalog facet counts kept in step with product writes."""
+
+from __future__ import annotations
+
+from collections import Counter
+from decimal import Decimal
+from typing import Iterable, Mapping
+
+from sqlalchemy import BigInteger, case, cast, delete, func, insert, select, text, union_all
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from product_importer.models.catalog_facet import CatalogFacet, CatalogFacetDelta
+from product_importer.models.product import Product
+from product_importer.schemas.product import FacetBucket, ProductFacetsResponse
+
+# Upper bounds of the price bands; the last band is open-ended.
+PRICE_BAND_BOUNDS = (10, 50, 100, 500)
+FACETS = ("currency", "is_active", "price_band")
+
+# Advisory lock key held by whichever of fold, rebuild or reset rewrites the summary.
+FACET_LOCK_KEY = 0x46414345
+
+# Columns a product row must carry for its facet buckets to be derived.
+FACET_COLUMNS = (Product.currency, Product.is_active, Product.price)
+
+
+def price_band(price: Decimal | float | None) -> str:
+    lower = 0
+    for upper in PRICE_BAND_BOUNDS:
+        if (price or 0) < upper:
+            return f"{lower}-{upper}"
+        lower = upper
+    return f"{lower}+"
+
+
+def _price_band_sql():
+    whens = []
+    lower = 0
+    for upper in PRICE_BAND_BOUNDS:
+        whens.append((Product.price < upper, f"{lower}-{upper}"))
+        lower = upper
+    return case(*whens, else_=f"{lower}+")
+
+
+def facet_buckets(row: Mapping) -> list[tuple[str, str]]:
+    """The (facet, bucket) pairs a product row counts towards."""
+
+    return [
+        ("currency", row["currency"] or "USD"),
+        ("is_active", "true" if row["is_active"] else "false"),
+        ("price_band", price_band(row["price"])),
+    ]
+
+
+def facet_deltas(added: Iterable[Mapping] = (), removed: Iterable[Mapping] = ()) -> Counter:
+    """Net facet count changes for rows entering and leaving the catalog.
+
+    An update is a removal of the old row plus an addition of the new one.
+    """
+
+    deltas: Counter = Counter()
+    for row in added:
+        deltas.update(facet_buckets(row))
+    for row in removed:
+        deltas.subtract(facet_buckets(row))
+    return deltas
+
+
+class FacetService:
+    """Facet counts as a summary table plus append-only deltas.
+
+    Writers only insert delta rows, so concurrent imports never contend for the same
+    summary row. ``fold`` periodically moves the deltas into ``catalog_facets`` and
+    readers add up both, so counts stay exact in between.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, deltas: Counter) -> None:
+        """Record count deltas in the caller's transaction."""
+
+        rows = [
+            {"facet": facet, "bucket": bucket, "delta": change}
+            for (facet, bucket), change in deltas.items()
+            if change
+        ]
+        if rows:
+            self.db.execute(insert(CatalogFacetDelta.__table__), rows)
+
+    def fold(self) -> int:
+        """Move committed deltas into the summary table; returns the buckets touched."""
+
+        self._lock()
+        summary = CatalogFacet.__table__
+        result = self.db.execute(
+            text(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {CatalogFacetDelta.__table__.fullname}
+                    RETURNING facet, bucket, delta
+                )
+                INSERT INTO {summary.fullname} AS summary (facet, bucket, count)
+                SELECT facet, bucket, sum(delta) FROM moved GROUP BY facet, bucket
+                ON CONFLICT (facet, bucket)
+                DO UPDATE SET count = summary.count + excluded.count, updated_at = now()
+                """
+            )
+        )
+        return result.rowcount
+
+    def rebuild(self) -> bool:
+        """Recount every facet from the products table to correct any drift.
+
+        Runs and commits its own REPEATABLE READ transaction, whatever state the
+        session is in, so the recount and the deltas it discards come from the same
+        snapshot. Writers keep appending meanwhile and their newer deltas are left for
+        the next fold. Returns False, having changed nothing, when a fold or reset got
+        in the way.
+        """
+
+        engine = self.db.get_bind().execution_options(isolation_level="REPEATABLE READ")
+        with Session(engine) as session:
+            if not session.scalar(select(func.pg_try_advisory_xact_lock(FACET_LOCK_KEY))):
+                return False
+            try:
+                counts = session.execute(self._recount_stmt()).all()
+                session.execute(delete(CatalogFacetDelta.__table__))
+                session.execute(delete(CatalogFacet.__table__))
+            except OperationalError:
+                # A fold that committed between our snapshot and taking the lock
+                # already moved some of the deltas we would discard.
+                return False
+            rows = [
+                {"facet": facet, "bucket": bucket, "count": count}
+                for facet, bucket, count in self._facet_counts(counts)
+            ]
+            if rows:
+                session.execute(insert(CatalogFacet.__table__), rows)
+            session.commit()
+        return True
+
+    def reset(self) -> None:
+        """Empty the facets in the caller's transaction, after wiping the products."""
+
+        self._lock()
+        self.db.execute(delete(CatalogFacetDelta.__table__))
+        self.db.execute(delete(CatalogFacet.__table__))
+
+    def summary(self) -> ProductFacetsResponse:
+        return self.build_summary(self.db.execute(self.summary_stmt()).all())
+
+    def _lock(self) -> None:
+        # Serializes fold, rebuild and reset; writers appending deltas never take it.
+        self.db.execute(select(func.pg_advisory_xact_lock(FACET_LOCK_KEY)))
+
+    @staticmethod
+    def _recount_stmt():
+        # One scan of products; each grouping set yields the buckets of one facet and
+        # leaves the other two columns NULL.
+        buckets = select(
+            func.coalesce(Product.currency, "USD").label("currency"),
+            case((Product.is_active, "true"), else_="false").label("is_active"),
+            _price_band_sql().label("price_band"),
+        ).subquery()
+        columns = [buckets.c[facet] for facet in FACETS]
+        return select(*columns, func.count()).group_by(func.grouping_sets(*columns))
+
+    @staticmethod
+    def _facet_counts(rows: Iterable[tuple]) -> Iterable[tuple[str, str, int]]:
+        for *values, count in rows:
+            for facet, bucket in zip(FACETS, values):
+                if bucket is not None:
+                    yield facet, bucket, count
+
+    @staticmethod
+    def summary_stmt():
+        """Summary counts plus deltas not folded in yet, for buckets still in use."""
+
+        rows = union_all(
+            select(CatalogFacet.facet, CatalogFacet.bucket, CatalogFacet.count),
+            select(CatalogFacetDelta.facet, CatalogFacetDelta.bucket, CatalogFacetDelta.delta),
+        ).subquery()
+        total = cast(func.sum(rows.c.count), BigInteger)
+        return (
+            select(rows.c.facet, rows.c.bucket, total.label("count"))
+            .group_by(rows.c.facet, rows.c.bucket)
+            .having(total > 0)
+        )
+
+    @staticmethod
+    def build_summary(rows: Iterable[tuple[str, str, int]]) -> ProductFacetsResponse:
+        grouped: dict[str, list[FacetBucket]] = {facet: [] for facet in FACETS}
+        for facet, bucket, count in rows:
+            if facet in grouped:
+                grouped[facet].append(FacetBucket(value=bucket, count=count))
+        for buckets in grouped.values():
+            buckets.sort(key=lambda item: item.count, reverse=True)
+        total = sum(item.count for item in grouped["is_active"])
+        return ProductFacetsResponse(total=total, **grouped)
@@ -2,21 +2,89 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import csv
+import io
+import json
+import zlib
+from collections import defaultdict
+from typing import Iterator, Optional
+from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from pydantic import ValidationError
+from sqlalchemy import any_, cast, column, delete, func, or_, select, text, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, CITEXT
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from product_importer.core.config import get_settings
+from product_importer.core.serialization import dumps
+from product_importer.db.session import is_replica_session, run_after_commit
+from product_importer.models.delete_job import (
+    ACTIVE_DELETE_JOB_STATUSES,
+    DeleteJobStatus,
+    ProductDeleteJob,
+)
 from product_importer.models.product import Product
-from product_importer.schemas.product import ProductCreate, ProductResponse, ProductUpdate
+from product_importer.schemas.product import (
+    BatchOperation,
+    BulkDeleteJobResponse,
+    ExportFormat,
+    ProductBatchItem,
+    ProductBatchItemResult,
+    ProductBatchResponse,
+    ProductCreate,
+    ProductFacetsResponse,
+    ProductLookupResponse,
+    ProductResponse,
+    ProductUpdate,
+    TotalMode,
+)
+from product_importer.services.catalog_cache import (
+    bump_catalog_version,
+    catalog_version,
+    catalog_version_async,
+    filters_key,
+    get_cached_count,
+    get_cached_count_async,
+    get_cached_response,
+    get_cached_response_async,
+    invalidate_products,
+    list_key,
+    product_key,
+    set_cached_count,
+    set_cached_count_async,
+    set_cached_response,
+    set_cached_response_async,
+)
 from product_importer.services.events import emit_event
+from product_importer.services.facet_service import FACET_COLUMNS, FacetService, facet_deltas
+
+settings = get_settings()
+
+PRODUCT_FIELDS = tuple(ProductResponse.model_fields)
+
+RELTUPLES_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+
+# Updatable columns declared NOT NULL; an explicit null for one is rejected per item.
+NOT_NULL_FIELDS = ("name", "price", "currency", "is_active")
+
+# Column order matches what the CSV importer reads back.
+EXPORT_COLUMNS = ("sku", "name", "description", "price", "currency", "is_active")
 
 
 class ProductService:
     def __init__(self, db: Session):
         self.db = db
 
+    @property
+    def _populates_cache(self) -> bool:
+        # Replica reads can lag the primary. Cached, they would be served as current to
+        # every client, including ones pinned to the primary after a write, so only
+        # primary reads fill the shared caches.
+        return not is_replica_session(self.db)
+
     def list_products(
         self,
         *,
@@ -25,29 +93,235 @@ class ProductService:
         sku: Optional[str] = None,
         query: Optional[str] = None,
         is_active: Optional[bool] = None,
-    ) -> tuple[list[Product], int]:
-        stmt = select(Product)
-        count_stmt = select(func.count()).select_from(Product)
+        total_mode: TotalMode = TotalMode.EXACT,
+        fields: Optional[list[str]] = None,
+    ) -> tuple[list[dict], int | None, bool]:
+        """Return a page of product rows plus its total and whether that total is exact.
+
+        Only the requested ``fields`` (plus ``id``) are selected, and rows come back as
+        plain dicts without ORM hydration.
+        """
+
+        filters = self._filters(sku=sku, query=query, is_active=is_active)
+        stmt = self._page_stmt(self.resolve_fields(fields), filters, page, page_size)
+        items = self.db.execute(stmt).mappings().all()
+        total, exact = self._total(filters, self._count_params(sku, query, is_active), total_mode)
+        return [dict(item) for item in items], total, exact
+
+    @staticmethod
+    def resolve_fields(fields: Optional[list[str]]) -> list[str]:
+        """Validate a sparse fieldset against ``ProductResponse``; ``id`` is always included."""
+
+        if not fields:
+            return list(PRODUCT_FIELDS)
+        unknown = sorted(set(fields) - set(PRODUCT_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown product fields: {', '.join(unknown)}")
+        return ["id", *(name for name in PRODUCT_FIELDS if name in fields and name != "id")]
+
+    def list_json(
+        self,
+        *,
+        page: int = 1,
+        page_size: int = 25,
+        sku: Optional[str] = None,
+        query: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        fields: Optional[list[str]] = None,
+    ) -> bytes:
+        """Serialized ``ProductListResponse`` for a page, read through the catalog cache."""
+
+        columns = self.resolve_fields(fields)
+        params = {
+            **self._count_params(sku, query, is_active),
+            "page": page,
+            "page_size": page_size,
+            "total_mode": total_mode.value,
+            "fields": columns,
+        }
+        key = list_key(catalog_version(), filters_key(params))
+        body = get_cached_response(key, "list")
+        if body is None:
+            items, total, total_exact = self.list_products(
+                page=page,
+                page_size=page_size,
+                sku=sku,
+                query=query,
+                is_active=is_active,
+                total_mode=total_mode,
+                fields=columns,
+            )
+            body = self._list_body(items, total, total_exact, page, page_size)
+            if self._populates_cache:
+                set_cached_response(key, body)
+        return body
+
+    def export(
+        self,
+        *,
+        fmt: ExportFormat = ExportFormat.CSV,
+        compress: bool = False,
+        sku: Optional[str] = None,
+        query: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> Iterator[bytes]:
+        """Stream the filtered catalog as CSV or NDJSON chunks.
+
+        Rows come from a server-side cursor so memory stays flat regardless of catalog
+        size; one chunk is produced per fetched batch.
+        """
+
+        stmt = select(*(getattr(Product, name) for name in EXPORT_COLUMNS)).order_by(Product.id)
+        filters = self._filters(sku=sku, query=query, is_active=is_active)
+        if filters:
+            stmt = stmt.where(*filters)
+
+        encoder = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+        result = self.db.execute(stmt.execution_options(yield_per=settings.product_export_batch_size))
+
+        def emit(chunk: str) -> bytes:
+            data = chunk.encode("utf-8")
+            return encoder.compress(data) if encoder else data
 
+        if fmt is ExportFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_COLUMNS)
+            yield emit(buffer.getvalue())
+            for rows in result.partitions():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(
+                    (sku, name, description or "", price, currency, "true" if active else "false")
+                    for sku, name, description, price, currency, active in rows
+                )
+                yield emit(buffer.getvalue())
+        else:
+            for rows in result.partitions():
+                yield emit(
+                    "".join(
+                        json.dumps(
+                            {
+                                "sku": sku,
+                                "name": name,
+                                "description": description,
+                                "price": float(price),
+                                "currency": currency,
+                                "is_active": active,
+                            }
+                        )
+                        + "\n"
+                        for sku, name, description, price, currency, active in rows
+                    )
+                )
+
+        if encoder:
+            yield encoder.flush()
+
+    @staticmethod
+    def _filters(
+        *,
+        sku: Optional[str] = None,
+        query: Optional[str] = None,
+        is_active: Optional[bool] = None,
+    ) -> list:
         filters = []
         if sku:
-            filters.append(func.lower(Product.sku) == sku.lower())
+            filters.append(ProductService._sku_matches(sku))
         if query:
             like = f"%{query}%"
             filters.append(or_(Product.name.ilike(like), Product.description.ilike(like)))
         if is_active is not None:
             filters.append(Product.is_active.is_(is_active))
+        return filters
+
+    @staticmethod
+    def _sku_matches(sku: str):
+        """Case-insensitive SKU equality that the CITEXT unique index can serve.
+
+        Comparing the bare column to a CITEXT value keeps the predicate sargable;
+        wrapping the column in ``lower()`` would force a sequential scan.
+        """
+
+        return Product.sku == cast(sku, CITEXT)
+
+    @staticmethod
+    def _skus_match(skus: list[str]):
+        """Indexed ``sku = ANY(...)`` multi-get predicate."""
+
+        return Product.sku == any_(cast(skus, ARRAY(CITEXT)))
+
+    @staticmethod
+    def _count_params(sku: Optional[str], query: Optional[str], is_active: Optional[bool]) -> dict:
+        """Normalised filter set used to key cached totals and pages."""
 
+        return {"sku": sku.lower() if sku else None, "query": query or None, "is_active": is_active}
+
+    @staticmethod
+    def _page_stmt(columns: list[str], filters: list, page: int, page_size: int):
+        stmt = select(*(getattr(Product, name) for name in columns))
         if filters:
             stmt = stmt.where(*filters)
-            count_stmt = count_stmt.where(*filters)
+        return stmt.order_by(Product.created_at.desc()).offset((page - 1) * page_size).limit(page_size)
+
+    @staticmethod
+    def _count_stmt(filters: list):
+        stmt = select(func.count()).select_from(Product)
+        return stmt.where(*filters) if filters else stmt
+
+    @staticmethod
+    def _list_body(items: list[dict], total: int | None, total_exact: bool, page: int, page_size: int) -> bytes:
+        return dumps(
+            {
+                "items": items,
+                "total": total,
+                "total_exact": total_exact,
+                "page": page,
+                "page_size": page_size,
+            }
+        )
+
+    @staticmethod
+    def _plan_rows(plan) -> int | None:
+        try:
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except (KeyError, IndexError, TypeError):
+            return None
 
-        stmt = stmt.order_by(Product.created_at.desc())
-        total = self.db.scalar(count_stmt) or 0
-        items = self.db.execute(
-            stmt.offset((page - 1) * page_size).limit(page_size)
-        ).scalars().all()
-        return items, total
+    def _total(self, filters: list, count_params: dict, mode: TotalMode) -> tuple[int | None, bool]:
+        if mode is TotalMode.NONE:
+            return None, False
+
+        # Planner statistics are only trustworthy for equality-style predicates; substring
+        # searches fall through to a cached exact count.
+        if mode is TotalMode.ESTIMATED and not count_params["query"]:
+            estimate = self._estimate_count(filters)
+            if estimate is not None:
+                return estimate, False
+
+        version = catalog_version()
+        key = filters_key(count_params)
+        total = get_cached_count(version, key)
+        if total is None:
+            total = self.db.scalar(self._count_stmt(filters)) or 0
+            if self._populates_cache:
+                set_cached_count(version, key, total)
+        return total, True
+
+    def _estimate_count(self, filters: list) -> int | None:
+        if not filters:
+            reltuples = self.db.scalar(RELTUPLES_SQL, {"table": Product.__table__.fullname})
+            # reltuples is -1 until the table has been vacuumed or analyzed.
+            if reltuples is None or reltuples < 0:
+                return None
+            return int(reltuples)
+
+        compiled = select(Product.id).where(*filters).compile(dialect=self.db.get_bind().dialect)
+        plan = self.db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        return self._plan_rows(plan)
 
     def get(self, product_id: int) -> Product:
         product = self.db.get(Product, product_id)
@@ -55,35 +329,389 @@ class ProductService:
             raise NoResultFound
         return product
 
+    def get_by_sku(self, sku: str) -> Product:
+        product = self.db.scalars(select(Product).where(self._sku_matches(sku))).first()
+        if not product:
+            raise NoResultFound
+        return product
+
+    def lookup_skus(self, skus: list[str]) -> ProductLookupResponse:
+        products = self.db.scalars(select(Product).where(self._skus_match(skus))).all()
+        return self._lookup_response(skus, products)
+
+    @staticmethod
+    def _lookup_response(skus: list[str], products) -> ProductLookupResponse:
+        found = {product.sku.lower() for product in products}
+        missing = list(dict.fromkeys(sku for sku in skus if sku.lower() not in found))
+        return ProductLookupResponse(
+            items=[ProductResponse.model_validate(product) for product in products],
+            missing=missing,
+        )
+
+    def get_json(self, product_id: int) -> bytes:
+        """Serialized ``ProductResponse`` for a product, read through the catalog cache."""
+
+        key = product_key(product_id)
+        body = get_cached_response(key, "item")
+        if body is None:
+            body = ProductResponse.model_validate(self.get(product_id)).model_dump_json().encode("utf-8")
+            if self._populates_cache:
+                set_cached_response(key, body)
+        return body
+
     def create(self, data: ProductCreate) -> Product:
         product = Product(**data.model_dump())
         self.db.add(product)
         self.db.flush()
-        emit_event("product.created", self._serialize(product))
+        FacetService(self.db).apply(facet_deltas(added=[self._facet_row(product)]))
+        self._invalidate_catalog()
+        emit_event(self.db, "product.created", self._serialize(product))
         return product
 
     def update(self, product_id: int, data: ProductUpdate) -> Product:
         product = self.get(product_id)
+        before = self._facet_row(product)
         for field, value in data.model_dump(exclude_unset=True).items():
             setattr(product, field, value)
         self.db.add(product)
         self.db.flush()
-        emit_event("product.updated", self._serialize(product))
+        FacetService(self.db).apply(facet_deltas(added=[self._facet_row(product)], removed=[before]))
+        self._invalidate_catalog(product.id)
+        emit_event(self.db, "product.updated", self._serialize(product))
         return product
 
     def delete(self, product_id: int) -> None:
         product = self.get(product_id)
         payload = self._serialize(product)
         self.db.delete(product)
-        emit_event("product.deleted", payload)
+        FacetService(self.db).apply(facet_deltas(removed=[self._facet_row(product)]))
+        self._invalidate_catalog(product.id)
+        emit_event(self.db, "product.deleted", payload)
+
+    def start_bulk_delete(self) -> ProductDeleteJob:
+        """Queue a background job that empties the catalog.
+
+        An already queued, running or retrying job is returned instead of starting a
+        second one.
+        """
+
+        active = self.db.scalars(
+            select(ProductDeleteJob)
+            .where(ProductDeleteJob.status.in_(ACTIVE_DELETE_JOB_STATUSES))
+            .order_by(ProductDeleteJob.created_at.desc())
+            .limit(1)
+        ).first()
+        if active:
+            return active
+
+        job = ProductDeleteJob(status=DeleteJobStatus.QUEUED, deleted_rows=0)
+        self.db.add(job)
+        self.db.flush()
+
+        # Imported lazily to avoid a circular import at module load time.
+        from product_importer.workers.tasks.bulk_delete import bulk_delete_products
+
+        job_id = str(job.id)
+        run_after_commit(self.db, lambda: bulk_delete_products.delay(job_id))
+        return job
+
+    def get_delete_job(self, job_id: UUID | str) -> ProductDeleteJob:
+        job = self.db.get(ProductDeleteJob, UUID(str(job_id)))
+        if not job:
+            raise ValueError("Bulk delete job not found")
+        return job
+
+    def batch(self, items: list[ProductBatchItem]) -> ProductBatchResponse:
+        """Apply mixed create/update/delete operations addressed by SKU.
+
+        Each operation kind runs as one set-based statement inside the caller's
+        transaction, and a single ``product.batch`` event summarises the outcome.
+        """
+
+        results: list[ProductBatchItemResult | None] = [None] * len(items)
+        creates: dict[str, tuple[int, dict]] = {}
+        updates: dict[frozenset, dict[str, tuple[int, dict]]] = defaultdict(dict)
+        deletes: dict[str, int] = {}
+        seen: set[str] = set()
+
+        def fail(index: int, detail: str) -> None:
+            item = items[index]
+            results[index] = ProductBatchItemResult(sku=item.sku, op=item.op, status="failed", detail=detail)
+
+        for index, item in enumerate(items):
+            # SKUs are case-insensitive, so compare them the way CITEXT does.
+            sku_key = item.sku.lower()
+            if sku_key in seen:
+                fail(index, "Duplicate SKU in batch")
+                continue
+            seen.add(sku_key)
+
+            fields = item.model_dump(exclude={"op", "sku"}, exclude_unset=True)
+            if item.op is BatchOperation.CREATE:
+                try:
+                    row = ProductCreate(sku=item.sku, **fields).model_dump()
+                except ValidationError as exc:
+                    fail(index, exc.errors()[0]["msg"])
+                    continue
+                creates[sku_key] = (index, row)
+            elif item.op is BatchOperation.UPDATE:
+                if not fields:
+                    fail(index, "No fields to update")
+                    continue
+                nulls = [field for field in NOT_NULL_FIELDS if field in fields and fields[field] is None]
+                if nulls:
+                    fail(index, f"{nulls[0]} cannot be null")
+                    continue
+                try:
+                    fields = ProductUpdate(**fields).model_dump(exclude_unset=True)
+                except ValidationError as exc:
+                    fail(index, exc.errors()[0]["msg"])
+                    continue
+                updates[frozenset(fields)][sku_key] = (index, {"sku": item.sku, **fields})
+            else:
+                deletes[sku_key] = index
+
+        def succeed(index: int, status: str, product_id: int) -> None:
+            item = items[index]
+            results[index] = ProductBatchItemResult(sku=item.sku, op=item.op, status=status, id=product_id)
+
+        table = Product.__table__
+        touched: dict[str, list[str]] = {"created": [], "updated": [], "deleted": []}
+        stale_ids: list[int] = []
+        added_rows: list = []
+        removed_rows: list = []
+        facet_columns = [table.c[column.key] for column in FACET_COLUMNS]
+
+        if creates:
+            stmt = (
+                pg_insert(table)
+                .values([row for _, row in creates.values()])
+                .on_conflict_do_nothing(index_elements=[table.c.sku])
+                .returning(table.c.id, table.c.sku, *facet_columns)
+            )
+            for row in self.db.execute(stmt).mappings():
+                product_id, sku = row["id"], row["sku"]
+                added_rows.append(row)
+                index, _ = creates.pop(sku.lower())
+                succeed(index, "created", product_id)
+                touched["created"].append(sku)
+            for index, _ in creates.values():
+                fail(index, "SKU already exists")
+
+        if updates:
+            # Lock the rows about to change and capture their facet values first.
+            update_skus = [sku for group in updates.values() for sku in group]
+            removed_rows.extend(
+                self.db.execute(
+                    select(*facet_columns)
+                    .where(self._skus_match(update_skus))
+                    .with_for_update()
+                ).mappings()
+            )
+
+        for field_names, group in updates.items():
+            columns = sorted(field_names)
+            source = values(
+                column("sku", CITEXT),
+                *(column(name, table.c[name].type) for name in columns),
+                name="batch",
+            ).data([tuple(row[name] for name in ["sku", *columns]) for _, row in group.values()])
+            # VALUES columns are typed from their bound parameters, so cast them back to
+            # the table's types (CITEXT keeps the SKU match case-insensitive).
+            stmt = (
+                update(table)
+                .where(table.c.sku == cast(source.c.sku, CITEXT))
+                .values({name: cast(source.c[name], table.c[name].type) for name in columns})
+                .returning(table.c.id, table.c.sku, *facet_columns)
+            )
+            for row in self.db.execute(stmt).mappings():
+                product_id, sku = row["id"], row["sku"]
+                added_rows.append(row)
+                index, _ = group.pop(sku.lower())
+                succeed(index, "updated", product_id)
+                touched["updated"].append(sku)
+                stale_ids.append(product_id)
+            for index, _ in group.values():
+                fail(index, "Product not found")
+
+        if deletes:
+            stmt = (
+                delete(table)
+                .where(self._skus_match(list(deletes)))
+                .returning(table.c.id, table.c.sku, *facet_columns)
+            )
+            for row in self.db.execute(stmt).mappings():
+                product_id, sku = row["id"], row["sku"]
+                removed_rows.append(row)
+                succeed(deletes.pop(sku.lower()), "deleted", product_id)
+                touched["deleted"].append(sku)
+                stale_ids.append(product_id)
+            for index in deletes.values():
+                fail(index, "Product not found")
+
+        response = ProductBatchResponse(
+            results=results,
+            created=len(touched["created"]),
+            updated=len(touched["updated"]),
+            deleted=len(touched["deleted"]),
+            failed=sum(1 for result in results if result.status == "failed"),
+        )
+        if any(touched.values()):
+            FacetService(self.db).apply(facet_deltas(added=added_rows, removed=removed_rows))
+            self._invalidate_catalog(*stale_ids)
+            emit_event(self.db, "product.batch", touched)
+        return response
+
+    def _invalidate_catalog(self, *product_ids: int) -> None:
+        """Invalidate cached reads once the current transaction commits."""
+
+        run_after_commit(self.db, bump_catalog_version, key="catalog_version")
+        if product_ids:
+            stale: set[int] = self.db.info.setdefault("stale_product_ids", set())
+            stale.update(product_ids)
+            run_after_commit(
+                self.db,
+                lambda: invalidate_products(self.db.info.pop("stale_product_ids", ())),
+                key="stale_product_ids",
+            )
+
+    @staticmethod
+    def _facet_row(product: Product) -> dict:
+        return {column.key: getattr(product, column.key) for column in FACET_COLUMNS}
 
-    def bulk_delete(self) -> int:
-        deleted = self.db.query(Product).delete()
-        count = deleted or 0
-        if count:
-            emit_event("product.bulk_deleted", {"count": count})
-        return count
+    def facets(self) -> ProductFacetsResponse:
+        return FacetService(self.db).summary()
 
     @staticmethod
     def _serialize(product: Product) -> dict:
-        return ProductResponse.model_validate(product).model_dump()
+        return ProductResponse.model_validate(product).model_dump(mode="json")
+
+
+class AsyncProductService:
+    """Non-blocking counterpart of ``ProductService`` for the API request path.
+
+    Reads run natively on the async session and cache. Writes reuse the synchronous
+    implementation through ``AsyncSession.run_sync`` so both paths share one set of
+    business rules; their results are serialized before leaving the sync context.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def _populates_cache(self) -> bool:
+        return not is_replica_session(self.db)
+
+    async def list_json(
+        self,
+        *,
+        page: int = 1,
+        page_size: int = 25,
+        sku: Optional[str] = None,
+        query: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        fields: Optional[list[str]] = None,
+    ) -> bytes:
+        columns = ProductService.resolve_fields(fields)
+        count_params = ProductService._count_params(sku, query, is_active)
+        params = {
+            **count_params,
+            "page": page,
+            "page_size": page_size,
+            "total_mode": total_mode.value,
+            "fields": columns,
+        }
+        key = list_key(await catalog_version_async(), filters_key(params))
+        body = await get_cached_response_async(key, "list")
+        if body is None:
+            filters = ProductService._filters(sku=sku, query=query, is_active=is_active)
+            result = await self.db.execute(ProductService._page_stmt(columns, filters, page, page_size))
+            items = [dict(item) for item in result.mappings().all()]
+            total, total_exact = await self._total(filters, count_params, total_mode)
+            body = ProductService._list_body(items, total, total_exact, page, page_size)
+            if self._populates_cache:
+                await set_cached_response_async(key, body)
+        return body
+
+    async def _total(self, filters: list, count_params: dict, mode: TotalMode) -> tuple[int | None, bool]:
+        if mode is TotalMode.NONE:
+            return None, False
+
+        if mode is TotalMode.ESTIMATED and not count_params["query"]:
+            estimate = await self._estimate_count(filters)
+            if estimate is not None:
+                return estimate, False
+
+        version = await catalog_version_async()
+        key = filters_key(count_params)
+        total = await get_cached_count_async(version, key)
+        if total is None:
+            total = await self.db.scalar(ProductService._count_stmt(filters)) or 0
+            if self._populates_cache:
+                await set_cached_count_async(version, key, total)
+        return total, True
+
+    async def _estimate_count(self, filters: list) -> int | None:
+        if not filters:
+            reltuples = await self.db.scalar(RELTUPLES_SQL, {"table": Product.__table__.fullname})
+            if reltuples is None or reltuples < 0:
+                return None
+            return int(reltuples)
+
+        connection = await self.db.connection()
+        compiled = select(Product.id).where(*filters).compile(dialect=connection.dialect)
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        return ProductService._plan_rows(result.scalar())
+
+    async def facets(self) -> ProductFacetsResponse:
+        result = await self.db.execute(FacetService.summary_stmt())
+        return FacetService.build_summary(result.all())
+
+    async def get_by_sku(self, sku: str) -> ProductResponse:
+        product = (await self.db.scalars(select(Product).where(ProductService._sku_matches(sku)))).first()
+        if not product:
+            raise NoResultFound
+        return ProductResponse.model_validate(product)
+
+    async def lookup_skus(self, skus: list[str]) -> ProductLookupResponse:
+        products = (await self.db.scalars(select(Product).where(ProductService._skus_match(skus)))).all()
+        return ProductService._lookup_response(skus, products)
+
+    async def get_json(self, product_id: int) -> bytes:
+        key = product_key(product_id)
+        body = await get_cached_response_async(key, "item")
+        if body is None:
+            product = await self.db.get(Product, product_id)
+            if not product:
+                raise NoResultFound
+            body = ProductResponse.model_validate(product).model_dump_json().encode("utf-8")
+            if self._populates_cache:
+                await set_cached_response_async(key, body)
+        return body
+
+    async def create(self, data: ProductCreate) -> ProductResponse:
+        return await self.db.run_sync(
+            lambda session: ProductResponse.model_validate(ProductService(session).create(data))
+        )
+
+    async def update(self, product_id: int, data: ProductUpdate) -> ProductResponse:
+        return await self.db.run_sync(
+            lambda session: ProductResponse.model_validate(ProductService(session).update(product_id, data))
+        )
+
+    async def delete(self, product_id: int) -> None:
+        await self.db.run_sync(lambda session: ProductService(session).delete(product_id))
+
+    async def batch(self, items: list[ProductBatchItem]) -> ProductBatchResponse:
+        return await self.db.run_sync(lambda session: ProductService(session).batch(items))
+
+    async def start_bulk_delete(self) -> BulkDeleteJobResponse:
+        return await self.db.run_sync(
+            lambda session: BulkDeleteJobResponse.model_validate(ProductService(session).start_bulk_delete())
+        )
+
+    async def get_delete_job(self, job_id: UUID | str) -> BulkDeleteJobResponse:
+        return await self.db.run_sync(
+            lambda session: BulkDeleteJobResponse.model_validate(ProductService(session).get_delete_job(job_id))
+        )
@@ -0,0 +1,88 @@
+"""Persistence and retrieval of profiling artifacts."""
+
+from __future__ import annotations
+
+import uuid
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from product_importer.core.profiling import SamplingProfiler
+from product_importer.db.session import db_session
+from product_importer.db.storage_deps import get_storage
+from product_importer.models.profile import ProfileArtifact, ProfileKind
+from product_importer.services.storage import StorageBackend
+
+
+class ProfileService:
+    def __init__(self, db: Session, storage: StorageBackend | None = None):
+        self.db = db
+        self.storage = storage
+
+    def record(
+        self,
+        kind: ProfileKind,
+        subject: str,
+        profiler: SamplingProfiler,
+        *,
+        profile_id: UUID | None = None,
+    ) -> ProfileArtifact:
+        if not self.storage:
+            raise ValueError("Storage backend is required for storing profiles")
+
+        profile_id = profile_id or uuid.uuid4()
+        storage_path = self.storage.save_bytes(
+            f"profiles/{kind.value}/{profile_id}.collapsed",
+            profiler.collapsed(),
+            content_type="text/plain",
+        )
+        artifact = ProfileArtifact(
+            id=profile_id,
+            kind=kind,
+            subject=subject[:255],
+            storage_path=storage_path,
+            samples=profiler.samples,
+            duration_ms=int(profiler.duration * 1000),
+        )
+        self.db.add(artifact)
+        self.db.flush()
+        return artifact
+
+    def list_profiles(self, *, subject: str | None = None, limit: int = 50) -> list[ProfileArtifact]:
+        stmt = select(ProfileArtifact).order_by(ProfileArtifact.created_at.desc()).limit(limit)
+        if subject:
+            stmt = stmt.where(ProfileArtifact.subject == subject)
+        return self.db.scalars(stmt).all()
+
+    def get(self, profile_id: UUID | str) -> ProfileArtifact:
+        artifact = self.db.get(ProfileArtifact, UUID(str(profile_id)))
+        if not artifact:
+            raise ValueError("Profile not found")
+        return artifact
+
+    def content(self, artifact: ProfileArtifact) -> bytes:
+        if not self.storage:
+            raise ValueError("Storage backend is required for reading profiles")
+        return self.storage.get_file_content(artifact.storage_path)
+
+
+def store_profile(
+    kind: ProfileKind,
+    subject: str,
+    profiler: SamplingProfiler,
+    *,
+    profile_id: UUID | None = None,
+) -> None:
+    """Persist a finished profile; failures are logged so they never mask the profiled work."""
+
+    profile_id = profile_id or uuid.uuid4()
+    try:
+        with db_session() as session:
+            ProfileService(session, get_storage()).record(kind, subject, profiler, profile_id=profile_id)
+        logger.info(
+            "Stored {} profile {} for {} ({} samples)", kind.value, profile_id, subject, profiler.samples
+        )
+    except Exception:
+        logger.exception("Failed to store {} profile for {}", kind.value, subject)
@@ -108,6 +108,29 @@ class S3Storage:
         s3_path = f"s3://{self.bucket_name}/{unique_name}"
         return original_name, s3_path, total_bytes
 
+    def save_bytes(self, key: str, data: bytes, *, content_type: str | None = None) -> str:
+        """Store generated content (e.g. profiling artifacts) under ``key``.
+
+        Args:
+            key: Object key within the bucket
+            data: Content to store
+            content_type: Optional MIME type
+
+        Returns:
+            S3 URI (s3://bucket/key)
+        """
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=data,
+                ContentType=content_type or "application/octet-stream",
+            )
+        except ClientError as e:
+            logger.error(f"Failed to store {key} in S3: {e}")
+            raise
+        return f"s3://{self.bucket_name}/{key}"
+
     def download_to_path(self, s3_path: str, local_path: Path) -> None:
         """Download file from S3 to local path.
 
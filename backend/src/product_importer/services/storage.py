@@ -5,11 +5,23 @@ from __future__ import annotations
 import os
 import uuid
 from pathlib import Path
-from typing import Tuple
+from typing import Protocol, Tuple
 
 from fastapi import UploadFile
 
 
+class StorageBackend(Protocol):
+    """What the app needs from a storage backend (``FileStorage`` or ``S3Storage``)."""
+
+    def save_upload(self, upload_file: UploadFile) -> Tuple[str, str, int]: ...
+
+    def save_bytes(self, key: str, data: bytes, *, content_type: str | None = None) -> str: ...
+
+    def get_file_content(self, stored_path: str) -> bytes: ...
+
+    def delete(self, stored_path: str) -> None: ...
+
+
 class FileStorage:
     """Persist uploaded files to disk safely."""
 
@@ -41,6 +53,15 @@ class FileStorage:
 
         return original_name, str(destination), total_bytes
 
+    def save_bytes(self, key: str, data: bytes, *, content_type: str | None = None) -> str:
+        destination = self.base_path / key
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(data)
+        return str(destination)
+
+    def get_file_content(self, stored_path: str) -> bytes:
+        return Path(stored_path).read_bytes()
+
     def delete(self, stored_path: str) -> None:
         try:
             os.remove(stored_path)
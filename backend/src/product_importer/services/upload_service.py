@@ -7,19 +7,21 @@ from uuid import UUID
 
 from fastapi import UploadFile
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from product_importer.models.upload_job import UploadJob, UploadStatus
 from product_importer.schemas.upload import UploadJobResponse
-from product_importer.services.storage import FileStorage
+from product_importer.services.storage import StorageBackend
 
 
 class UploadService:
-    def __init__(self, db: Session, storage: FileStorage | None = None):
+    def __init__(self, db: Session, storage: StorageBackend | None = None):
         self.db = db
         self.storage = storage
 
-    def enqueue(self, upload_file: UploadFile) -> UploadJob:
+    def enqueue(self, upload_file: UploadFile, *, profile: bool = False) -> UploadJob:
         if not self.storage:
             raise ValueError("Storage backend is required for enqueueing uploads")
 
@@ -42,7 +44,7 @@ class UploadService:
         self.db.flush()
         self.db.commit()
 
-        ingest_products_from_csv.delay(str(job.id))
+        ingest_products_from_csv.delay(str(job.id), profile=profile)
 
         return job
 
@@ -64,3 +66,45 @@ class UploadService:
     @staticmethod
     def serialize_many(jobs: Iterable[UploadJob]) -> list[UploadJobResponse]:
         return [UploadJobResponse.model_validate(job) for job in jobs]
+
+
+class AsyncUploadService:
+    """Upload orchestration for the async API path.
+
+    Storage writes and broker publishes are blocking client calls, so they run in the
+    threadpool while database work stays on the event loop.
+    """
+
+    def __init__(self, db: AsyncSession, storage: StorageBackend | None = None):
+        self.db = db
+        self.storage = storage
+
+    async def enqueue(self, upload_file: UploadFile, *, profile: bool = False) -> UploadJob:
+        if not self.storage:
+            raise ValueError("Storage backend is required for enqueueing uploads")
+
+        original_name, stored_path, _ = await run_in_threadpool(self.storage.save_upload, upload_file)
+
+        job = UploadJob(
+            filename=original_name,
+            storage_path=stored_path,
+            status=UploadStatus.QUEUED,
+            processed_rows=0,
+        )
+        self.db.add(job)
+        await self.db.commit()
+
+        from product_importer.workers.tasks.ingestion import ingest_products_from_csv
+
+        await run_in_threadpool(ingest_products_from_csv.delay, str(job.id), profile=profile)
+        return job
+
+    async def get_job(self, job_id: UUID | str) -> UploadJob:
+        job = await self.db.get(UploadJob, UUID(str(job_id)))
+        if not job:
+            raise ValueError("Upload job not found")
+        return job
+
+    async def list_jobs(self, limit: int = 50) -> list[UploadJob]:
+        stmt = select(UploadJob).order_by(UploadJob.created_at.desc()).limit(limit)
+        return (await self.db.scalars(stmt)).all()
@@ -0,0 +1,193 @@
+"""Per-webhook circuit breakers and rate limits shared through Redis.
+
+A webhook whose deliveries keep failing has its circuit opened: deliveries to it
+are held back without a network call until a cooldown passes, after which a single
+probe is let through (half-open). A successful probe closes the circuit; a failed
+one opens it again. Independently, a token bucket caps the delivery rate per
+webhook. Held-back deliveries are queued as retries that do not consume an attempt.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Iterable
+from uuid import UUID
+
+import redis
+from loguru import logger
+
+from product_importer.core.config import get_settings
+from product_importer.core.redis import get_redis
+
+settings = get_settings()
+
+# KEYS: breaker hash, bucket hash. ARGV: cooldown seconds, rate per second, burst.
+# Returns {verdict, seconds until the caller should try again}.
+_ADMIT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local cooldown = tonumber(ARGV[1])
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+if state == 'open' then
+    local opened = tonumber(redis.call('HGET', KEYS[1], 'opened_at') or '0')
+    if now < opened + cooldown then
+        redis.call('HINCRBY', KEYS[1], 'short_circuited', 1)
+        return {'open', tostring(opened + cooldown - now)}
+    end
+    redis.call('HSET', KEYS[1], 'state', 'half_open', 'probe_at', tostring(now))
+elseif state == 'half_open' then
+    -- Only one probe at a time; a probe that never reports back expires after a cooldown.
+    local probe_at = tonumber(redis.call('HGET', KEYS[1], 'probe_at') or '0')
+    if now < probe_at + cooldown then
+        redis.call('HINCRBY', KEYS[1], 'short_circuited', 1)
+        return {'open', tostring(probe_at + cooldown - now)}
+    end
+    redis.call('HSET', KEYS[1], 'probe_at', tostring(now))
+end
+local rate = tonumber(ARGV[2])
+if rate > 0 then
+    local burst = tonumber(ARGV[3])
+    local tokens = tonumber(redis.call('HGET', KEYS[2], 'tokens') or burst)
+    local updated = tonumber(redis.call('HGET', KEYS[2], 'updated_at') or now)
+    tokens = math.min(burst, tokens + (now - updated) * rate)
+    if tokens < 1 then
+        redis.call('HSET', KEYS[2], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+        redis.call('HINCRBY', KEYS[1], 'throttled', 1)
+        return {'throttled', tostring((1 - tokens) / rate)}
+    end
+    redis.call('HSET', KEYS[2], 'tokens', tostring(tokens - 1), 'updated_at', tostring(now))
+    redis.call('EXPIRE', KEYS[2], math.ceil(burst / rate) + 60)
+end
+return {'allow', '0'}
+"""
+
+# KEYS: breaker hash. ARGV: '1' on success, failure threshold.
+_REPORT = """
+if ARGV[1] == '1' then
+    redis.call('HSET', KEYS[1], 'state', 'closed', 'failures', 0)
+    return 'closed'
+end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+if state == 'half_open' or failures >= tonumber(ARGV[2]) then
+    redis.call('HSET', KEYS[1], 'state', 'open', 'opened_at', tostring(now))
+    return 'open'
+end
+return state
+"""
+
+
+@dataclass(frozen=True)
+class Admission:
+    allowed: bool
+    reason: str | None = None
+    retry_after: float = 0.0
+
+
+ALLOW = Admission(allowed=True)
+
+
+@dataclass(frozen=True)
+class CircuitStatus:
+    state: str
+    consecutive_failures: int
+    opened_at: datetime | None
+    short_circuited: int
+    throttled: int
+
+
+def _breaker_key(webhook_id: UUID) -> str:
+    return f"webhooks:breaker:{webhook_id}"
+
+
+def _bucket_key(webhook_id: UUID) -> str:
+    return f"webhooks:bucket:{webhook_id}"
+
+
+class WebhookGuard:
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._admit = client.register_script(_ADMIT)
+        self._report = client.register_script(_REPORT)
+
+    def admit(self, webhook_ids: Iterable[UUID]) -> list[Admission]:
+        """Decide, in one Redis round trip, which deliveries may be made now.
+
+        Returns one admission per id in order; an id may repeat when several
+        deliveries go to the same webhook. Fails open: if Redis is unavailable every
+        delivery is allowed.
+        """
+
+        ids = list(webhook_ids)
+        if not ids:
+            return []
+        pipe = self.client.pipeline(transaction=False)
+        for webhook_id in ids:
+            self._admit(
+                keys=[_breaker_key(webhook_id), _bucket_key(webhook_id)],
+                args=[
+                    settings.webhook_breaker_cooldown_seconds,
+                    settings.webhook_rate_limit_per_second,
+                    settings.webhook_rate_limit_burst,
+                ],
+                client=pipe,
+            )
+        try:
+            replies = pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning("Webhook guard unavailable, allowing all deliveries: {}", exc)
+            return [ALLOW] * len(ids)
+
+        admissions = []
+        for verdict, retry_after in replies:
+            verdict = verdict.decode() if isinstance(verdict, bytes) else verdict
+            if verdict == "allow":
+                admissions.append(ALLOW)
+            else:
+                reason = "circuit open" if verdict == "open" else "rate limited"
+                admissions.append(Admission(False, reason, float(retry_after)))
+        return admissions
+
+    def report(self, outcomes: Iterable[tuple[UUID, bool]]) -> None:
+        """Feed (webhook id, succeeded) delivery outcomes back into the breakers."""
+
+        outcomes = list(outcomes)
+        if not outcomes:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for webhook_id, succeeded in outcomes:
+            self._report(
+                keys=[_breaker_key(webhook_id)],
+                args=["1" if succeeded else "0", settings.webhook_breaker_failure_threshold],
+                client=pipe,
+            )
+        try:
+            pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning("Failed to report webhook outcomes: {}", exc)
+
+    def status(self, webhook_id: UUID) -> CircuitStatus:
+        raw = {key.decode(): value.decode() for key, value in self.client.hgetall(_breaker_key(webhook_id)).items()}
+        state = raw.get("state", "closed")
+        opened_at = None
+        if state != "closed" and raw.get("opened_at"):
+            opened_at = datetime.fromtimestamp(float(raw["opened_at"]), tz=timezone.utc)
+        return CircuitStatus(
+            state=state,
+            consecutive_failures=int(raw.get("failures", 0)),
+            opened_at=opened_at,
+            short_circuited=int(raw.get("short_circuited", 0)),
+            throttled=int(raw.get("throttled", 0)),
+        )
+
+    def reset(self, webhook_id: UUID) -> None:
+        self.client.delete(_breaker_key(webhook_id), _bucket_key(webhook_id))
+
+
+@lru_cache
+def webhook_guard() -> WebhookGuard:
+    return WebhookGuard(get_redis())
@@ -2,25 +2,51 @@
 
 from __future__ import annotations
 
-import httpx
+import random
+from datetime import datetime, timedelta, timezone
 from typing import Iterable
 from uuid import UUID
 
-from sqlalchemy import desc, select
+import httpx
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from product_importer.core.config import get_settings
-from product_importer.models.webhook import Webhook, WebhookDelivery
+from product_importer.db.session import run_after_commit
+from product_importer.models.webhook import Webhook, WebhookDelivery, WebhookRetry
 from product_importer.schemas.webhook import (
+    WebhookCircuitResponse,
     WebhookCreate,
     WebhookDeliveryResponse,
     WebhookResponse,
     WebhookUpdate,
 )
+from product_importer.services.webhook_guard import webhook_guard
+from product_importer.services.webhook_subscriptions import publish_subscriptions_changed
 
 settings = get_settings()
 
 
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait after ``attempts`` failed deliveries.
+
+    The delay doubles with every failure up to a cap; half of it is randomized so
+    retries for a subscriber that failed many deliveries at once are spread out.
+    """
+
+    ceiling = min(
+        settings.webhook_retry_max_backoff_seconds,
+        settings.webhook_retry_base_seconds * 2 ** (attempts - 1),
+    )
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def _subscriptions_changed(session: Session) -> None:
+    run_after_commit(session, publish_subscriptions_changed, key="webhooks:subscriptions")
+
+
 class WebhookService:
     def __init__(self, db: Session):
         self.db = db
@@ -36,22 +62,25 @@ class WebhookService:
         return webhook
 
     def create(self, payload: WebhookCreate) -> Webhook:
-        webhook = Webhook(**payload.model_dump())
+        webhook = Webhook(**payload.model_dump(mode="json"))
         self.db.add(webhook)
         self.db.flush()
+        _subscriptions_changed(self.db)
         return webhook
 
     def update(self, webhook_id: UUID, payload: WebhookUpdate) -> Webhook:
         webhook = self.get(webhook_id)
-        for key, value in payload.model_dump(exclude_unset=True).items():
+        for key, value in payload.model_dump(mode="json", exclude_unset=True).items():
             setattr(webhook, key, value)
         self.db.add(webhook)
         self.db.flush()
+        _subscriptions_changed(self.db)
         return webhook
 
     def delete(self, webhook_id: UUID) -> None:
         webhook = self.get(webhook_id)
         self.db.delete(webhook)
+        _subscriptions_changed(self.db)
 
     def list_deliveries(self, webhook_id: UUID, limit: int = 25) -> list[WebhookDelivery]:
         stmt = (
@@ -66,40 +95,79 @@ class WebhookService:
         stmt = select(Webhook).where(Webhook.event == event, Webhook.is_enabled.is_(True))
         return self.db.scalars(stmt).all()
 
-    def record_delivery(
+    def schedule_retry(
         self,
-        webhook: Webhook,
+        webhook_id: UUID,
         *,
         event: str,
         payload: dict,
-        response_code: int | None,
-        response_time_ms: int | None,
-        response_body: str | None,
-        status: str,
-    ) -> WebhookDelivery:
-        delivery = WebhookDelivery(
-            webhook_id=webhook.id,
-            event=event,
-            payload=payload,
-            response_code=response_code,
-            response_time_ms=response_time_ms,
-            response_body=response_body,
-            status=status,
+        error: str | None,
+        attempts: int = 1,
+        delay: float | None = None,
+    ) -> None:
+        """Queue a delivery for a later attempt.
+
+        ``attempts`` is the number of failed attempts so far; deliveries held back
+        before any attempt pass 0 and are queued even when retries are disabled.
+        """
+
+        if attempts and settings.webhook_max_retries <= 0:
+            return
+        if delay is None:
+            delay = retry_delay(attempts)
+        self.db.add(
+            WebhookRetry(
+                webhook_id=webhook_id,
+                event=event,
+                payload=payload,
+                attempts=attempts,
+                next_attempt_at=datetime.now(timezone.utc) + timedelta(seconds=delay),
+                last_error=error,
+            )
         )
-        self.db.add(delivery)
-        self.db.flush()
-        return delivery
 
-    async def test_webhook(self, webhook_id: UUID) -> dict:
-        webhook = self.get(webhook_id)
-        async with httpx.AsyncClient(timeout=settings.webhook_request_timeout) as client:
-            response = await client.post(webhook.target_url, json={"event": webhook.event, "test": True})
-        return {
-            "status": "ok" if response.is_success else "failed",
-            "response_code": response.status_code,
-            "response_time_ms": int(response.elapsed.total_seconds() * 1000),
-            "response_body": response.text,
-        }
+    def defer_retry(self, retry: WebhookRetry, delay: float, reason: str | None) -> None:
+        """Push a retry back without counting an attempt, e.g. while its circuit is open."""
+
+        retry.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        retry.last_error = reason
+        self.db.add(retry)
+
+    def claim_due_retries(self, limit: int) -> list[tuple[WebhookRetry, Webhook]]:
+        """Lease up to ``limit`` due retries; rows held by another sweeper are skipped.
+
+        Each claimed retry's next attempt is pushed ``webhook_retry_lease_seconds``
+        out, so once the caller commits, other sweepers leave it alone while it is
+        delivered outside any transaction. Retries of a sweeper that dies before
+        recording the outcome come due again when the lease runs out.
+        """
+
+        stmt = (
+            select(WebhookRetry, Webhook)
+            .join(Webhook, Webhook.id == WebhookRetry.webhook_id)
+            .where(WebhookRetry.next_attempt_at <= func.now())
+            .order_by(WebhookRetry.next_attempt_at)
+            .limit(limit)
+            .with_for_update(of=WebhookRetry, skip_locked=True)
+        )
+        claimed = [tuple(row) for row in self.db.execute(stmt).all()]
+        leased_until = datetime.now(timezone.utc) + timedelta(seconds=settings.webhook_retry_lease_seconds)
+        for retry, _ in claimed:
+            retry.next_attempt_at = leased_until
+            self.db.add(retry)
+        return claimed
+
+    def retry_failed(self, retry: WebhookRetry, error: str | None) -> bool:
+        """Record another failed attempt; returns False once retries are exhausted."""
+
+        retry.attempts += 1
+        if retry.attempts > settings.webhook_max_retries:
+            self.db.delete(retry)
+            return False
+        retry.last_error = error
+        retry.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(retry.attempts))
+        self.db.add(retry)
+        return True
 
     @staticmethod
     def serialize(webhook: Webhook) -> WebhookResponse:
@@ -112,3 +180,74 @@ class WebhookService:
     @staticmethod
     def serialize_deliveries(deliveries: Iterable[WebhookDelivery]) -> list[WebhookDeliveryResponse]:
         return [WebhookDeliveryResponse.model_validate(delivery) for delivery in deliveries]
+
+
+class AsyncWebhookService:
+    """Webhook management for the async API path."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_webhooks(self) -> list[Webhook]:
+        stmt = select(Webhook).order_by(Webhook.created_at.desc())
+        return (await self.db.scalars(stmt)).all()
+
+    async def get(self, webhook_id: UUID) -> Webhook:
+        webhook = await self.db.get(Webhook, webhook_id)
+        if not webhook:
+            raise ValueError("Webhook not found")
+        return webhook
+
+    async def create(self, payload: WebhookCreate) -> Webhook:
+        webhook = Webhook(**payload.model_dump(mode="json"))
+        self.db.add(webhook)
+        await self.db.flush()
+        # Load server-generated timestamps so serialization never lazy-loads.
+        await self.db.refresh(webhook)
+        _subscriptions_changed(self.db.sync_session)
+        return webhook
+
+    async def update(self, webhook_id: UUID, payload: WebhookUpdate) -> Webhook:
+        webhook = await self.get(webhook_id)
+        for key, value in payload.model_dump(mode="json", exclude_unset=True).items():
+            setattr(webhook, key, value)
+        self.db.add(webhook)
+        await self.db.flush()
+        await self.db.refresh(webhook)
+        _subscriptions_changed(self.db.sync_session)
+        return webhook
+
+    async def delete(self, webhook_id: UUID) -> None:
+        webhook = await self.get(webhook_id)
+        await self.db.delete(webhook)
+        _subscriptions_changed(self.db.sync_session)
+
+    async def list_deliveries(self, webhook_id: UUID, limit: int = 25) -> list[WebhookDelivery]:
+        stmt = (
+            select(WebhookDelivery)
+            .where(WebhookDelivery.webhook_id == webhook_id)
+            .order_by(desc(WebhookDelivery.created_at))
+            .limit(limit)
+        )
+        return (await self.db.scalars(stmt)).all()
+
+    async def circuit(self, webhook_id: UUID) -> WebhookCircuitResponse:
+        webhook = await self.get(webhook_id)
+        status = await run_in_threadpool(webhook_guard().status, webhook.id)
+        return WebhookCircuitResponse.model_validate(status)
+
+    async def reset_circuit(self, webhook_id: UUID) -> WebhookCircuitResponse:
+        webhook = await self.get(webhook_id)
+        await run_in_threadpool(webhook_guard().reset, webhook.id)
+        return await self.circuit(webhook_id)
+
+    async def test_webhook(self, webhook_id: UUID) -> dict:
+        webhook = await self.get(webhook_id)
+        async with httpx.AsyncClient(timeout=settings.webhook_request_timeout) as client:
+            response = await client.post(webhook.target_url, json={"event": webhook.event, "test": True})
+        return {
+            "status": "ok" if response.is_success else "failed",
+            "response_code": response.status_code,
+            "response_time_ms": int(response.elapsed.total_seconds() * 1000),
+            "response_body": response.text,
+        }
@@ -0,0 +1,144 @@
+"""Webhook delivery statistics backed by per-minute latency rollups."""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter, defaultdict
+from datetime import timedelta
+from typing import Any, Iterable, Mapping
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from product_importer.models.webhook import WebhookLatencyRollup
+from product_importer.schemas.webhook import WebhookFleetStatsResponse, WebhookStatsResponse
+
+# Histogram bucket upper bounds in milliseconds; the last bucket catches everything.
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+OVERFLOW_BUCKET_MS = 2**31 - 1
+
+
+def latency_bucket(elapsed_ms: int | None) -> int:
+    index = bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms or 0)
+    return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else OVERFLOW_BUCKET_MS
+
+
+def record_rollups(db: Session, entries: Iterable[Mapping[str, Any]]) -> None:
+    """Fold logged deliveries into the current minute's rollup rows."""
+
+    totals: dict[tuple[UUID, int], Counter] = defaultdict(Counter)
+    for entry in entries:
+        elapsed = entry.get("response_time_ms") or 0
+        bucket = totals[(entry["webhook_id"], latency_bucket(elapsed))]
+        bucket["deliveries"] += 1
+        bucket["successes"] += entry["status"] == "success"
+        bucket["total_ms"] += elapsed
+    if not totals:
+        return
+
+    table = WebhookLatencyRollup.__table__
+    minute = func.date_trunc("minute", func.now())
+    # Sorted so concurrent writers lock rollup rows in the same order.
+    stmt = pg_insert(table).values(
+        [
+            {"webhook_id": webhook_id, "minute": minute, "le_ms": le_ms, **counts}
+            for (webhook_id, le_ms), counts in sorted(totals.items())
+        ]
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.webhook_id, table.c.minute, table.c.le_ms],
+            set_={
+                "deliveries": table.c.deliveries + stmt.excluded.deliveries,
+                "successes": table.c.successes + stmt.excluded.successes,
+                "total_ms": table.c.total_ms + stmt.excluded.total_ms,
+            },
+        )
+    )
+
+
+def prune_rollups(db: Session, retention_days: int) -> None:
+    cutoff = func.now() - timedelta(days=retention_days)
+    db.execute(delete(WebhookLatencyRollup).where(WebhookLatencyRollup.minute < cutoff))
+
+
+def _percentile(histogram: list[tuple[int, int]], total: int, fraction: float) -> int | None:
+    """Upper bound of the bucket holding the given fraction of deliveries."""
+
+    if not total:
+        return None
+    target = fraction * total
+    seen = 0
+    for le_ms, count in histogram:
+        seen += count
+        if seen >= target:
+            # Overflow deliveries are reported at the largest bound we can vouch for.
+            return min(le_ms, LATENCY_BUCKETS_MS[-1])
+    return LATENCY_BUCKETS_MS[-1]
+
+
+def build_stats(
+    webhook_id: UUID | None, window_minutes: int, rows: Iterable[tuple[int, int, int, int]]
+) -> WebhookStatsResponse:
+    """Summarize (le_ms, deliveries, successes, total_ms) rows for one window."""
+
+    histogram: Counter = Counter()
+    deliveries = successes = total_ms = 0
+    for le_ms, count, succeeded, elapsed in rows:
+        histogram[le_ms] += count
+        deliveries += count
+        successes += succeeded
+        total_ms += elapsed
+    ordered = sorted(histogram.items())
+    return WebhookStatsResponse(
+        webhook_id=webhook_id,
+        window_minutes=window_minutes,
+        deliveries=deliveries,
+        successes=successes,
+        success_rate=successes / deliveries if deliveries else None,
+        throughput_per_minute=deliveries / window_minutes,
+        avg_ms=total_ms / deliveries if deliveries else None,
+        p50_ms=_percentile(ordered, deliveries, 0.50),
+        p95_ms=_percentile(ordered, deliveries, 0.95),
+        p99_ms=_percentile(ordered, deliveries, 0.99),
+    )
+
+
+class AsyncWebhookStatsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _window_stmt(self, window_minutes: int):
+        rollup = WebhookLatencyRollup
+        return (
+            select(
+                rollup.webhook_id,
+                rollup.le_ms,
+                func.sum(rollup.deliveries),
+                func.sum(rollup.successes),
+                func.sum(rollup.total_ms),
+            )
+            # The current, still filling minute counts as one of the window's minutes.
+            .where(
+                rollup.minute >= func.date_trunc("minute", func.now()) - timedelta(minutes=window_minutes - 1)
+            )
+            .group_by(rollup.webhook_id, rollup.le_ms)
+        )
+
+    async def webhook_stats(self, webhook_id: UUID, window_minutes: int) -> WebhookStatsResponse:
+        stmt = self._window_stmt(window_minutes).where(WebhookLatencyRollup.webhook_id == webhook_id)
+        rows = (await self.db.execute(stmt)).all()
+        return build_stats(webhook_id, window_minutes, (tuple(row[1:]) for row in rows))
+
+    async def fleet_stats(self, window_minutes: int) -> WebhookFleetStatsResponse:
+        rows = (await self.db.execute(self._window_stmt(window_minutes))).all()
+        per_webhook: dict[UUID, list[tuple]] = defaultdict(list)
+        for row in rows:
+            per_webhook[row[0]].append(tuple(row[1:]))
+        webhooks = [build_stats(webhook_id, window_minutes, items) for webhook_id, items in per_webhook.items()]
+        webhooks.sort(key=lambda stats: (stats.p95_ms or 0, stats.deliveries), reverse=True)
+        overall = build_stats(None, window_minutes, (tuple(row[1:]) for row in rows))
+        return WebhookFleetStatsResponse(overall=overall, webhooks=webhooks)
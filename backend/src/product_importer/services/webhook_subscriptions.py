@@ -0,0 +1,128 @@
+"""In-process index of which webhooks subscribe to which events.
+
+Webhook configuration changes rarely while events are emitted constantly, so each
+process keeps the enabled subscriptions in memory. Committed configuration changes
+publish a Redis message that every process listens for, and a TTL bounds staleness
+if a message is missed.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import defaultdict
+
+import redis
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from product_importer.core.config import get_settings
+from product_importer.core.redis import get_redis
+from product_importer.db.session import SessionLocal
+from product_importer.models.webhook import Webhook
+from product_importer.services.webhook_dispatcher import WebhookTarget
+
+settings = get_settings()
+
+SUBSCRIPTIONS_CHANNEL = "webhooks:subscriptions"
+
+
+class SubscriptionIndex:
+    def __init__(self, ttl_seconds: int = settings.webhook_subscription_ttl_seconds):
+        self.ttl_seconds = ttl_seconds
+        self._targets: dict[str, tuple[WebhookTarget, ...]] | None = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._listener: threading.Thread | None = None
+
+    def targets_for(self, event: str, session: Session | None = None) -> tuple[WebhookTarget, ...]:
+        """Enabled webhooks subscribed to ``event``.
+
+        An expired index is reloaded through ``session`` when one is given: inside
+        ``AsyncSession.run_sync`` that query runs on the async connection, so the API
+        event loop never blocks on it. One caller reloads at a time; while it does,
+        others keep serving the previous snapshot.
+        """
+
+        self._ensure_listener()
+        if time.monotonic() >= self._expires_at:
+            if self._reload_lock.acquire(blocking=False):
+                try:
+                    # Another caller may have reloaded since we checked.
+                    if time.monotonic() >= self._expires_at:
+                        self._reload(session)
+                finally:
+                    self._reload_lock.release()
+            elif self._targets is None:
+                self._reload(session)
+        return (self._targets or {}).get(event, ())
+
+    def has_subscribers(self, event: str, session: Session | None = None) -> bool:
+        return bool(self.targets_for(event, session))
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+    def _reload(self, session: Session | None) -> None:
+        stmt = select(Webhook).where(Webhook.is_enabled.is_(True))
+        if session is None:
+            with SessionLocal() as own_session:
+                hooks = own_session.scalars(stmt).all()
+        else:
+            hooks = session.scalars(stmt).all()
+        grouped: dict[str, list[WebhookTarget]] = defaultdict(list)
+        for hook in hooks:
+            grouped[hook.event].append(WebhookTarget.from_model(hook))
+        self._targets = {event: tuple(targets) for event, targets in grouped.items()}
+        self._expires_at = time.monotonic() + self.ttl_seconds
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or not self._listener.is_alive():
+            with self._lock:
+                if self._listener is None or not self._listener.is_alive():
+                    self._listener = threading.Thread(
+                        target=self._listen, name="webhook-subscriptions", daemon=True
+                    )
+                    self._listener.start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                # A dedicated connection: the shared client's short socket timeout
+                # would keep interrupting the blocking subscription.
+                client = redis.Redis.from_url(settings.redis_url, health_check_interval=30)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(SUBSCRIPTIONS_CHANNEL)
+                # Changes may have been published while we were not subscribed.
+                self.invalidate()
+                for _ in pubsub.listen():
+                    self.invalidate()
+            except redis.RedisError as exc:
+                logger.warning("Webhook subscription listener disconnected: {}", exc)
+                time.sleep(5)
+
+
+def publish_subscriptions_changed() -> None:
+    """Tell every process to reload its subscription index."""
+
+    try:
+        get_redis().publish(SUBSCRIPTIONS_CHANNEL, b"changed")
+    except redis.RedisError as exc:
+        logger.warning("Failed to publish webhook subscription change: {}", exc)
+
+
+_index: SubscriptionIndex | None = None
+_index_pid: int | None = None
+
+
+def subscriptions() -> SubscriptionIndex:
+    """This process's subscription index; a forked child builds its own."""
+
+    global _index, _index_pid
+    if _index is None or _index_pid != os.getpid():
+        _index = SubscriptionIndex()
+        _index_pid = os.getpid()
+    return _index
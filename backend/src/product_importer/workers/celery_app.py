@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from celery import Celery
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
 
 from product_importer.core.config import get_settings
+from product_importer.core.metrics import mark_process_dead, start_worker_exporter
+from product_importer.db.session import reset_engines
 
 settings = get_settings()
 
@@ -13,6 +16,9 @@ celery_app = Celery(
     broker=settings.celery_broker_url or settings.redis_url,
     backend=settings.celery_result_backend or settings.redis_url,
 )
+# The current app is thread-local; without a default, shared tasks sent from threadpool
+# threads (as the async API does) would resolve to Celery's unconfigured fallback app.
+celery_app.set_default()
 
 celery_app.conf.update(
     task_track_started=True,
@@ -22,8 +28,46 @@ celery_app.conf.update(
     accept_content=["json"],
     timezone="UTC",
     enable_utc=True,
+    beat_schedule={
+        "fold-catalog-facets": {
+            "task": "fold_catalog_facets",
+            "schedule": settings.facet_fold_interval_seconds,
+        },
+        "rebuild-catalog-facets": {
+            "task": "rebuild_catalog_facets",
+            "schedule": settings.facet_rebuild_interval_seconds,
+        },
+        "relay-outbox-events": {
+            "task": "relay_outbox_events",
+            "schedule": settings.outbox_relay_interval_seconds,
+        },
+        "maintain-delivery-logs": {
+            "task": "maintain_delivery_logs",
+            "schedule": settings.webhook_log_maintenance_interval_seconds,
+        },
+        "retry-webhook-deliveries": {
+            "task": "retry_webhook_deliveries",
+            "schedule": settings.webhook_retry_sweep_interval_seconds,
+        },
+    },
 )
 
 celery_app.autodiscover_tasks(["product_importer.workers.tasks"])
 
+
+@worker_init.connect
+def _start_metrics_exporter(**_) -> None:
+    start_worker_exporter()
+
+
+@worker_process_init.connect
+def _reset_database_pools(**_) -> None:
+    # Pooled sockets must never be shared with the parent or sibling children.
+    reset_engines(pool_size=settings.worker_db_pool_size, max_overflow=settings.worker_db_max_overflow)
+
+
+@worker_process_shutdown.connect
+def _release_process_metrics(pid=None, **_) -> None:
+    mark_process_dead(pid)
+
 __all__ = ["celery_app"]
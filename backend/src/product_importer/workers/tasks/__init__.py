@@ -1,9 +1,17 @@
 """Celery task namespace with explicit imports for autodiscovery."""
 
+from .bulk_delete import bulk_delete_products
+from .facets import rebuild_catalog_facets
 from .ingestion import ingest_products_from_csv
-from .webhooks import dispatch_webhook_event
+from .outbox import relay_outbox_events
+from .webhooks import dispatch_webhook_event, maintain_delivery_logs, retry_webhook_deliveries
 
 __all__ = [
+    "bulk_delete_products",
     "ingest_products_from_csv",
+    "maintain_delivery_logs",
     "dispatch_webhook_event",
+    "rebuild_catalog_facets",
+    "relay_outbox_events",
+    "retry_webhook_deliveries",
 ]
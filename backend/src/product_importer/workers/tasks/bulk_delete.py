@@ -0,0 +1,161 @@
+"""Background catalog wipe task."""
+
+from __future__ import annotations
+
+import time
+
+from celery import shared_task
+from loguru import logger
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from product_importer.core.config import get_settings
+from product_importer.db.session import SessionLocal
+from product_importer.models.delete_job import DeleteJobStatus, ProductDeleteJob
+from product_importer.models.product import Product
+from product_importer.models.upload_job import UploadJob
+from product_importer.services.admission import active_upload_filter
+from product_importer.services.catalog_cache import (
+    bump_catalog_version,
+    invalidate_products,
+    purge_product_cache,
+)
+from product_importer.services.events import emit_event
+from product_importer.services.facet_service import FACET_COLUMNS, FacetService, facet_deltas
+from product_importer.services.product_service import RELTUPLES_SQL
+
+settings = get_settings()
+
+
+def _ingestion_running(session: Session) -> bool:
+    stmt = select(UploadJob.id).where(active_upload_filter()).limit(1)
+    return session.scalar(stmt) is not None
+
+
+def _estimated_rows(session: Session) -> int:
+    """Product count from planner statistics, counted exactly only if never analyzed."""
+
+    reltuples = session.scalar(RELTUPLES_SQL, {"table": Product.__table__.fullname})
+    if reltuples is None or reltuples < 0:
+        return session.scalar(select(func.count()).select_from(Product)) or 0
+    return int(reltuples)
+
+
+def _truncate(session: Session, job: ProductDeleteJob) -> bool:
+    """Wipe the table with TRUNCATE unless an import is writing to it.
+
+    The table lock is taken before ingestion is checked, so an import that starts
+    afterwards waits for the wipe to commit instead of losing rows it already wrote.
+    TRUNCATE reports no row count, so the totals are the planner's estimate.
+    """
+
+    total = _estimated_rows(session)
+    try:
+        # TRUNCATE needs an ACCESS EXCLUSIVE lock; queueing for it would stall every
+        # reader behind us, so bail out to batched deletes instead of waiting.
+        session.execute(text(f"SET LOCAL lock_timeout = {int(settings.bulk_delete_lock_timeout_ms)}"))
+        session.execute(text(f"LOCK TABLE {Product.__table__.fullname} IN ACCESS EXCLUSIVE MODE"))
+    except OperationalError:
+        session.rollback()
+        logger.info("TRUNCATE lock not available for job {}; deleting in batches", job.id)
+        return False
+    if _ingestion_running(session):
+        session.rollback()
+        logger.info("Ingestion running during job {}; deleting in batches", job.id)
+        return False
+
+    session.execute(text(f"TRUNCATE TABLE {Product.__table__.fullname}"))
+    FacetService(session).reset()
+    job.strategy = "truncate"
+    job.total_rows = total
+    job.deleted_rows = total
+    session.add(job)
+    session.commit()
+    bump_catalog_version()
+    return True
+
+
+def _delete_in_batches(session: Session, job: ProductDeleteJob) -> None:
+    """Delete rows by primary-key range, committing and reporting after each batch.
+
+    Only rows that existed when the job started are removed; products created while
+    it runs get ids above the captured upper bound and are left alone.
+    """
+
+    lower, upper = session.execute(select(func.min(Product.id), func.max(Product.id))).one()
+    job.strategy = "batched"
+    job.total_rows = _estimated_rows(session)
+    session.add(job)
+    session.commit()
+    if lower is None:
+        return
+
+    table = Product.__table__
+    batch_size = settings.bulk_delete_batch_size
+    throttle = settings.bulk_delete_throttle_ms / 1000
+    cursor = lower
+    while cursor <= upper:
+        stmt = (
+            delete(table)
+            .where(table.c.id >= cursor, table.c.id < min(cursor + batch_size, upper + 1))
+            .returning(table.c.id, *(table.c[column.key] for column in FACET_COLUMNS))
+        )
+        deleted = session.execute(stmt).mappings().all()
+        deleted_ids = [row["id"] for row in deleted]
+        FacetService(session).apply(facet_deltas(removed=deleted))
+        job.deleted_rows += len(deleted_ids)
+        session.add(job)
+        session.commit()
+        if deleted_ids:
+            invalidate_products(deleted_ids)
+            bump_catalog_version()
+        cursor += batch_size
+        if throttle:
+            time.sleep(throttle)
+
+
+@shared_task(bind=True, max_retries=3, name="bulk_delete_products")
+def bulk_delete_products(self, job_id: str) -> None:
+    session: Session = SessionLocal()
+    try:
+        job = session.get(ProductDeleteJob, job_id)
+        if not job:
+            logger.error("Bulk delete job {} not found", job_id)
+            return
+
+        job.status = DeleteJobStatus.RUNNING
+        job.error = None
+        # Progress is per attempt: rows removed by a failed attempt are already gone.
+        job.strategy = None
+        job.total_rows = None
+        job.deleted_rows = 0
+        session.add(job)
+        session.commit()
+
+        if not _truncate(session, job):
+            _delete_in_batches(session, job)
+
+        job.status = DeleteJobStatus.COMPLETED
+        session.add(job)
+        if job.deleted_rows:
+            emit_event(session, "product.bulk_deleted", {"count": job.deleted_rows})
+        session.commit()
+        purge_product_cache()
+        logger.info("Bulk delete job {} removed {} rows ({})", job_id, job.deleted_rows, job.strategy)
+
+    except Exception as exc:
+        session.rollback()
+        logger.exception("Failed bulk delete job {}", job_id)
+        retrying = self.request.retries < self.max_retries
+        job = session.get(ProductDeleteJob, job_id)
+        if job:
+            job.status = DeleteJobStatus.RETRYING if retrying else DeleteJobStatus.FAILED
+            job.error = str(exc)[:900]
+            session.add(job)
+            session.commit()
+        if not retrying:
+            raise
+        raise self.retry(exc=exc, countdown=10)
+    finally:
+        session.close()
@@ -0,0 +1,31 @@
+"""Periodic catalog facet maintenance."""
+
+from __future__ import annotations
+
+from celery import shared_task
+from loguru import logger
+
+from product_importer.db.session import db_session
+from product_importer.services.facet_service import FacetService
+
+
+@shared_task(name="fold_catalog_facets")
+def fold_catalog_facets() -> None:
+    """Fold the deltas appended by writers into the facet summary table."""
+
+    with db_session() as session:
+        buckets = FacetService(session).fold()
+    if buckets:
+        logger.debug("Folded facet deltas into {} buckets", buckets)
+
+
+@shared_task(name="rebuild_catalog_facets")
+def rebuild_catalog_facets() -> None:
+    """Recount facets from scratch to correct drift from concurrent incremental updates."""
+
+    with db_session() as session:
+        rebuilt = FacetService(session).rebuild()
+    if rebuilt:
+        logger.info("Catalog facets rebuilt")
+    else:
+        logger.info("Catalog facet rebuild skipped while facets were being folded")
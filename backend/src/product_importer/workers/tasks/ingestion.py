@@ -3,40 +3,129 @@
 from __future__ import annotations
 
 import csv
+import io
+import time
 import uuid
+from contextlib import contextmanager
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Iterator
 
 from celery import shared_task
 from loguru import logger
+from sqlalchemy import any_, cast, select
+from sqlalchemy.dialects.postgresql import ARRAY, CITEXT
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from product_importer.core.config import get_settings
+from product_importer.core.metrics import INGESTION_BATCH_SECONDS, INGESTION_ROWS
+from product_importer.core.profiling import SamplingProfiler
 from product_importer.db.session import SessionLocal
 from product_importer.models.product import Product
+from product_importer.models.profile import ProfileKind
 from product_importer.models.upload_job import UploadJob, UploadStatus
+from product_importer.services.catalog_cache import bump_catalog_version, invalidate_products
+from product_importer.services.events import emit_event
+from product_importer.services.facet_service import FACET_COLUMNS, FacetService, facet_deltas
 
 settings = get_settings()
 
 
-def chunked_reader(file_path: Path, chunk_size: int = 2000) -> Iterator[list[dict[str, str]]]:
-    with file_path.open("r", newline="") as csvfile:
-        reader = csv.DictReader(csvfile)
+def _imported_payload(job: UploadJob, batch_number: int, skus: list[str], existing: set[str]) -> dict:
+    """Summary of one committed ingestion batch for ``product.imported`` subscribers."""
+
+    limit = settings.import_event_max_skus
+    created = sum(1 for sku in skus if sku.lower() not in existing)
+    return {
+        "job_id": str(job.id),
+        "filename": job.filename,
+        "batch": batch_number,
+        "count": len(skus),
+        "created": created,
+        "updated": len(skus) - created,
+        "skus": skus[:limit],
+        "skus_truncated": len(skus) > limit,
+    }
+
+
+INGESTION_STAGES = ("download", "parse", "normalize", "sql", "commit")
+
+
+class IngestionStats:
+    """Cumulative per-stage timings of one ingestion run, persisted on ``UploadJob.metrics``."""
+
+    def __init__(self) -> None:
+        self.seconds = dict.fromkeys(INGESTION_STAGES, 0.0)
+        self.bytes_read = 0
+        self.batches = 0
+        self.rows = 0
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - started
+
+    def as_dict(self) -> dict:
+        elapsed = time.perf_counter() - self._started
+        return {
+            "stages_ms": {name: round(seconds * 1000, 1) for name, seconds in self.seconds.items()},
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "bytes_read": self.bytes_read,
+            "batches": self.batches,
+            "rows": self.rows,
+            "rows_per_second": round(self.rows / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+
+def chunked_reader(
+    file_path: Path,
+    chunk_size: int = 2000,
+    stats: IngestionStats | None = None,
+) -> Iterator[list[dict[str, str]]]:
+    with file_path.open("rb") as raw:
+        reader = csv.DictReader(io.TextIOWrapper(raw, newline=""))
         batch: list[dict[str, str]] = []
+        started = time.perf_counter()
         for row in reader:
             batch.append(row)
             if len(batch) >= chunk_size:
+                if stats is not None:
+                    # Time spent suspended at ``yield`` belongs to the caller's stages.
+                    stats.seconds["parse"] += time.perf_counter() - started
+                    stats.bytes_read = raw.tell()
                 yield batch
                 batch = []
+                started = time.perf_counter()
+        if stats is not None:
+            stats.seconds["parse"] += time.perf_counter() - started
+            stats.bytes_read = raw.tell()
         if batch:
             yield batch
 
 
 @shared_task(bind=True, max_retries=3, name="product_ingestion")
-def ingest_products_from_csv(self, job_id: str) -> None:
+def ingest_products_from_csv(self, job_id: str, profile: bool = False) -> None:
+    if not profile:
+        return _ingest(self, job_id)
+    from product_importer.services.profile_service import store_profile
+
+    # Retries re-run with the same kwargs, so every attempt stores its own profile.
+    profiler = SamplingProfiler().start()
+    try:
+        return _ingest(self, job_id)
+    finally:
+        profiler.stop()
+        store_profile(ProfileKind.INGESTION, job_id, profiler)
+
+
+def _ingest(task, job_id: str) -> None:
     session: Session = SessionLocal()
+    stats = IngestionStats()
     try:
         job = session.get(UploadJob, job_id)
         if not job:
@@ -56,7 +145,8 @@ def ingest_products_from_csv(self, job_id: str) -> None:
             logger.info(f"Downloading S3 file {storage_path} to {temp_file}")
             
             try:
-                storage.download_to_path(storage_path, temp_file)
+                with stats.stage("download"):
+                    storage.download_to_path(storage_path, temp_file)
                 file_path = temp_file
             except Exception as e:
                 logger.error(f"Failed to download file from S3: {e}")
@@ -67,14 +157,19 @@ def ingest_products_from_csv(self, job_id: str) -> None:
         
         job.status = UploadStatus.PARSING
         session.add(job)
-        session.commit()
+        with stats.stage("commit"):
+            session.commit()
 
         total_processed = 0
-        for batch in chunked_reader(file_path):
+        for batch_number, batch in enumerate(chunked_reader(file_path, stats=stats), start=1):
+            batch_started = time.perf_counter()
+            stats.batches = batch_number
             job.status = UploadStatus.UPSERTING
             session.add(job)
-            session.commit()
+            with stats.stage("commit"):
+                session.commit()
 
+            normalize_started = time.perf_counter()
             upsert_map: dict[str, dict[str, object]] = {}
             for raw_row in batch:
                 normalized: dict[str, object] = {}
@@ -87,6 +182,9 @@ def ingest_products_from_csv(self, job_id: str) -> None:
                         cleaned_value: object = value.strip()
                     else:
                         cleaned_value = value
+                    if cleaned_key != base_key:
+                        # keep the full header too so columns like is_active are found
+                        normalized.setdefault(cleaned_key, cleaned_value)
                     # prefer exact key match over derived base key
                     if cleaned_key == base_key or base_key not in normalized:
                         normalized[base_key] = cleaned_value
@@ -135,10 +233,21 @@ def ingest_products_from_csv(self, job_id: str) -> None:
                 }
 
             upserts = list(upsert_map.values())
+            stats.seconds["normalize"] += time.perf_counter() - normalize_started
             if not upserts:
                 continue
 
-            stmt = pg_insert(Product.__table__).values(upserts)
+            sql_started = time.perf_counter()
+            table = Product.__table__
+            facet_columns = [table.c[column.key] for column in FACET_COLUMNS]
+            # Capture (and lock) the current facet values of rows this batch overwrites.
+            previous = session.execute(
+                select(table.c.sku, *facet_columns)
+                .where(table.c.sku == any_(cast(list(upsert_map), ARRAY(CITEXT))))
+                .with_for_update()
+            ).mappings().all()
+
+            stmt = pg_insert(table).values(upserts)
             stmt = stmt.on_conflict_do_update(
                 index_elements=[Product.sku],
                 set_={
@@ -148,15 +257,33 @@ def ingest_products_from_csv(self, job_id: str) -> None:
                     "currency": stmt.excluded.currency,
                     "is_active": stmt.excluded.is_active,
                 },
+            ).returning(table.c.id, *facet_columns)
+            written = session.execute(stmt).mappings().all()
+            touched_ids = [row["id"] for row in written]
+            FacetService(session).apply(facet_deltas(added=written, removed=previous))
+            # One event per batch keeps event volume proportional to batches.
+            existing = {str(row["sku"]).lower() for row in previous}
+            emit_event(
+                session,
+                "product.imported",
+                _imported_payload(job, batch_number, list(upsert_map), existing),
             )
-            session.execute(stmt)
+            stats.seconds["sql"] += time.perf_counter() - sql_started
             total_processed += len(upserts)
+            stats.rows = total_processed
             job.processed_rows = total_processed
+            job.metrics = stats.as_dict()
             session.add(job)
-            session.commit()
+            with stats.stage("commit"):
+                session.commit()
+            invalidate_products(touched_ids)
+            bump_catalog_version()
+            INGESTION_ROWS.inc(len(upserts))
+            INGESTION_BATCH_SECONDS.observe(time.perf_counter() - batch_started)
 
         job.status = UploadStatus.COMPLETED
         job.total_rows = total_processed
+        job.metrics = stats.as_dict()
         session.add(job)
         session.commit()
         logger.info("Job %s completed with %s rows", job_id, total_processed)
@@ -171,9 +298,10 @@ def ingest_products_from_csv(self, job_id: str) -> None:
             if len(error_message) > 900:
                 error_message = error_message[:900] + "…"
             job.error = error_message
+            job.metrics = stats.as_dict()
             session.add(job)
             session.commit()
-        raise self.retry(exc=exc, countdown=10)
+        raise task.retry(exc=exc, countdown=10)
     finally:
         # Clean up temporary S3 download file
         if is_s3 and 'temp_file' in locals():
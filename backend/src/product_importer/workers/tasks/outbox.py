@@ -0,0 +1,59 @@
+"""Relay of committed outbox events to the webhook dispatcher."""
+
+from __future__ import annotations
+
+from celery import shared_task
+from loguru import logger
+from sqlalchemy import delete, select
+
+from product_importer.core.config import get_settings
+from product_importer.db.session import SessionLocal
+from product_importer.models.outbox import OutboxEvent
+from product_importer.services.events import group_events
+from product_importer.workers.tasks.webhooks import dispatch_webhook_event
+
+settings = get_settings()
+
+# Bounds one run so a large backlog cannot pin a worker indefinitely.
+MAX_BATCHES_PER_RUN = 20
+
+
+def _relay_batch(limit: int) -> int:
+    session = SessionLocal()
+    try:
+        # SKIP LOCKED lets several relays drain the outbox side by side.
+        rows = session.execute(
+            select(OutboxEvent.id, OutboxEvent.event, OutboxEvent.payload, OutboxEvent.created_at)
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not rows:
+            return 0
+        for event, payload in group_events((row.event, row.payload, row.created_at) for row in rows):
+            dispatch_webhook_event.delay(event, payload)
+        session.execute(delete(OutboxEvent).where(OutboxEvent.id.in_([row.id for row in rows])))
+        session.commit()
+        return len(rows)
+    except Exception:
+        # Rows stay in the outbox and are picked up again by the next run.
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+@shared_task(name="relay_outbox_events")
+def relay_outbox_events() -> int:
+    """Drain committed events from the outbox; returns how many were relayed."""
+
+    limit = settings.outbox_relay_batch_size
+    relayed = 0
+    for _ in range(MAX_BATCHES_PER_RUN):
+        count = _relay_batch(limit)
+        relayed += count
+        if count < limit:
+            break
+    if relayed:
+        logger.debug("Relayed {} outbox events", relayed)
+    return relayed
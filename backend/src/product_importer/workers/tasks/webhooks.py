@@ -2,72 +2,167 @@
 
 from __future__ import annotations
 
-import time
 from typing import Any
+from uuid import UUID
 
-import httpx
 from celery import shared_task
 from loguru import logger
+from sqlalchemy import select
 
 from product_importer.core.config import get_settings
-from product_importer.db.session import SessionLocal
+from product_importer.core.metrics import WEBHOOK_HELD_BACK
+from product_importer.db.session import SessionLocal, db_session
+from product_importer.models.webhook import WebhookRetry
+from product_importer.services.delivery_logs import DeliveryLogService
+from product_importer.services.webhook_dispatcher import DeliveryResult, WebhookTarget, get_dispatcher
+from product_importer.services.webhook_guard import webhook_guard
 from product_importer.services.webhook_service import WebhookService
+from product_importer.services.webhook_subscriptions import subscriptions
 
 settings = get_settings()
 
 
-def _dispatch_single_webhook(service: WebhookService, hook, event: str, payload: dict[str, Any]) -> None:
-    headers = hook.headers or {}
-    started = time.perf_counter()
-    status = "success"
-    response_code = None
-    response_body: str | None = None
+def _failure_reason(result: DeliveryResult) -> str | None:
+    if result.response_code is not None:
+        return f"HTTP {result.response_code}"
+    return result.response_body
+
+
+def _outcomes(results: list[DeliveryResult]) -> list[tuple[UUID, bool]]:
+    return [(result.target.id, result.status == "success") for result in results]
 
-    try:
-        with httpx.Client(timeout=settings.webhook_request_timeout) as client:
-            response = client.post(
-                hook.target_url,
-                json={"event": event, "payload": payload},
-                headers=headers,
-            )
-        response_code = response.status_code
-        response_body = response.text[:2000]
-        if not response.is_success:
-            status = "failed"
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("Webhook %s failed", hook.id)
-        status = "failed"
-        response_body = str(exc)
-    finally:
-        elapsed_ms = int((time.perf_counter() - started) * 1000)
-        service.record_delivery(
-            hook,
-            event=event,
-            payload=payload,
-            response_code=response_code,
-            response_time_ms=elapsed_ms,
-            response_body=response_body,
-            status=status,
-        )
 
+def _log_entry(result: DeliveryResult, event: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "webhook_id": result.target.id,
+        "event": event,
+        "payload": payload,
+        "response_code": result.response_code,
+        "response_time_ms": result.response_time_ms,
+        "response_body": result.response_body,
+        "status": result.status,
+    }
+
+
+@shared_task(name="dispatch_webhook_event")
+def dispatch_webhook_event(event: str, payload: dict[str, Any]) -> None:
+    """Deliver an event once to every subscriber.
+
+    Failed deliveries are queued for individual retries rather than retrying the
+    task, so subscribers that already received the event never get it again.
+    """
+
+    targets = subscriptions().targets_for(event)
+    if not targets:
+        logger.info("No webhooks registered for {}", event)
+        return
+
+    guard = webhook_guard()
+    admissions = list(zip(targets, guard.admit(target.id for target in targets)))
+    allowed = [target for target, admission in admissions if admission.allowed]
 
-@shared_task(bind=True, max_retries=3, name="dispatch_webhook_event")
-def dispatch_webhook_event(self, event: str, payload: dict[str, Any]) -> None:
     session = SessionLocal()
     try:
         service = WebhookService(session)
-        hooks = service.list_active_for_event(event)
-        if not hooks:
-            logger.info("No webhooks registered for %s", event)
-            return
-
-        for hook in hooks:
-            _dispatch_single_webhook(service, hook, event, payload)
-            session.commit()
+        results = get_dispatcher().deliver(allowed, event, payload) if allowed else []
+        guard.report(_outcomes(results))
+        DeliveryLogService(session).record(_log_entry(result, event, payload) for result in results)
+        for result in results:
+            if result.status != "success":
+                service.schedule_retry(
+                    result.target.id, event=event, payload=payload, error=_failure_reason(result)
+                )
+        for target, admission in admissions:
+            if not admission.allowed:
+                WEBHOOK_HELD_BACK.labels(reason=admission.reason).inc()
+                service.schedule_retry(
+                    target.id,
+                    event=event,
+                    payload=payload,
+                    error=admission.reason,
+                    attempts=0,
+                    delay=admission.retry_after,
+                )
+        session.commit()
 
-    except Exception as exc:  # noqa: BLE001
+    except Exception:
         session.rollback()
-        logger.exception("Failed dispatching event %s", event)
-        raise self.retry(exc=exc, countdown=10)
+        logger.exception("Failed recording deliveries for event {}", event)
+        raise
     finally:
         session.close()
+
+
+@shared_task(name="retry_webhook_deliveries")
+def retry_webhook_deliveries() -> int:
+    """Re-attempt due failed deliveries in one batch; returns how many were attempted.
+
+    Due retries are claimed in a short transaction and delivered with no transaction
+    open; the outcomes are recorded in another one afterwards.
+    """
+
+    with db_session() as session:
+        claimed = []
+        for retry, hook in WebhookService(session).claim_due_retries(settings.webhook_retry_batch_size):
+            if hook.is_enabled:
+                claimed.append((retry.id, WebhookTarget.from_model(hook), retry.event, retry.payload))
+            else:
+                session.delete(retry)
+    if not claimed:
+        return 0
+
+    guard = webhook_guard()
+    admissions = guard.admit(target.id for _, target, _, _ in claimed)
+    pending = [item for item, admission in zip(claimed, admissions) if admission.allowed]
+    results = []
+    if pending:
+        results = get_dispatcher().deliver_each((target, event, payload) for _, target, event, payload in pending)
+        guard.report(_outcomes(results))
+
+    with db_session() as session:
+        service = WebhookService(session)
+        # Locked so the webhooks cannot be deleted while we record; retries of
+        # webhooks deleted during delivery are already gone and are not logged.
+        retries = {
+            retry.id: retry
+            for retry in session.scalars(
+                select(WebhookRetry)
+                .where(WebhookRetry.id.in_([retry_id for retry_id, *_ in claimed]))
+                .with_for_update()
+            )
+        }
+        delivered = [(item, result) for item, result in zip(pending, results) if item[0] in retries]
+        DeliveryLogService(session).record(
+            _log_entry(result, event, payload) for (_, _, event, payload), result in delivered
+        )
+        for (retry_id, _, _, _), admission in zip(claimed, admissions):
+            if not admission.allowed:
+                WEBHOOK_HELD_BACK.labels(reason=admission.reason).inc()
+                if retry_id in retries:
+                    service.defer_retry(retries[retry_id], admission.retry_after, admission.reason)
+        for (retry_id, _, _, _), result in delivered:
+            retry = retries[retry_id]
+            if result.status == "success":
+                session.delete(retry)
+            elif not service.retry_failed(retry, _failure_reason(result)):
+                logger.warning(
+                    "Giving up on {} delivery to webhook {} after {} attempts",
+                    retry.event,
+                    retry.webhook_id,
+                    retry.attempts,
+                )
+    return len(pending)
+
+
+@shared_task(name="maintain_delivery_logs")
+def maintain_delivery_logs() -> None:
+    """Create upcoming delivery log partitions and drop expired ones."""
+
+    # Separate transactions: detaching expired partitions concurrently waits for
+    # every older transaction, including one creating partitions.
+    with db_session() as session:
+        dropped = DeliveryLogService(session).drop_expired()
+    with db_session() as session:
+        created = DeliveryLogService(session).ensure_partitions()
+    if created or dropped:
+        logger.info("Delivery log partitions created {} dropped {}", created, dropped)
@@ -0,0 +1,120 @@
+import pytest
+import redis
+from sqlalchemy import func, select
+
+from product_importer.db.session import reset_engines
+from product_importer.models.upload_job import UploadJob, UploadStatus
+from product_importer.services import admission
+
+CSV = b"sku,name,price\nA,Product,5\n"
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    def set_limits(**values) -> None:
+        for name, value in values.items():
+            monkeypatch.setattr(admission.settings, f"admission_{name}", value)
+
+    return set_limits
+
+
+def _jobs(db) -> int:
+    db.rollback()
+    return db.scalar(select(func.count()).select_from(UploadJob))
+
+
+def _multipart_stream(read: list[bool]):
+    """A multipart upload body that records whether the app started reading it."""
+
+    boundary = "boundary"
+
+    async def body():
+        read.append(True)
+        yield f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="p.csv"\r\n'.encode()
+        yield b"Content-Type: text/csv\r\n\r\n" + CSV + f"\r\n--{boundary}--\r\n".encode()
+
+    return body(), {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+
+async def test_uploads_are_admitted_under_the_limits(db, client):
+    read: list[bool] = []
+    content, headers = _multipart_stream(read)
+
+    response = await client.post("/uploads/", content=content, headers=headers)
+
+    assert response.status_code == 200, response.text
+    assert read == [True]
+    assert _jobs(db) == 1
+
+
+async def test_a_backlog_refuses_uploads_before_reading_the_body(db, client, limits):
+    limits(max_active_uploads=1, retry_after_seconds=7)
+    db.add(UploadJob(filename="p.csv", storage_path="p.csv", status=UploadStatus.UPSERTING))
+    db.commit()
+    read: list[bool] = []
+    content, headers = _multipart_stream(read)
+
+    response = await client.post("/uploads/", content=content, headers=headers)
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+    assert response.json() == {
+        "detail": "Upload capacity exhausted (1 uploads already queued or running), retry later"
+    }
+    assert read == []
+    assert _jobs(db) == 1
+    # Other routes under /uploads are not gated.
+    assert (await client.get("/uploads/")).status_code == 200
+
+
+async def test_a_full_task_queue_refuses_uploads(db, client, fake_redis, limits):
+    limits(max_queue_depth=2)
+    fake_redis.rpush("celery", "a", "b")
+
+    response = await client.post("/uploads/", files={"file": ("p.csv", CSV, "text/csv")})
+
+    assert response.status_code == 429
+    assert "2 tasks waiting in the queue" in response.json()["detail"]
+    assert _jobs(db) == 0
+
+
+async def test_a_slow_database_is_degraded_not_unready(client, limits):
+    limits(max_db_latency_ms=0.001)
+
+    response = await client.get("/health/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["ready"], body["degraded"], body["accepting_uploads"]) == (True, True, False)
+    assert body["reasons"][0].startswith("database latency")
+    assert (await client.post("/uploads/", files={"file": ("p.csv", CSV, "text/csv")})).status_code == 429
+
+
+async def test_an_unreachable_broker_is_not_ready(client, monkeypatch):
+    def broker_down():
+        raise redis.ConnectionError("broker unavailable")
+
+    monkeypatch.setattr(admission, "celery_queue_lengths", broker_down)
+
+    response = await client.get("/health/ready")
+
+    assert response.status_code == 503
+    body = response.json()
+    assert (body["ready"], body["broker_ok"], body["database_ok"]) == (False, False, True)
+    assert body["reasons"] == ["task broker unavailable"]
+
+
+async def test_readiness_and_admission_use_the_primary(client, monkeypatch):
+    # An unreachable replica must neither fail readiness nor block uploads.
+    replica = "postgresql+psycopg://app@127.0.0.1:1/replica"
+    monkeypatch.setattr(admission.settings, "database_read_url", replica)
+    reset_engines()
+    try:
+        ready = await client.get("/health/ready")
+        upload = await client.post("/uploads/", files={"file": ("p.csv", CSV, "text/csv")})
+    finally:
+        reset_engines()
+
+    assert ready.status_code == 200
+    assert ready.json()["database_ok"] is True
+    assert upload.status_code == 200
@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+from sqlalchemy import select
+
+from product_importer.db.session import run_after_commit
+from product_importer.models.outbox import OutboxEvent
+from product_importer.models.webhook import Webhook
+from product_importer.services import product_service, webhook_subscriptions
+
+
+async def test_after_commit_callbacks_run_off_the_event_loop_before_the_response(client, monkeypatch):
+    loop_thread = threading.current_thread()
+    calls = []
+    monkeypatch.setattr(product_service, "bump_catalog_version", lambda: calls.append(threading.current_thread()))
+
+    response = await client.post("/products/", json={"sku": "A-1", "name": "A"})
+
+    assert response.status_code == 201
+    assert len(calls) == 1
+    assert calls[0] is not loop_thread
+
+
+async def test_rolled_back_async_transactions_drop_their_callbacks(async_db):
+    calls = []
+    async_db.add(Webhook(name="hook", target_url="http://example.test", event="product.created"))
+    await async_db.flush()
+    run_after_commit(async_db.sync_session, lambda: calls.append("ran"))
+    await async_db.rollback()
+    await async_db.commit()
+
+    assert calls == []
+
+
+async def test_callbacks_registered_in_separate_transactions_each_run_once(async_db):
+    calls = []
+    for name in ("first", "second"):
+        run_after_commit(async_db.sync_session, lambda name=name: calls.append(name))
+        await async_db.commit()
+
+    assert calls == ["first", "second"]
+
+
+async def test_subscription_reload_on_the_api_path_uses_the_request_session(client, db, monkeypatch):
+    db.add(Webhook(name="hook", target_url="http://example.test", event="product.created"))
+    db.commit()
+
+    def no_sync_sessions():
+        pytest.fail("the API path must not open a blocking session")
+
+    monkeypatch.setattr(webhook_subscriptions, "SessionLocal", no_sync_sessions)
+
+    response = await client.post("/products/", json={"sku": "A-1", "name": "A"})
+
+    assert response.status_code == 201
+    assert db.scalars(select(OutboxEvent.event)).all() == ["product.created"]
+
+
+def test_concurrent_reload_serves_the_previous_snapshot(monkeypatch):
+    index = webhook_subscriptions.SubscriptionIndex(ttl_seconds=60)
+    monkeypatch.setattr(index, "_ensure_listener", lambda: None)
+    index._targets = {"product.created": ("cached",)}
+
+    with index._reload_lock:
+        # Expired, but another caller is reloading: no waiting, no query.
+        assert index.targets_for("product.created") == ("cached",)
+
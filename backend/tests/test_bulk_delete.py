@@ -0,0 +1,190 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from celery.exceptions import Retry
+from sqlalchemy import func, select, text
+
+from product_importer.models.delete_job import DeleteJobStatus, ProductDeleteJob
+from product_importer.models.product import Product
+from product_importer.models.upload_job import UploadJob, UploadStatus
+from product_importer.services.product_service import ProductService
+from product_importer.workers.tasks import bulk_delete
+from product_importer.workers.tasks.bulk_delete import bulk_delete_products
+
+
+@pytest.fixture(autouse=True)
+def fast_batches(monkeypatch):
+    monkeypatch.setattr(bulk_delete.settings, "bulk_delete_batch_size", 2)
+    monkeypatch.setattr(bulk_delete.settings, "bulk_delete_throttle_ms", 0)
+    monkeypatch.setattr(bulk_delete.settings, "bulk_delete_lock_timeout_ms", 200)
+
+
+def _job(db, job_id) -> ProductDeleteJob:
+    db.expire_all()
+    return db.get(ProductDeleteJob, job_id)
+
+
+def _product_count(db) -> int:
+    return db.scalar(select(func.count()).select_from(Product))
+
+
+def _start_ingestion(db, status: UploadStatus = UploadStatus.UPSERTING, **fields) -> None:
+    db.add(UploadJob(filename="a.csv", storage_path="a.csv", status=status, **fields))
+    db.commit()
+
+
+async def test_bulk_delete_truncates_an_idle_catalog(client, db, make_products):
+    make_products(5)
+
+    response = await client.post("/products/bulk-delete", json={"confirmation_text": "delete all"})
+
+    assert response.status_code == 202
+    job = _job(db, response.json()["id"])
+    assert (job.status, job.strategy, job.deleted_rows) == (DeleteJobStatus.COMPLETED, "truncate", 5)
+    assert _product_count(db) == 0
+    status = (await client.get(f"/products/bulk-delete/{job.id}")).json()
+    assert status["status"] == "completed"
+
+
+async def test_bulk_delete_requires_confirmation(client, db, make_products):
+    make_products(1)
+
+    response = await client.post("/products/bulk-delete", json={"confirmation_text": "yes"})
+
+    assert response.status_code == 400
+    assert _product_count(db) == 1
+
+
+def test_running_ingestion_is_checked_under_the_table_lock(db, make_products, monkeypatch):
+    make_products(5)
+    checked_with_lock = []
+
+    def ingestion_running(session):
+        held = session.scalar(
+            text(
+                "SELECT count(*) FROM pg_locks WHERE pid = pg_backend_pid() "
+                "AND relation = CAST(:table AS regclass) AND mode = 'AccessExclusiveLock'"
+            ),
+            {"table": Product.__table__.fullname},
+        )
+        checked_with_lock.append(bool(held))
+        return True
+
+    monkeypatch.setattr(bulk_delete, "_ingestion_running", ingestion_running)
+    job = ProductService(db).start_bulk_delete()
+    db.commit()
+
+    job = _job(db, job.id)
+    assert checked_with_lock == [True]
+    assert (job.status, job.strategy, job.deleted_rows) == (DeleteJobStatus.COMPLETED, "batched", 5)
+    assert _product_count(db) == 0
+
+
+def test_active_import_falls_back_to_batched_deletes(db, make_products):
+    make_products(5)
+    _start_ingestion(db)
+
+    job = ProductService(db).start_bulk_delete()
+    db.commit()
+
+    job = _job(db, job.id)
+    assert (job.strategy, job.total_rows, job.deleted_rows) == ("batched", 5, 5)
+    assert _product_count(db) == 0
+
+
+@pytest.mark.parametrize(
+    ("status", "age", "strategy"),
+    [
+        (UploadStatus.RECEIVED, timedelta(0), "batched"),
+        (UploadStatus.UPSERTING, timedelta(days=1), "truncate"),
+        (UploadStatus.COMPLETED, timedelta(0), "truncate"),
+    ],
+)
+def test_ingestion_check_matches_upload_admission(db, make_products, status, age, strategy):
+    # Received uploads are about to ingest; stale ones belong to a dead worker.
+    make_products(2)
+    _start_ingestion(db, status, updated_at=datetime.now(timezone.utc) - age)
+
+    job = ProductService(db).start_bulk_delete()
+    db.commit()
+
+    assert _job(db, job.id).strategy == strategy
+    assert _product_count(db) == 0
+
+
+def test_readers_holding_the_table_make_truncate_give_up(db, make_products):
+    make_products(3)
+    reader_ready, release = threading.Event(), threading.Event()
+
+    def hold_reader_lock():
+        from product_importer.db.session import SessionLocal
+
+        with SessionLocal() as session:
+            session.execute(text(f"LOCK TABLE {Product.__table__.fullname} IN ACCESS SHARE MODE"))
+            reader_ready.set()
+            release.wait(10)
+            session.rollback()
+
+    reader = threading.Thread(target=hold_reader_lock)
+    reader.start()
+    reader_ready.wait(10)
+    try:
+        job = ProductService(db).start_bulk_delete()
+        db.commit()
+    finally:
+        release.set()
+        reader.join()
+
+    job = _job(db, job.id)
+    assert (job.status, job.strategy, job.deleted_rows) == (DeleteJobStatus.COMPLETED, "batched", 3)
+
+
+def test_failed_attempt_waits_as_retrying_and_restarts_its_counters(db, make_products, monkeypatch):
+    make_products(6)
+    _start_ingestion(db)
+    job = ProductDeleteJob(status=DeleteJobStatus.QUEUED, deleted_rows=0)
+    db.add(job)
+    db.commit()
+
+    # The first attempt dies after committing its first batch.
+    def flaky_invalidate(ids):
+        monkeypatch.setattr(bulk_delete, "invalidate_products", lambda ids: None)
+        raise RuntimeError("redis hiccup")
+
+    monkeypatch.setattr(bulk_delete, "invalidate_products", flaky_invalidate)
+    retries = []
+    monkeypatch.setattr(
+        bulk_delete_products, "retry", lambda exc, countdown: retries.append(countdown) or Retry(exc=exc)
+    )
+
+    with pytest.raises(Retry):
+        bulk_delete_products.apply(args=(str(job.id),))
+
+    failed = _job(db, job.id)
+    assert retries == [10]
+    assert (failed.status, failed.deleted_rows, failed.error) == (DeleteJobStatus.RETRYING, 2, "redis hiccup")
+    # A retrying job still counts as active, so a second request does not start another.
+    assert ProductService(db).start_bulk_delete().id == job.id
+
+    bulk_delete_products.apply(args=(str(job.id),), retries=1)
+
+    done = _job(db, job.id)
+    assert (done.status, done.total_rows, done.deleted_rows) == (DeleteJobStatus.COMPLETED, 4, 4)
+    assert _product_count(db) == 0
+
+
+def test_last_attempt_marks_the_job_failed(db, monkeypatch):
+    job = ProductDeleteJob(status=DeleteJobStatus.QUEUED, deleted_rows=0)
+    db.add(job)
+    db.commit()
+
+    def broken(session, job):
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(bulk_delete, "_truncate", broken)
+
+    with pytest.raises(RuntimeError):
+        bulk_delete_products.apply(args=(str(job.id),), retries=bulk_delete_products.max_retries)
+
+    assert _job(db, job.id).status is DeleteJobStatus.FAILED
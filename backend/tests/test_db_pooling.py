@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from product_importer.db import session
+from product_importer.db.session import get_async_engine, get_engine, reset_engines
+from product_importer.workers import celery_app
+
+PREPARED = text("SELECT count(*) FROM pg_prepared_statements")
+
+
+@pytest.fixture
+def fresh_engines(database):
+    reset_engines()
+    yield
+    reset_engines()
+
+
+@pytest.fixture
+def pgbouncer(monkeypatch, fresh_engines):
+    monkeypatch.setattr(session.settings, "db_pgbouncer", True)
+
+
+@pytest.mark.parametrize(
+    ("url", "connect_args"),
+    [
+        ("postgresql+psycopg://app@bouncer/db", {"prepare_threshold": None}),
+        ("postgresql+psycopg2://app@bouncer/db", None),
+        ("postgresql://app@bouncer/db", None),
+    ],
+)
+def test_pgbouncer_disables_pooling_and_only_psycopg_prepares(monkeypatch, url, connect_args):
+    monkeypatch.setattr(session.settings, "db_pgbouncer", True)
+
+    options = session._engine_options(url, QueuePool)
+
+    assert options["poolclass"] is NullPool
+    assert options.get("connect_args") == connect_args
+
+
+def test_pgbouncer_mode_makes_no_server_side_prepared_statements(pgbouncer):
+    engine = get_engine()
+    assert isinstance(engine.pool, NullPool)
+
+    with engine.connect() as connection:
+        for _ in range(10):
+            connection.execute(text("SELECT 1 WHERE 1 = :one"), {"one": 1})
+        assert connection.scalar(PREPARED) == 0
+
+
+async def test_async_pgbouncer_mode_makes_no_server_side_prepared_statements(pgbouncer):
+    engine = get_async_engine()
+    try:
+        async with engine.connect() as connection:
+            for _ in range(10):
+                await connection.execute(text("SELECT 1 WHERE 1 = :one"), {"one": 1})
+            assert await connection.scalar(PREPARED) == 0
+    finally:
+        await engine.dispose()
+
+
+def test_pooled_connections_prepare_repeated_statements(fresh_engines):
+    with get_engine().connect() as connection:
+        for _ in range(10):
+            connection.execute(text("SELECT 1 WHERE 1 = :one"), {"one": 1})
+        assert connection.scalar(PREPARED) >= 1
+
+
+def test_pools_are_sized_from_settings(fresh_engines, monkeypatch):
+    monkeypatch.setattr(session.settings, "db_pool_size", 3)
+    monkeypatch.setattr(session.settings, "db_max_overflow", 4)
+    monkeypatch.setattr(session.settings, "db_pool_timeout_seconds", 1.5)
+
+    pool = get_engine().pool
+
+    assert isinstance(pool, QueuePool)
+    assert (pool.size(), pool._max_overflow, pool._timeout) == (3, 4, 1.5)
+
+
+def test_worker_children_get_their_own_smaller_pools(fresh_engines, monkeypatch):
+    monkeypatch.setattr(celery_app.settings, "worker_db_pool_size", 1)
+    monkeypatch.setattr(celery_app.settings, "worker_db_max_overflow", 0)
+    inherited = get_engine()
+    connection = inherited.connect()
+    try:
+        celery_app._reset_database_pools()
+
+        engine = get_engine()
+        assert engine is not inherited
+        assert (engine.pool.size(), engine.pool._max_overflow) == (1, 0)
+        # The parent's pooled connections are dropped, not closed under it.
+        assert connection.scalar(text("SELECT 1")) == 1
+        with engine.connect() as child:
+            assert child.scalar(text("SELECT 1")) == 1
+    finally:
+        connection.close()
@@ -0,0 +1,158 @@
+import json
+import zlib
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from alembic import command
+from sqlalchemy import func, select, text
+
+from product_importer.db.session import SessionLocal, get_engine
+from product_importer.models.webhook import Webhook, WebhookDelivery, WebhookPayload
+from product_importer.services import delivery_logs
+from product_importer.services.delivery_logs import DeliveryLogService, partition_name
+from product_importer.workers.tasks.webhooks import maintain_delivery_logs
+
+TABLE = WebhookDelivery.__table__.fullname
+
+
+@pytest.fixture
+def hook(db) -> Webhook:
+    webhook = Webhook(name="hook", target_url="https://hooks.example.com/", event="product.batch")
+    db.add(webhook)
+    db.commit()
+    return webhook
+
+
+def _entries(hook: Webhook, payload: dict, count: int = 1) -> list[dict]:
+    return [
+        {"webhook_id": hook.id, "event": "product.batch", "payload": payload, "status": "success"}
+        for _ in range(count)
+    ]
+
+
+def _partitions(db) -> list[str]:
+    db.rollback()
+    return sorted(DeliveryLogService(db)._partitions().values())
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+@pytest.mark.parametrize("mode", ["full", "compressed", "reference"])
+def test_payloads_are_stored_per_mode(db, hook, monkeypatch, mode):
+    monkeypatch.setattr(delivery_logs.settings, "webhook_log_payload_mode", mode)
+    payload = {"created": 2}
+
+    assert DeliveryLogService(db).record(_entries(hook, payload, count=3)) == 3
+    db.commit()
+
+    rows = db.scalars(select(WebhookDelivery)).all()
+    assert len(rows) == 3
+    if mode == "full":
+        assert {row.payload["created"] for row in rows} == {2}
+    elif mode == "compressed":
+        assert {json.loads(zlib.decompress(row.payload_compressed))["created"] for row in rows} == {2}
+    else:
+        (stored,) = db.scalars(select(WebhookPayload)).all()
+        assert stored.payload == payload
+        assert {row.payload_ref for row in rows} == {stored.digest}
+
+
+def test_partitions_are_created_ahead(db, monkeypatch):
+    monkeypatch.setattr(delivery_logs.settings, "webhook_log_partitions_ahead", 3)
+    later = _today() + timedelta(days=10)
+
+    created = DeliveryLogService(db).ensure_partitions(later)
+    db.commit()
+
+    assert created == [partition_name(later + timedelta(days=offset)) for offset in range(4)]
+    assert DeliveryLogService(db).ensure_partitions(later) == []
+    db.rollback()
+
+
+def test_expired_partitions_are_detached_and_dropped(db, hook, monkeypatch):
+    monkeypatch.setattr(delivery_logs.settings, "webhook_log_retention_days", 30)
+    old = _today() - timedelta(days=40)
+    DeliveryLogService(db).ensure_partitions(old)
+    db.execute(
+        text(f"INSERT INTO {TABLE} (id, created_at, webhook_id, event, status) "
+             "VALUES (gen_random_uuid(), :at, :hook, 'product.batch', 'success')"),
+        {"at": datetime.combine(old, datetime.min.time(), tzinfo=timezone.utc), "hook": hook.id},
+    )
+    DeliveryLogService(db).record(_entries(hook, {}))
+    db.commit()
+
+    maintain_delivery_logs()
+
+    remaining = _partitions(db)
+    assert partition_name(old) not in remaining
+    assert min(remaining) == partition_name(_today() - timedelta(days=30))
+    assert db.scalar(select(func.count()).select_from(WebhookDelivery)) == 1
+
+
+def test_an_interrupted_detach_is_finalized(db, monkeypatch):
+    monkeypatch.setattr(delivery_logs.settings, "webhook_log_retention_days", 30)
+    old = _today() - timedelta(days=40)
+    DeliveryLogService(db).ensure_partitions(old)
+    db.commit()
+
+    with SessionLocal() as reader:
+        reader.execute(select(func.count()).select_from(WebhookDelivery))
+        # The detach commits its first phase, then times out waiting for the reader.
+        with get_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("SET statement_timeout = '300ms'"))
+            with pytest.raises(Exception, match="statement timeout"):
+                connection.execute(
+                    text(f"ALTER TABLE {TABLE} DETACH PARTITION product_app.{partition_name(old)} CONCURRENTLY")
+                )
+            connection.execute(text("RESET statement_timeout"))
+
+    assert partition_name(old) in DeliveryLogService(db).drop_expired()
+    db.commit()
+    assert partition_name(old) not in _partitions(db)
+
+
+def test_logging_creates_a_missing_partition(db, hook):
+    today = partition_name(_today())
+    with get_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f"ALTER TABLE {TABLE} DETACH PARTITION product_app.{today}"))
+        connection.execute(text(f"DROP TABLE product_app.{today}"))
+
+    DeliveryLogService(db).record(_entries(hook, {"created": 1}))
+    db.commit()
+
+    assert today in _partitions(db)
+    assert db.scalar(select(func.count()).select_from(WebhookDelivery)) == 1
+
+
+def test_upgrade_copies_retained_logs_in_batches_after_the_swap(at_head, alembic_config, db, hook, monkeypatch):
+    monkeypatch.setattr(delivery_logs.settings, "webhook_log_retention_days", 30)
+    hook_id = hook.id
+    db.rollback()
+    command.downgrade(alembic_config, "0004")
+    with get_engine().begin() as connection:
+        connection.execute(
+            text(
+                f"INSERT INTO {TABLE} (id, created_at, updated_at, webhook_id, event, payload, status) "
+                "SELECT gen_random_uuid(), now() - make_interval(days => n % 50), now(), :hook, "
+                "'product.batch', CAST('{}' AS json), 'success' FROM generate_series(1, 25000) AS n"
+            ),
+            {"hook": hook_id},
+        )
+        cutoff = datetime.combine(_today() - timedelta(days=30), datetime.min.time(), tzinfo=timezone.utc)
+        retained = connection.scalar(
+            text(f"SELECT count(*) FROM {TABLE} WHERE created_at >= :cutoff"), {"cutoff": cutoff}
+        )
+
+    command.upgrade(alembic_config, "head")
+
+    with get_engine().connect() as connection:
+        assert connection.scalar(text(f"SELECT count(*) FROM {TABLE}")) == retained
+        assert connection.scalar(
+            text("SELECT to_regclass('product_app.webhook_delivery_logs_legacy') IS NULL")
+        )
+        assert connection.scalar(
+            text("SELECT count(*) FROM pg_partitioned_table WHERE partrelid = CAST(:table AS regclass)"),
+            {"table": TABLE},
+        ) == 1
@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from product_importer.models.outbox import OutboxEvent
+from product_importer.models.upload_job import UploadJob, UploadStatus
+from product_importer.schemas.webhook import WebhookCreate
+from product_importer.services import events
+from product_importer.services.events import group_events
+from product_importer.services.webhook_service import WebhookService
+from product_importer.workers.tasks import outbox
+from product_importer.workers.tasks.ingestion import ingest_products_from_csv
+
+
+EMITTED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _product(sku: str) -> dict:
+    return {"sku": sku}
+
+
+def _rows(*events: tuple[str, dict], seconds_apart: float = 0) -> list[tuple[str, dict, datetime]]:
+    return [
+        (event, payload, EMITTED_AT + timedelta(seconds=index * seconds_apart))
+        for index, (event, payload) in enumerate(events)
+    ]
+
+
+@pytest.fixture
+def coalesce(monkeypatch):
+    def enable(max_items: int) -> None:
+        monkeypatch.setattr(events.settings, "event_coalesce_max_items", max_items)
+
+    return enable
+
+
+@pytest.fixture
+def subscribe(db):
+    def add(event: str) -> None:
+        WebhookService(db).create(WebhookCreate(name=event, target_url="https://example.com/hook", event=event))
+        db.commit()
+
+    return add
+
+
+def _outbox(db) -> list[tuple[str, dict]]:
+    db.expire_all()
+    return [(row.event, row.payload) for row in db.scalars(select(OutboxEvent).order_by(OutboxEvent.id))]
+
+
+def test_consecutive_product_events_are_merged_by_default():
+    rows = _rows(*[("product.created", _product(sku)) for sku in "AB"], ("product.batch", {}))
+
+    assert list(group_events(rows)) == [
+        ("product.created", {"count": 2, "items": [_product("A"), _product("B")]}),
+        ("product.batch", {}),
+    ]
+
+
+def test_events_are_delivered_as_emitted_when_disabled(coalesce):
+    coalesce(1)
+    events = [("product.created", _product("A")), ("product.created", _product("B"))]
+
+    assert list(group_events(_rows(*events))) == events
+
+
+def test_merged_deliveries_are_bounded_in_size(coalesce):
+    coalesce(2)
+    rows = _rows(*[("product.updated", _product(sku)) for sku in "ABC"])
+
+    assert list(group_events(rows)) == [
+        ("product.updated", {"count": 2, "items": [_product("A"), _product("B")]}),
+        ("product.updated", _product("C")),
+    ]
+
+
+def test_merged_deliveries_are_bounded_in_time(monkeypatch):
+    monkeypatch.setattr(events.settings, "event_coalesce_window_seconds", 5)
+    rows = _rows(*[("product.deleted", _product(sku)) for sku in "ABCD"], seconds_apart=2)
+
+    assert list(group_events(rows)) == [
+        ("product.deleted", {"count": 3, "items": [_product("A"), _product("B"), _product("C")]}),
+        ("product.deleted", _product("D")),
+    ]
+
+
+def test_coalescing_keeps_the_emitted_order():
+    rows = _rows(
+        ("product.created", _product("A")),
+        ("product.created", _product("B")),
+        ("product.batch", {"created": 1}),
+        ("product.created", _product("C")),
+        ("product.deleted", _product("A")),
+        ("product.created", _product("A")),
+    )
+
+    assert list(group_events(rows)) == [
+        ("product.created", {"count": 2, "items": [_product("A"), _product("B")]}),
+        ("product.batch", {"created": 1}),
+        ("product.created", _product("C")),
+        ("product.deleted", _product("A")),
+        ("product.created", _product("A")),
+    ]
+
+
+async def test_api_edits_are_relayed_in_coalesced_deliveries(client, subscribe, monkeypatch):
+    subscribe("product.created")
+    delivered = []
+    monkeypatch.setattr(outbox.dispatch_webhook_event, "delay", lambda event, payload: delivered.append(payload))
+    for index in range(4):
+        response = await client.post("/products/", json={"sku": f"SKU-{index}", "name": "P", "price": 1})
+        assert response.status_code == 201
+
+    assert outbox.relay_outbox_events() == 4
+
+    (merged,) = delivered
+    assert merged["count"] == 4
+    assert [item["sku"] for item in merged["items"]] == ["SKU-0", "SKU-1", "SKU-2", "SKU-3"]
+
+
+async def test_api_edits_are_relayed_one_by_one_when_disabled(client, subscribe, coalesce, monkeypatch):
+    coalesce(1)
+    subscribe("product.created")
+    delivered = []
+    monkeypatch.setattr(outbox.dispatch_webhook_event, "delay", lambda event, payload: delivered.append(payload))
+    for index in range(2):
+        await client.post("/products/", json={"sku": f"SKU-{index}", "name": "P", "price": 1})
+
+    assert outbox.relay_outbox_events() == 2
+
+    assert [payload["sku"] for payload in delivered] == ["SKU-0", "SKU-1"]
+
+
+def test_ingestion_emits_one_event_per_committed_batch(db, subscribe, make_products, tmp_path):
+    subscribe("product.imported")
+    make_products(2, prefix="ROW")
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text(
+        "sku,name,price\n" + "".join(f"ROW-{index},Product {index},5\n" for index in range(2500))
+    )
+    job = UploadJob(filename="products.csv", storage_path=str(csv_file), status=UploadStatus.QUEUED)
+    db.add(job)
+    db.commit()
+
+    ingest_products_from_csv(str(job.id))
+
+    imported = _outbox(db)
+    assert [event for event, _ in imported] == ["product.imported", "product.imported"]
+    first, second = (payload for _, payload in imported)
+    assert (first["batch"], first["count"], first["created"], first["updated"]) == (1, 2000, 1998, 2)
+    assert (second["batch"], second["count"], second["created"]) == (2, 500, 500)
+    assert second["skus"][0] == "ROW-2000"
+    assert first["job_id"] == second["job_id"] == str(job.id)
+
+
+def test_events_without_subscribers_are_not_recorded(db, subscribe, tmp_path):
+    subscribe("product.deleted")
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text("sku,name,price\nA,Product,5\n")
+    job = UploadJob(filename="products.csv", storage_path=str(csv_file), status=UploadStatus.QUEUED)
+    db.add(job)
+    db.commit()
+
+    ingest_products_from_csv(str(job.id))
+
+    assert _outbox(db) == []
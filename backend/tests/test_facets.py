@@ -0,0 +1,177 @@
+import warnings
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SAWarning
+
+from product_importer.db.session import SessionLocal
+from product_importer.models.catalog_facet import CatalogFacet, CatalogFacetDelta
+from product_importer.schemas.product import ProductCreate, ProductUpdate
+from product_importer.services.facet_service import FacetService
+from product_importer.services.product_service import ProductService
+from product_importer.workers.tasks.facets import fold_catalog_facets, rebuild_catalog_facets
+
+
+def _create(session, sku: str, price: str = "5", **fields) -> int:
+    product = ProductService(session).create(ProductCreate(sku=sku, name=sku, price=Decimal(price), **fields))
+    session.commit()
+    return product.id
+
+
+def _summary(db) -> dict[str, dict[str, int]]:
+    db.expire_all()
+    summary = FacetService(db).summary()
+    return {
+        facet: {bucket.value: bucket.count for bucket in getattr(summary, facet)}
+        for facet in ("currency", "is_active", "price_band")
+    } | {"total": summary.total}
+
+
+def _stored(db, model) -> int:
+    db.rollback()
+    return db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.fixture
+def other_session(database):
+    session = SessionLocal()
+    # Fail fast instead of hanging if a write ever waits on another transaction again.
+    session.execute(text("SET lock_timeout = '1s'"))
+    yield session
+    session.rollback()
+    session.close()
+
+
+def test_writes_append_deltas_that_reads_include_before_a_fold(db):
+    _create(db, "A-1", "5")
+    product_id = _create(db, "A-2", "75", currency="EUR")
+    ProductService(db).update(product_id, ProductUpdate(price=Decimal("600")))
+    db.commit()
+
+    assert _stored(db, CatalogFacet) == 0
+    expected = {
+        "currency": {"USD": 1, "EUR": 1},
+        "is_active": {"true": 2},
+        "price_band": {"0-10": 1, "500+": 1},
+        "total": 2,
+    }
+    assert _summary(db) == expected
+
+    fold_catalog_facets()
+
+    assert _stored(db, CatalogFacetDelta) == 0
+    assert _stored(db, CatalogFacet) == 6  # including the emptied 50-100 band
+    assert _summary(db) == expected
+
+
+def test_concurrent_writers_do_not_wait_on_each_other(db, other_session):
+    ProductService(db).create(ProductCreate(sku="A-1", name="A", price=Decimal("5")))
+    db.flush()
+
+    # Both transactions change the same buckets; the second must not block on the first.
+    _create(other_session, "B-1", "5")
+    db.commit()
+
+    assert _summary(db)["currency"] == {"USD": 2}
+
+
+def test_fold_keeps_deltas_committed_after_it_started(db, other_session):
+    _create(db, "A-1")
+    FacetService(db).fold()
+
+    _create(other_session, "B-1")
+    db.commit()
+
+    assert _stored(db, CatalogFacetDelta) == 3
+    assert _summary(db)["total"] == 2
+
+
+def test_rebuild_recounts_every_facet_from_products(db, make_products):
+    make_products(3, prefix="USD", currency="USD")
+    make_products(2, prefix="EUR", currency="EUR", is_active=False, price=120)
+    db.execute(CatalogFacet.__table__.insert().values(facet="currency", bucket="GBP", count=7))
+    db.commit()
+
+    rebuild_catalog_facets()
+
+    assert _stored(db, CatalogFacetDelta) == 0
+    assert _summary(db) == {
+        "currency": {"USD": 3, "EUR": 2},
+        "is_active": {"true": 3, "false": 2},
+        "price_band": {"10-50": 3, "100-500": 2},
+        "total": 5,
+    }
+
+
+def test_rebuild_lets_writers_continue_and_keeps_their_newer_deltas(db, other_session, make_products):
+    make_products(2)
+    assert FacetService(db).rebuild()
+
+    _create(other_session, "B-1", "5")
+
+    db.commit()
+    assert _summary(db)["price_band"] == {"10-50": 2, "0-10": 1}
+
+    fold_catalog_facets()
+    assert _summary(db)["total"] == 3
+
+
+def test_rebuild_uses_one_snapshot_even_inside_a_transaction(db, make_products):
+    make_products(1)
+    db.execute(select(func.count()).select_from(CatalogFacet))
+    levels = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "GROUPING SETS" in statement:
+            levels.append(conn.get_isolation_level())
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", SAWarning)
+            assert FacetService(db).rebuild()
+    finally:
+        event.remove(Engine, "before_cursor_execute", capture)
+
+    assert levels == ["REPEATABLE READ"]
+    assert db.scalar(text("SHOW transaction_isolation")) == "read committed"
+    db.rollback()
+    assert _summary(db)["total"] == 1
+
+
+def test_rebuild_is_skipped_while_a_fold_is_running(db, other_session):
+    _create(db, "A-1")
+    FacetService(other_session).fold()
+
+    assert FacetService(db).rebuild() is False
+
+    other_session.commit()
+    assert FacetService(db).rebuild() is True
+    db.commit()
+    assert _summary(db)["total"] == 1
+
+
+def test_reset_clears_summary_and_pending_deltas(db):
+    _create(db, "A-1")
+    fold_catalog_facets()
+    _create(db, "A-2")
+
+    FacetService(db).reset()
+    db.commit()
+
+    assert _stored(db, CatalogFacet) == _stored(db, CatalogFacetDelta) == 0
+    assert _summary(db)["total"] == 0
+
+
+async def test_facets_endpoint_reports_unfolded_writes(client):
+    await client.post("/products/", json={"sku": "A-1", "name": "A", "price": 5})
+    await client.post("/products/", json={"sku": "A-2", "name": "B", "price": 55, "is_active": False})
+
+    response = await client.get("/products/facets")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert {bucket["value"]: bucket["count"] for bucket in body["price_band"]} == {"0-10": 1, "50-100": 1}
@@ -0,0 +1,80 @@
+import shutil
+import time
+
+import pytest
+
+from product_importer.db import storage_deps
+from product_importer.models.upload_job import UploadJob, UploadStatus
+from product_importer.workers.tasks import ingestion
+from product_importer.workers.tasks.ingestion import INGESTION_STAGES, ingest_products_from_csv
+
+
+@pytest.fixture
+def csv_job(db, tmp_path):
+    def make(rows: int, storage_path: str | None = None) -> UploadJob:
+        csv_file = tmp_path / "products.csv"
+        csv_file.write_text("sku,name,price\n" + "".join(f"T-{index},Product {index},5\n" for index in range(rows)))
+        job = UploadJob(
+            filename="products.csv", storage_path=storage_path or str(csv_file), status=UploadStatus.QUEUED
+        )
+        db.add(job)
+        db.commit()
+        return job
+
+    return make
+
+
+def _reloaded(db, job: UploadJob) -> UploadJob:
+    db.expire_all()
+    return db.get(UploadJob, job.id)
+
+
+async def test_completed_runs_record_stage_timings(db, client, csv_job, tmp_path):
+    job = csv_job(2500)
+
+    ingest_products_from_csv(str(job.id))
+
+    metrics = _reloaded(db, job).metrics
+    assert (metrics["batches"], metrics["rows"]) == (2, 2500)
+    assert metrics["bytes_read"] == (tmp_path / "products.csv").stat().st_size
+    assert set(metrics["stages_ms"]) == set(INGESTION_STAGES)
+    assert metrics["stages_ms"]["download"] == 0
+    assert all(metrics["stages_ms"][stage] > 0 for stage in ("parse", "normalize", "sql", "commit"))
+    assert sum(metrics["stages_ms"].values()) <= metrics["elapsed_ms"]
+    assert metrics["rows_per_second"] > 0
+
+    response = await client.get(f"/uploads/{job.id}")
+    assert response.json()["metrics"] == metrics
+
+
+def test_downloads_are_timed(db, csv_job, tmp_path, monkeypatch):
+    source = tmp_path / "products.csv"
+
+    class SlowStorage:
+        def download_to_path(self, storage_path, destination):
+            time.sleep(0.05)
+            shutil.copy(source, destination)
+
+    monkeypatch.setattr(storage_deps, "get_storage", SlowStorage)
+    job = csv_job(10, storage_path="s3://bucket/products.csv")
+
+    ingest_products_from_csv(str(job.id))
+
+    metrics = _reloaded(db, job).metrics
+    assert metrics["stages_ms"]["download"] >= 50
+    assert metrics["rows"] == 10
+
+
+def test_failed_runs_keep_the_metrics_of_committed_batches(db, csv_job, monkeypatch):
+    def fail(product_ids):
+        raise RuntimeError("cache unavailable")
+
+    monkeypatch.setattr(ingestion, "invalidate_products", fail)
+    job = csv_job(2500)
+
+    with pytest.raises(RuntimeError):
+        ingest_products_from_csv(str(job.id))
+
+    failed = _reloaded(db, job)
+    assert failed.status == UploadStatus.FAILED
+    assert (failed.metrics["batches"], failed.metrics["rows"]) == (1, 2000)
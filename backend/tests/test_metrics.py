@@ -0,0 +1,139 @@
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import prometheus_client
+from sqlalchemy import text
+
+import product_importer
+
+from product_importer.core import metrics
+from product_importer.db.session import get_engine
+from product_importer.models.upload_job import UploadJob, UploadStatus
+from product_importer.schemas.webhook import WebhookCreate
+from product_importer.services.webhook_service import WebhookService
+from product_importer.workers.tasks.ingestion import ingest_products_from_csv
+from product_importer.workers.tasks.webhooks import dispatch_webhook_event
+
+
+def _sample(name: str, **labels: str) -> float:
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+async def test_requests_are_timed_per_route_template(client):
+    route = {"method": "GET", "route": "/products/{product_id}", "status": "404"}
+    before = _sample("http_request_duration_seconds_count", **route)
+
+    await client.get("/products/1")
+    await client.get("/products/2")
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert _sample("http_request_duration_seconds_count", **route) == before + 2
+    assert 'route="/products/{product_id}"' in response.text
+
+
+async def test_celery_queue_depths_are_read_at_scrape_time(api_client, fake_redis, monkeypatch):
+    monkeypatch.setattr(metrics.settings, "metrics_celery_queues", "celery, imports")
+    fake_redis.rpush("celery", "a", "b", "c")
+
+    response = await api_client.get("/metrics")
+
+    assert 'celery_queue_length{queue="celery"} 3.0' in response.text
+    assert 'celery_queue_length{queue="imports"} 0.0' in response.text
+
+
+def test_pool_checkouts_and_connections_in_use(database):
+    pool = {"pool": "primary"}
+    checkouts = _sample("db_pool_checkouts_total", **pool)
+    waits = _sample("db_pool_checkout_wait_seconds_count", **pool)
+    in_use = _sample("db_pool_connections_in_use", **pool)
+
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert _sample("db_pool_connections_in_use", **pool) == in_use + 1
+
+    assert _sample("db_pool_checkouts_total", **pool) == checkouts + 1
+    assert _sample("db_pool_checkout_wait_seconds_count", **pool) == waits + 1
+    assert _sample("db_pool_connections_in_use", **pool) == in_use
+
+
+def test_ingestion_rows_and_batches_are_counted(db, tmp_path):
+    rows, batches = _sample("ingestion_rows_total"), _sample("ingestion_batch_duration_seconds_count")
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text("sku,name,price\n" + "".join(f"M-{index},Product,5\n" for index in range(2500)))
+    job = UploadJob(filename="products.csv", storage_path=str(csv_file), status=UploadStatus.QUEUED)
+    db.add(job)
+    db.commit()
+
+    ingest_products_from_csv(str(job.id))
+
+    assert _sample("ingestion_rows_total") == rows + 2500
+    assert _sample("ingestion_batch_duration_seconds_count") == batches + 2
+
+
+def test_webhook_deliveries_are_timed_by_outcome(db, webhook_endpoints):
+    service = WebhookService(db)
+    service.create(WebhookCreate(name="ok", target_url="https://ok.example.com/", event="product.batch"))
+    service.create(WebhookCreate(name="down", target_url="https://down.example.com/", event="product.batch"))
+    db.commit()
+    webhook_endpoints.responses["https://down.example.com/"] = 503
+    success = _sample("webhook_delivery_duration_seconds_count", status="success")
+    failed = _sample("webhook_delivery_duration_seconds_count", status="failed")
+
+    dispatch_webhook_event("product.batch", {"created": 1})
+
+    assert _sample("webhook_delivery_duration_seconds_count", status="success") == success + 1
+    assert _sample("webhook_delivery_duration_seconds_count", status="failed") == failed + 1
+
+
+async def test_metrics_are_unavailable_without_prometheus_client(api_client, monkeypatch):
+    monkeypatch.setattr(metrics, "prometheus_client", None)
+    noop = metrics._metric("Counter", "unused_total", "Not registered", ("label",))
+    noop.labels(label="x").inc()
+
+    response = await api_client.get("/metrics")
+
+    assert response.status_code == 503
+
+
+def test_worker_pool_exposes_merged_metrics_of_its_children(tmp_path):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    # Left over by a previous run; unreadable, so it must be cleared at startup.
+    (tmp_path / "counter_1.db").write_bytes(b"stale")
+    script = textwrap.dedent(
+        f"""
+        import os
+        import urllib.request
+        from product_importer.core import metrics
+
+        metrics.start_worker_exporter()
+        for _ in range(2):
+            child = os.fork()
+            if child == 0:
+                metrics.INGESTION_ROWS.inc(5)
+                os._exit(0)
+            os.waitpid(child, 0)
+            metrics.mark_process_dead(child)
+        metrics.INGESTION_ROWS.inc(2)
+        print(urllib.request.urlopen("http://127.0.0.1:{port}/metrics").read().decode())
+        """
+    )
+    env = {
+        **os.environ,
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path),
+        "WORKER_METRICS_PORT": str(port),
+        "CELERY_BROKER_URL": "memory://",
+        "PYTHONPATH": str(Path(product_importer.__file__).parents[1]),
+    }
+
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0, result.stderr
+    assert "ingestion_rows_total 12.0" in result.stdout
@@ -0,0 +1,61 @@
+import contextlib
+import io
+
+from alembic import command
+from sqlalchemy import text
+
+from product_importer.db.session import get_engine
+
+INDEXES = {
+    "ix_products_created_at",
+    "ix_products_is_active_created_at",
+    "ix_upload_jobs_created_at",
+    "ix_webhook_delivery_logs_webhook_id_created_at",
+}
+
+
+def _indexes() -> dict[str, bool]:
+    """Performance indexes present in the database, mapped to whether they are valid."""
+
+    with get_engine().connect() as connection:
+        rows = connection.execute(
+            text(
+                "SELECT c.relname, i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = ANY(:names)"
+            ),
+            {"names": sorted(INDEXES)},
+        )
+        return dict(rows.all())
+
+
+def test_head_has_every_performance_index(database):
+    assert _indexes() == {name: True for name in INDEXES}
+
+
+def test_indexes_are_built_concurrently(alembic_config):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        command.upgrade(alembic_config, "0001:0002", sql=True)
+
+    statements = [line for line in output.getvalue().splitlines() if line.startswith("CREATE INDEX")]
+    assert len(statements) == len(INDEXES)
+    assert all(line.startswith("CREATE INDEX CONCURRENTLY") for line in statements)
+
+
+def test_downgrade_and_upgrade_rebuild_an_interrupted_index(at_head, alembic_config):
+    command.downgrade(alembic_config, "0001")
+    assert _indexes() == {}
+
+    # What a cancelled CREATE INDEX CONCURRENTLY leaves behind.
+    with get_engine().begin() as connection:
+        connection.execute(text("CREATE INDEX ix_products_created_at ON product_app.products (created_at)"))
+        connection.execute(
+            text(
+                "UPDATE pg_index SET indisvalid = false "
+                "WHERE indexrelid = CAST('product_app.ix_products_created_at' AS regclass)"
+            )
+        )
+
+    command.upgrade(alembic_config, "head")
+
+    assert _indexes() == {name: True for name in INDEXES}
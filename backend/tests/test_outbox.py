@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import func, select
+
+from product_importer.db.session import SessionLocal
+from product_importer.models.outbox import OutboxEvent
+from product_importer.schemas.webhook import WebhookCreate
+from product_importer.services.events import emit_event
+from product_importer.services.webhook_service import WebhookService
+from product_importer.workers.tasks import outbox
+from product_importer.workers.tasks.outbox import relay_outbox_events
+
+
+@pytest.fixture
+def relayed(db, monkeypatch):
+    """Events handed to the dispatcher by the relay, in order."""
+
+    WebhookService(db).create(
+        WebhookCreate(name="hook", target_url="https://hooks.example.com/", event="product.batch")
+    )
+    db.commit()
+    dispatched: list[tuple[str, dict]] = []
+    monkeypatch.setattr(
+        outbox.dispatch_webhook_event, "delay", lambda event, payload: dispatched.append((event, payload))
+    )
+    return dispatched
+
+
+def _pending(db) -> int:
+    db.rollback()
+    return db.scalar(select(func.count()).select_from(OutboxEvent))
+
+
+def _emit(session, *numbers: int) -> None:
+    for number in numbers:
+        emit_event(session, "product.batch", {"n": number})
+
+
+def test_committed_events_are_relayed_in_order_and_removed(db, relayed):
+    _emit(db, 1, 2, 3)
+    db.commit()
+
+    assert relay_outbox_events() == 3
+
+    assert relayed == [("product.batch", {"n": number}) for number in (1, 2, 3)]
+    assert _pending(db) == 0
+
+
+def test_rolled_back_and_uncommitted_events_are_never_relayed(db, relayed):
+    _emit(db, 1)
+    db.rollback()
+    _emit(db, 2)
+    db.flush()
+
+    assert relay_outbox_events() == 0
+
+    db.commit()
+    assert relay_outbox_events() == 1
+    assert relayed == [("product.batch", {"n": 2})]
+
+
+def test_large_backlogs_are_relayed_in_batches(db, relayed, monkeypatch):
+    monkeypatch.setattr(outbox.settings, "outbox_relay_batch_size", 2)
+    monkeypatch.setattr(outbox, "MAX_BATCHES_PER_RUN", 2)
+    _emit(db, *range(5))
+    db.commit()
+
+    assert relay_outbox_events() == 4
+    assert relay_outbox_events() == 1
+    assert [payload["n"] for _, payload in relayed] == list(range(5))
+
+
+def test_events_locked_by_another_relay_are_skipped(db, relayed):
+    _emit(db, 1, 2)
+    db.commit()
+    with SessionLocal() as other:
+        first = other.scalars(
+            select(OutboxEvent).order_by(OutboxEvent.id).limit(1).with_for_update()
+        ).one()
+
+        assert relay_outbox_events() == 1
+        assert relayed == [("product.batch", {"n": 2})]
+        assert first.payload == {"n": 1}
+
+
+def test_events_stay_queued_when_the_broker_is_down(db, relayed, monkeypatch):
+    _emit(db, 1)
+    db.commit()
+
+    def broker_down(event, payload):
+        raise ConnectionError("broker unavailable")
+
+    monkeypatch.setattr(outbox.dispatch_webhook_event, "delay", broker_down)
+    with pytest.raises(ConnectionError):
+        relay_outbox_events()
+
+    assert _pending(db) == 1
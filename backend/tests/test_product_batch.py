@@ -0,0 +1,110 @@
+from sqlalchemy import select
+
+from product_importer.models.product import Product
+
+
+async def test_batch_applies_mixed_operations_by_sku(client, db, make_products):
+    make_products(3)
+
+    response = await client.post(
+        "/products/batch",
+        json={
+            "items": [
+                {"op": "create", "sku": "NEW-1", "name": "New", "price": 5},
+                {"op": "update", "sku": "sku-0", "price": 42},
+                {"op": "delete", "sku": "SKU-1"},
+                {"op": "create", "sku": "SKU-2", "name": "Clash"},
+                {"op": "update", "sku": "MISSING", "name": "Nope"},
+                {"op": "delete", "sku": "new-1"},
+                {"op": "update", "sku": "OTHER-1"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["updated"], body["deleted"], body["failed"]) == (1, 1, 1, 4)
+    assert [(result["status"], result["detail"]) for result in body["results"]] == [
+        ("created", None),
+        ("updated", None),
+        ("deleted", None),
+        ("failed", "SKU already exists"),
+        ("failed", "Product not found"),
+        ("failed", "Duplicate SKU in batch"),
+        ("failed", "No fields to update"),
+    ]
+
+    rows = {product.sku: product for product in db.scalars(select(Product))}
+    assert set(rows) == {"NEW-1", "SKU-0", "SKU-2"}
+    assert float(rows["SKU-0"].price) == 42
+    assert rows["SKU-2"].name == "Product 2"
+
+
+async def test_batch_updates_only_the_fields_sent(client, db, make_products):
+    make_products(2)
+
+    body = (
+        await client.post(
+            "/products/batch",
+            json={
+                "items": [
+                    {"op": "update", "sku": "SKU-0", "name": "Renamed"},
+                    {"op": "update", "sku": "SKU-1", "is_active": False, "currency": "EUR"},
+                ]
+            },
+        )
+    ).json()
+
+    assert body["updated"] == 2
+    first, second = db.scalars(select(Product).order_by(Product.sku)).all()
+    assert (first.name, float(first.price), first.is_active) == ("Renamed", 10, True)
+    assert (second.name, second.currency, second.is_active) == ("Product 1", "EUR", False)
+
+
+async def test_invalid_create_fails_only_its_item(client, db):
+    body = (
+        await client.post(
+            "/products/batch",
+            json={
+                "items": [
+                    {"op": "create", "sku": "BAD-1"},
+                    {"op": "create", "sku": "GOOD-1", "name": "Good"},
+                ]
+            },
+        )
+    ).json()
+
+    assert [result["status"] for result in body["results"]] == ["failed", "created"]
+    assert db.scalars(select(Product.sku)).all() == ["GOOD-1"]
+
+
+async def test_invalid_update_fails_only_its_item(client, db, make_products):
+    make_products(4)
+
+    response = await client.post(
+        "/products/batch",
+        json={
+            "items": [
+                {"op": "create", "sku": "NEW-1", "name": "New"},
+                {"op": "update", "sku": "SKU-0", "currency": None},
+                {"op": "update", "sku": "SKU-1", "currency": "EURO"},
+                {"op": "update", "sku": "SKU-2", "price": 10**12},
+                {"op": "update", "sku": "SKU-3", "currency": "EUR", "description": None},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["created", "failed", "failed", "failed", "updated"]
+    assert results[1]["detail"] == "currency cannot be null"
+    db.expire_all()
+    products = {product.sku: product for product in db.scalars(select(Product))}
+    assert set(products) == {"NEW-1", "SKU-0", "SKU-1", "SKU-2", "SKU-3"}
+    assert [products[sku].currency for sku in ("SKU-0", "SKU-1", "SKU-3")] == ["USD", "USD", "EUR"]
+    assert products["SKU-2"].price == 10
+
+
+async def test_batch_rejects_empty_requests(client):
+    response = await client.post("/products/batch", json={"items": []})
+    assert response.status_code == 422
@@ -0,0 +1,66 @@
+from product_importer.services.catalog_cache import product_key
+
+
+async def test_product_reads_are_cached_and_invalidated_by_writes(client, fake_redis, make_products):
+    (product,) = make_products(1)
+
+    first = await client.get(f"/products/{product.id}")
+    assert first.status_code == 200
+    assert fake_redis.exists(product_key(product.id))
+
+    await client.get(f"/products/{product.id}")
+    stats = (await client.get("/products/cache/stats")).json()
+    assert (stats["item_hits"], stats["item_misses"]) == (1, 1)
+
+    updated = await client.patch(f"/products/{product.id}", json={"name": "Renamed"})
+    assert updated.status_code == 200
+    assert not fake_redis.exists(product_key(product.id))
+    assert (await client.get(f"/products/{product.id}")).json()["name"] == "Renamed"
+
+
+async def test_etag_answers_not_modified_until_the_product_changes(client, make_products):
+    (product,) = make_products(1)
+
+    first = await client.get(f"/products/{product.id}")
+    etag = first.headers["etag"]
+
+    cached = await client.get(f"/products/{product.id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    await client.patch(f"/products/{product.id}", json={"price": 99})
+    changed = await client.get(f"/products/{product.id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+async def test_listing_pages_are_cached_per_catalog_version(client, make_products):
+    make_products(2)
+
+    first = await client.get("/products/")
+    make_products(1, prefix="HIDDEN")
+    assert (await client.get("/products/")).content == first.content
+
+    await client.post("/products/", json={"sku": "NEW-1", "name": "New"})
+    refreshed = (await client.get("/products/")).json()
+    assert {item["sku"] for item in refreshed["items"]} >= {"NEW-1", "HIDDEN-0"}
+
+    stats = (await client.get("/products/cache/stats")).json()
+    assert stats["list_hits"] == 1
+    assert stats["list_misses"] == 2
+
+
+async def test_reads_survive_a_redis_outage(client, make_products, monkeypatch):
+    import redis
+
+    (product,) = make_products(1)
+
+    class Down:
+        def __getattr__(self, name):
+            raise redis.ConnectionError("redis is down")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("product_importer.services.catalog_cache.get_async_redis", lambda: Down())
+        response = await client.get(f"/products/{product.id}")
+    assert response.status_code == 200
+    assert response.json()["sku"] == product.sku
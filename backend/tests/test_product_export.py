@@ -0,0 +1,64 @@
+import csv
+import gzip
+import io
+import json
+
+
+async def test_csv_export_round_trips_through_the_importer_columns(client, make_products):
+    make_products(3)
+    make_products(1, prefix="OFF", is_active=False)
+
+    response = await client.get("/products/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="products.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["sku"] for row in rows] == ["SKU-0", "SKU-1", "SKU-2", "OFF-0"]
+    assert rows[0] == {
+        "sku": "SKU-0",
+        "name": "Product 0",
+        "description": "",
+        "price": "10.00",
+        "currency": "USD",
+        "is_active": "true",
+    }
+    assert rows[-1]["is_active"] == "false"
+
+
+async def test_ndjson_export_applies_filters(client, make_products):
+    make_products(2)
+    make_products(2, prefix="OFF", is_active=False)
+
+    response = await client.get("/products/export", params={"format": "ndjson", "is_active": False})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["sku"] for line in lines] == ["OFF-0", "OFF-1"]
+    assert lines[0]["price"] == 10.0
+
+
+async def test_gzip_export_streams_in_batches(client, make_products, monkeypatch):
+    from product_importer.services import product_service
+
+    monkeypatch.setattr(product_service.settings, "product_export_batch_size", 2)
+    make_products(5)
+
+    response = await client.get("/products/export", params={"gzip": True})
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="products.csv.gz"' in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(gzip.decompress(response.content).decode())))
+    assert len(rows) == 6
+
+
+def test_export_yields_one_chunk_per_fetched_batch(db, make_products, monkeypatch):
+    from product_importer.services import product_service
+
+    monkeypatch.setattr(product_service.settings, "product_export_batch_size", 2)
+    make_products(5)
+
+    chunks = list(product_service.ProductService(db).export())
+
+    # Header, then batches of 2, 2 and 1 rows.
+    assert [chunk.count(b"\n") for chunk in chunks] == [1, 2, 2, 1]
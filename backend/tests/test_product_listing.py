@@ -0,0 +1,53 @@
+from sqlalchemy import text
+
+from product_importer.models.product import Product
+
+
+async def test_exact_total_is_counted_once_per_catalog_version(client, db, make_products):
+    make_products(3)
+
+    first = await client.get("/products/", params={"total_mode": "exact"})
+    assert first.status_code == 200
+    assert (first.json()["total"], first.json()["total_exact"]) == (3, True)
+
+    # Rows added behind the API's back do not move the catalog version, so the
+    # cached count is served.
+    make_products(2, prefix="LATE")
+    second = await client.get("/products/", params={"total_mode": "exact", "page_size": 1})
+    assert second.json()["total"] == 3
+
+    # A write through the API bumps the version and the count is taken again.
+    created = await client.post("/products/", json={"sku": "NEW-1", "name": "New"})
+    assert created.status_code == 201
+    third = await client.get("/products/", params={"total_mode": "exact", "page_size": 1})
+    assert third.json()["total"] == 6
+
+
+async def test_estimated_total_comes_from_planner_statistics(client, db, make_products):
+    make_products(40)
+    db.execute(text(f"ANALYZE {Product.__table__.fullname}"))
+    db.commit()
+
+    response = await client.get("/products/", params={"total_mode": "estimated"})
+    body = response.json()
+    assert body["total_exact"] is False
+    assert body["total"] == 40
+
+    filtered = (await client.get("/products/", params={"total_mode": "estimated", "is_active": True})).json()
+    assert filtered["total_exact"] is False
+    assert filtered["total"] > 0
+
+
+async def test_estimated_total_falls_back_to_exact_count_for_substring_search(client, make_products):
+    make_products(5)
+
+    body = (await client.get("/products/", params={"total_mode": "estimated", "query": "Product 1"})).json()
+    assert (body["total"], body["total_exact"]) == (1, True)
+
+
+async def test_total_can_be_skipped(client, make_products):
+    make_products(2)
+
+    body = (await client.get("/products/", params={"total_mode": "none"})).json()
+    assert body["total"] is None
+    assert len(body["items"]) == 2
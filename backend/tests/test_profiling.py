@@ -0,0 +1,98 @@
+import time
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from product_importer.core import profiling
+from product_importer.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware, SamplingProfiler
+from product_importer.main import app
+from product_importer.models.profile import ProfileArtifact, ProfileKind
+
+TOKEN = "s3cret"
+ADMIN = {"X-Admin-Token": TOKEN}
+
+
+@pytest.fixture(autouse=True)
+def admin_token(monkeypatch):
+    monkeypatch.setattr(profiling.settings, "admin_token", TOKEN)
+
+
+@pytest.fixture
+async def profiled_client(client):
+    """Client for the app wrapped in the profiling middleware, installed only when a token is set."""
+
+    transport = httpx.ASGITransport(app=ProfilingMiddleware(app))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as profiled:
+        yield profiled
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _profiles(db) -> list[ProfileArtifact]:
+    db.rollback()
+    return db.scalars(select(ProfileArtifact)).all()
+
+
+def test_sampler_collects_collapsed_stacks_per_thread():
+    with SamplingProfiler(interval_ms=1) as profiler:
+        _spin(0.1)
+
+    assert profiler.samples > 10
+    assert 0.1 <= profiler.duration < 1
+    lines = profiler.collapsed().decode().splitlines()
+    spinning = [line for line in lines if "_spin (" in line]
+    assert spinning and all(line.startswith("MainThread;") for line in spinning)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+async def test_requests_are_profiled_on_demand_and_downloadable(db, profiled_client):
+    response = await profiled_client.get("/products/", headers={"X-Profile": "1", **ADMIN})
+
+    assert response.status_code == 200
+    profile_id = response.headers[PROFILE_ID_HEADER]
+    listed = (
+        await profiled_client.get("/admin/profiles", params={"subject": "GET /products/"}, headers=ADMIN)
+    ).json()
+    assert [item["id"] for item in listed["items"]] == [profile_id]
+    assert listed["items"][0]["kind"] == ProfileKind.REQUEST.value
+
+    download = await profiled_client.get(f"/admin/profiles/{profile_id}", headers=ADMIN)
+    assert download.status_code == 200
+    assert download.headers["content-disposition"] == f'attachment; filename="{profile_id}.collapsed"'
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Profile": "1"}, {"X-Profile": "1", "X-Admin-Token": "wrong"}])
+async def test_requests_are_not_profiled_without_an_admin_token(db, profiled_client, headers):
+    response = await profiled_client.get("/products/", headers=headers)
+
+    assert response.status_code == 200
+    assert PROFILE_ID_HEADER not in response.headers
+    assert _profiles(db) == []
+
+
+async def test_admin_endpoints_require_the_token(profiled_client, monkeypatch):
+    assert (await profiled_client.get("/admin/profiles")).status_code == 403
+    assert (await profiled_client.get("/admin/profiles", headers={"X-Admin-Token": "wrong"})).status_code == 403
+
+    monkeypatch.setattr(profiling.settings, "admin_token", None)
+    assert (await profiled_client.get("/admin/profiles", headers=ADMIN)).status_code == 403
+
+
+async def test_uploads_can_profile_their_ingestion_run(db, client):
+    files = {"file": ("products.csv", b"sku,name,price\nA,Product,5\n", "text/csv")}
+
+    forbidden = await client.post("/uploads/", params={"profile": "true"}, files=files)
+    assert forbidden.status_code == 403
+
+    response = await client.post("/uploads/", params={"profile": "true"}, files=files, headers=ADMIN)
+    assert response.status_code == 200, response.text
+
+    (artifact,) = _profiles(db)
+    assert (artifact.kind, artifact.subject) == (ProfileKind.INGESTION, response.json()["job_id"])
+    download = await client.get(f"/admin/profiles/{artifact.id}", headers=ADMIN)
+    assert download.status_code == 200
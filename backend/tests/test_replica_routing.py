@@ -0,0 +1,146 @@
+"""Read routing, mostly against a real streaming replica (``TEST_DATABASE_READ_URL``).
+
+Replica lag is simulated by pausing WAL replay, so the replica keeps serving the
+catalog as it was before the test's writes.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from conftest import TEST_DATABASE_READ_URL, TEST_DATABASE_URL, dispose_async_engines
+from product_importer.core.config import get_settings
+from product_importer.db import session as db_session_module
+from product_importer.services.catalog_cache import product_key
+
+settings = get_settings()
+
+ORIGIN = {"Origin": "https://app.example.com"}
+
+
+def _scalar(url: str, sql: str):
+    engine = create_engine(url, poolclass=NullPool)
+    try:
+        with engine.connect() as connection:
+            return connection.scalar(text(sql))
+    finally:
+        engine.dispose()
+
+
+def _wait_for_replay(timeout: float = 10.0) -> None:
+    target = _scalar(TEST_DATABASE_URL, "SELECT pg_current_wal_lsn()::text")
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        caught_up = _scalar(
+            TEST_DATABASE_READ_URL, f"SELECT pg_last_wal_replay_lsn() >= '{target}'::pg_lsn"
+        )
+        if caught_up:
+            return
+        time.sleep(0.05)
+    pytest.fail("replica did not catch up")
+
+
+@pytest.fixture
+async def replica(database, monkeypatch):
+    """Route reads to the replica, frozen at the catalog's current state."""
+
+    if not TEST_DATABASE_READ_URL:
+        pytest.skip("TEST_DATABASE_READ_URL is not set")
+    assert _scalar(TEST_DATABASE_READ_URL, "SELECT pg_is_in_recovery()"), "not a streaming replica"
+    monkeypatch.setattr(settings, "database_read_url", TEST_DATABASE_READ_URL)
+    db_session_module.reset_engines()
+
+    state = {"paused": False}
+
+    def pause():
+        _wait_for_replay()
+        _scalar(TEST_DATABASE_READ_URL, "SELECT pg_wal_replay_pause()")
+        state["paused"] = True
+
+    yield pause
+
+    if state["paused"]:
+        _scalar(TEST_DATABASE_READ_URL, "SELECT pg_wal_replay_resume()")
+    await dispose_async_engines()
+    for engine in db_session_module._engines:
+        engine.dispose()
+    db_session_module.reset_engines()
+
+
+async def test_reads_use_the_replica_until_the_client_writes(client, replica, make_products):
+    (product,) = make_products(1)
+    replica()
+
+    created = await client.post("/products/", json={"sku": "NEW-1", "name": "New"})
+    assert created.status_code == 201
+    assert "primary_pin" in created.cookies
+
+    # The writer's pin cookie keeps its reads on the primary (by-SKU reads are uncached).
+    assert (await client.get("/products/by-sku/NEW-1")).status_code == 200
+
+    # Other clients read the lagging replica.
+    client.cookies.clear()
+    assert (await client.get("/products/by-sku/NEW-1")).status_code == 404
+    assert (await client.get(f"/products/by-sku/{product.sku}")).status_code == 200
+
+    # Or opt out per request.
+    assert (await client.get("/products/by-sku/NEW-1", headers={"X-Read-Primary": "1"})).status_code == 200
+
+async def test_cross_origin_clients_echo_the_pin_header(client, replica, make_products):
+    replica()
+
+    created = await client.post("/products/", json={"sku": "NEW-1", "name": "New"}, headers=ORIGIN)
+    assert created.status_code == 201
+    pin_seconds = created.headers["X-Primary-Pin-Seconds"]
+    assert pin_seconds == str(settings.read_replica_pin_seconds)
+
+    # A cross-origin SPA never sends the pin cookie, so it echoes the header instead.
+    client.cookies.clear()
+    assert (await client.get("/products/by-sku/NEW-1", headers=ORIGIN)).status_code == 404
+    echoed = {**ORIGIN, "X-Read-Primary": "1"}
+    assert (await client.get("/products/by-sku/NEW-1", headers=echoed)).status_code == 200
+
+
+async def test_cross_origin_reads_after_a_write_skip_the_replica(client, monkeypatch):
+    # With the replica unreachable, only a read routed to the primary can succeed.
+    monkeypatch.setattr(settings, "database_read_url", "postgresql+psycopg://app@127.0.0.1:1/replica")
+    db_session_module.reset_engines()
+    try:
+        created = await client.post("/products/", json={"sku": "NEW-1", "name": "New"}, headers=ORIGIN)
+        client.cookies.clear()
+        read = await client.get("/products/by-sku/NEW-1", headers={**ORIGIN, "X-Read-Primary": "1"})
+    finally:
+        db_session_module.reset_engines()
+
+    assert created.status_code == 201
+    assert created.headers["X-Primary-Pin-Seconds"] == str(settings.read_replica_pin_seconds)
+    assert read.status_code == 200
+    assert read.json()["sku"] == "NEW-1"
+
+
+async def test_stale_replica_reads_are_never_cached(client, fake_redis, replica, make_products):
+    (product,) = make_products(1)
+    replica()
+
+    updated = await client.patch(f"/products/{product.id}", json={"name": "Renamed"})
+    assert updated.status_code == 200
+    pinned_cookies = dict(client.cookies)
+
+    client.cookies.clear()
+    stale = await client.get(f"/products/{product.id}")
+    assert stale.json()["name"] == "Product 0"
+    assert not fake_redis.exists(product_key(product.id))
+    listing = await client.get("/products/", params={"total_mode": "exact"})
+    assert listing.json()["items"][0]["name"] == "Product 0"
+
+    # The writer reads its own write, and that primary read is what gets cached.
+    client.cookies.update(pinned_cookies)
+    assert (await client.get(f"/products/{product.id}")).json()["name"] == "Renamed"
+    assert (await client.get("/products/")).json()["items"][0]["name"] == "Renamed"
+    assert fake_redis.exists(product_key(product.id))
+
+    # Unpinned readers now get the primary's copy from the cache, never the stale one.
+    client.cookies.clear()
+    assert (await client.get(f"/products/{product.id}")).json()["name"] == "Renamed"
@@ -0,0 +1,60 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from product_importer.core import serialization
+from product_importer.services.product_service import ProductService
+
+
+@pytest.mark.parametrize("fast", [True, False], ids=["orjson", "stdlib"])
+def test_dumps_encodes_database_values(monkeypatch, fast):
+    if fast:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    encoded = serialization.dumps(
+        {
+            "price": Decimal("12.50"),
+            "created_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+        }
+    )
+
+    assert json.loads(encoded) == {
+        "price": 12.5,
+        "created_at": "2026-01-02T03:04:05+00:00",
+        "id": "12345678-1234-5678-1234-567812345678",
+    }
+
+
+def test_dumps_rejects_unknown_types(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    with pytest.raises(TypeError):
+        serialization.dumps({"value": object()})
+
+
+def test_sparse_fieldsets_always_include_id():
+    assert ProductService.resolve_fields(["price", "sku"]) == ["id", "sku", "price"]
+    assert "id" in ProductService.resolve_fields(None)
+    with pytest.raises(ValueError, match="Unknown product fields: secret"):
+        ProductService.resolve_fields(["sku", "secret"])
+
+
+async def test_listing_returns_only_requested_fields(client, make_products):
+    make_products(2)
+
+    body = (await client.get("/products/", params={"fields": "sku, price"})).json()
+
+    assert [set(item) for item in body["items"]] == [{"id", "sku", "price"}] * 2
+    assert {item["price"] for item in body["items"]} == {10.0}
+
+
+async def test_listing_rejects_unknown_fields(client):
+    response = await client.get("/products/", params={"fields": "sku,password"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown product fields: password"
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from sqlalchemy import event, inspect, select, text
+from sqlalchemy.engine import Engine
+
+from product_importer.db.session import get_engine
+from product_importer.models.product import Product
+from product_importer.services.product_service import ProductService
+
+
+@pytest.fixture
+def catalog(make_products, db):
+    """Enough analyzed rows that the planner only picks the index when it can use it."""
+
+    make_products(5000)
+    db.execute(text(f"ANALYZE {Product.__table__.fullname}"))
+    db.commit()
+
+
+@pytest.fixture
+def sku_index(database) -> str:
+    with get_engine().connect() as connection:
+        constraints = inspect(connection).get_unique_constraints(
+            Product.__tablename__, schema=Product.__table__.schema
+        )
+    return next(item["name"] for item in constraints if item["column_names"] == ["sku"])
+
+
+def _plan_nodes(connection, statement: str, parameters) -> list[dict]:
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes, pending = [], [plan[0]["Plan"]]
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        pending.extend(node.get("Plans", []))
+    return nodes
+
+
+def _assert_uses_index(nodes: list[dict], index: str) -> None:
+    scans = {(node["Node Type"], node.get("Index Name")) for node in nodes}
+    assert scans & {("Index Scan", index), ("Bitmap Index Scan", index)}, scans
+    assert not any(node["Node Type"] == "Seq Scan" for node in nodes), scans
+
+
+def _explain(stmt) -> list[dict]:
+    with get_engine().connect() as connection:
+        compiled = stmt.compile(dialect=connection.dialect)
+        return _plan_nodes(connection, str(compiled), compiled.params)
+
+
+@pytest.fixture
+def captured_sku_queries():
+    """Statements filtering on sku that the code under test sends to Postgres."""
+
+    queries: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "sku" in statement.split("WHERE", 1)[-1] and statement.lstrip().startswith("SELECT"):
+            queries.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    yield queries
+    event.remove(Engine, "before_cursor_execute", capture)
+
+
+def test_sku_equality_uses_the_unique_index(catalog, sku_index):
+    stmt = select(Product).where(ProductService._sku_matches("sku-42"))
+
+    _assert_uses_index(_explain(stmt), sku_index)
+
+
+def test_sku_multi_get_uses_the_unique_index(catalog, sku_index):
+    stmt = select(Product).where(ProductService._skus_match(["SKU-1", "sku-2", "Sku-3"]))
+
+    _assert_uses_index(_explain(stmt), sku_index)
+
+
+async def test_sku_routes_query_through_the_unique_index(client, catalog, sku_index, captured_sku_queries):
+    single = await client.get("/products/by-sku/sku-42")
+    many = await client.post("/products/lookup", json={"skus": ["SKU-7", "sku-8", "missing"]})
+
+    assert single.json()["sku"] == "SKU-42"
+    assert sorted(item["sku"] for item in many.json()["items"]) == ["SKU-7", "SKU-8"]
+    assert many.json()["missing"] == ["missing"]
+    assert len(captured_sku_queries) == 2
+    with get_engine().connect() as connection:
+        for statement, parameters in captured_sku_queries:
+            _assert_uses_index(_plan_nodes(connection, statement, parameters), sku_index)
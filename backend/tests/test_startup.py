@@ -0,0 +1,83 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import product_importer
+from product_importer.cli import STARTUP_TARGETS, _import_seconds, _slowest_imports
+
+# Runs a startup target with networking disabled, then reports what importing it left behind.
+PROBE = textwrap.dedent(
+    """
+    import json
+    import socket
+    import sys
+
+    import psycopg
+
+    connections = []
+
+    def refuse(self, address, *args, **kwargs):
+        connections.append(repr(address))
+        raise OSError("network disabled during import")
+
+    # libpq opens its own sockets, so database connections are refused separately.
+    def refuse_database(conninfo="", *args, **kwargs):
+        connections.append(conninfo or repr(kwargs.get("host")))
+        raise psycopg.OperationalError("network disabled during import")
+
+    socket.socket.connect = refuse
+    socket.socket.connect_ex = refuse
+    psycopg.connect = refuse_database
+    psycopg.Connection.connect = staticmethod(refuse_database)
+    psycopg.AsyncConnection.connect = staticmethod(refuse_database)
+
+    {code}
+
+    from product_importer.core import redis as redis_clients
+    from product_importer.db import session
+
+    print(json.dumps({{
+        "connections": connections,
+        "engines": len(session._engines)
+        + session.get_engine.cache_info().currsize
+        + session.get_async_engine.cache_info().currsize,
+        "redis_clients": redis_clients.get_redis.cache_info().currsize
+        + redis_clients.get_async_redis.cache_info().currsize,
+        "boto3": "boto3" in sys.modules,
+    }}))
+    """
+)
+
+
+SOURCE_DIR = str(Path(product_importer.__file__).parents[1])
+
+
+@pytest.mark.parametrize("target", sorted(STARTUP_TARGETS))
+def test_importing_has_no_side_effects(target):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=STARTUP_TARGETS[target])],
+        env={**os.environ, "PYTHONPATH": SOURCE_DIR},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report == {"connections": [], "engines": 0, "redis_clients": 0, "boto3": False}
+
+
+def test_startup_is_timed_and_slow_imports_are_ranked(monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", SOURCE_DIR)
+    code = STARTUP_TARGETS["worker"]
+
+    assert 0 < _import_seconds(code) < 60
+    slowest = _slowest_imports(code, top=3)
+    assert len(slowest) == 3
+    assert [seconds for _, seconds in slowest] == sorted((seconds for _, seconds in slowest), reverse=True)
+    assert "celery" in dict(_slowest_imports(code, top=50))
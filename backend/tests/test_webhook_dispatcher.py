@@ -0,0 +1,159 @@
+import asyncio
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from product_importer.models.webhook import WebhookDelivery, WebhookRetry
+from product_importer.schemas.webhook import WebhookCreate
+from product_importer.services import webhook_dispatcher
+from product_importer.services.webhook_dispatcher import WebhookDispatcher, WebhookTarget, get_dispatcher
+from product_importer.services.webhook_service import WebhookService
+from product_importer.workers.tasks.webhooks import dispatch_webhook_event
+
+
+def _targets(count: int, **headers) -> list[WebhookTarget]:
+    return [
+        WebhookTarget(id=uuid.uuid4(), target_url=f"https://hooks.example.com/{index}", headers=headers)
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def dispatcher():
+    created = []
+
+    def make(handler, **options) -> WebhookDispatcher:
+        instance = WebhookDispatcher(**options)
+        instance._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        created.append(instance)
+        return instance
+
+    yield make
+    for instance in created:
+        instance.close()
+
+
+def test_deliveries_run_in_parallel(dispatcher):
+    received = []
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        await asyncio.sleep(0.2)
+        return httpx.Response(204)
+
+    started = time.perf_counter()
+    results = dispatcher(slow, concurrency=10).deliver(_targets(8, Authorization="token"), "ping", {"a": 1})
+
+    assert time.perf_counter() - started < 0.8
+    assert [result.status for result in results] == ["success"] * 8
+    assert {request.headers["authorization"] for request in received} == {"token"}
+    assert {json.loads(request.content)["payload"]["a"] for request in received} == {1}
+
+
+def test_concurrency_is_bounded(dispatcher):
+    in_flight, peak = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    dispatcher(handler, concurrency=3).deliver(_targets(10), "ping", {})
+
+    assert peak == 3
+
+
+def test_failures_are_reported_per_target(dispatcher):
+    targets = _targets(3)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url == targets[1].target_url:
+            return httpx.Response(500, text="boom")
+        if request.url == targets[2].target_url:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, text="ok")
+
+    results = dispatcher(handler).deliver(targets, "ping", {})
+
+    assert [(result.status, result.response_code) for result in results] == [
+        ("success", 200),
+        ("failed", 500),
+        ("failed", None),
+    ]
+    assert results[1].response_body == "boom"
+    assert "refused" in results[2].response_body
+
+
+def test_connections_are_reused_across_dispatches():
+    peers = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            peers.append(self.client_address)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    target = WebhookTarget(id=uuid.uuid4(), target_url=f"http://127.0.0.1:{server.server_port}/hook")
+    instance = WebhookDispatcher()
+    try:
+        for _ in range(3):
+            assert instance.deliver([target], "ping", {})[0].status == "success"
+    finally:
+        instance.close()
+        server.shutdown()
+        server.server_close()
+
+    assert len(peers) == 3
+    assert len(set(peers)) == 1
+
+
+def test_each_process_gets_its_own_dispatcher(monkeypatch):
+    first = get_dispatcher()
+    assert get_dispatcher() is first
+
+    monkeypatch.setattr(webhook_dispatcher.os, "getpid", lambda: -1)
+    forked = get_dispatcher()
+
+    assert forked is not first
+    first.close()
+    forked.close()
+
+
+def test_dispatch_logs_deliveries_and_queues_failures(db, webhook_endpoints):
+    service = WebhookService(db)
+    ok = service.create(WebhookCreate(name="ok", target_url="https://a.example.com/", event="product.batch"))
+    bad = service.create(WebhookCreate(name="bad", target_url="https://b.example.com/", event="product.batch"))
+    service.create(WebhookCreate(name="other", target_url="https://c.example.com/", event="product.deleted"))
+    db.commit()
+    webhook_endpoints.responses["https://b.example.com/"] = 503
+
+    dispatch_webhook_event("product.batch", {"created": 2})
+
+    assert sorted(str(request.url) for request in webhook_endpoints.requests) == [
+        "https://a.example.com/",
+        "https://b.example.com/",
+    ]
+    logs = {row.webhook_id: row for row in db.scalars(select(WebhookDelivery))}
+    assert (logs[ok.id].status, logs[bad.id].status, logs[bad.id].response_code) == ("success", "failed", 503)
+    retries = db.scalars(select(WebhookRetry)).all()
+    assert [(retry.webhook_id, retry.attempts, retry.last_error) for retry in retries] == [
+        (bad.id, 1, "HTTP 503")
+    ]
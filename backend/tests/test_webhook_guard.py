@@ -0,0 +1,121 @@
+import time
+from uuid import uuid4
+
+import pytest
+import redis
+from sqlalchemy import select
+
+from product_importer.models.webhook import WebhookRetry
+from product_importer.schemas.webhook import WebhookCreate
+from product_importer.services import webhook_guard as guard_module
+from product_importer.services.webhook_guard import webhook_guard
+from product_importer.services.webhook_service import WebhookService
+from product_importer.workers.tasks.webhooks import dispatch_webhook_event
+
+URL = "https://hooks.example.com/"
+
+
+@pytest.fixture
+def guard(monkeypatch):
+    monkeypatch.setattr(guard_module.settings, "webhook_breaker_failure_threshold", 3)
+    monkeypatch.setattr(guard_module.settings, "webhook_breaker_cooldown_seconds", 0.2)
+    monkeypatch.setattr(guard_module.settings, "webhook_rate_limit_per_second", 0)
+    return webhook_guard()
+
+
+def _fail(guard, webhook_id, times: int = 1) -> None:
+    guard.report([(webhook_id, False)] * times)
+
+
+def test_circuit_opens_after_consecutive_failures(guard):
+    webhook_id = uuid4()
+    _fail(guard, webhook_id, 2)
+    guard.report([(webhook_id, True)])
+    _fail(guard, webhook_id, 2)
+    assert guard.admit([webhook_id])[0].allowed
+
+    _fail(guard, webhook_id)
+    (admission,) = guard.admit([webhook_id])
+
+    assert (admission.allowed, admission.reason) == (False, "circuit open")
+    assert 0 < admission.retry_after <= 0.2
+    status = guard.status(webhook_id)
+    assert (status.state, status.consecutive_failures, status.short_circuited) == ("open", 3, 1)
+    assert status.opened_at is not None
+
+
+def test_a_single_probe_closes_the_circuit_after_the_cooldown(guard):
+    webhook_id = uuid4()
+    _fail(guard, webhook_id, 3)
+    time.sleep(0.25)
+
+    probe, concurrent = guard.admit([webhook_id, webhook_id])
+
+    assert probe.allowed and not concurrent.allowed
+    assert guard.status(webhook_id).state == "half_open"
+    guard.report([(webhook_id, True)])
+    assert guard.status(webhook_id).state == "closed"
+    assert guard.admit([webhook_id])[0].allowed
+
+
+def test_a_failed_probe_opens_the_circuit_again(guard):
+    webhook_id = uuid4()
+    _fail(guard, webhook_id, 3)
+    time.sleep(0.25)
+    assert guard.admit([webhook_id])[0].allowed
+
+    _fail(guard, webhook_id)
+
+    assert guard.status(webhook_id).state == "open"
+    assert not guard.admit([webhook_id])[0].allowed
+
+
+def test_rate_limit_allows_a_burst_then_throttles(guard, monkeypatch):
+    monkeypatch.setattr(guard_module.settings, "webhook_rate_limit_per_second", 2)
+    monkeypatch.setattr(guard_module.settings, "webhook_rate_limit_burst", 3)
+    webhook_id, other = uuid4(), uuid4()
+
+    admissions = guard.admit([webhook_id] * 5 + [other])
+
+    assert [admission.allowed for admission in admissions] == [True, True, True, False, False, True]
+    assert admissions[3].reason == "rate limited"
+    assert 0 < admissions[3].retry_after <= 0.5
+    assert guard.status(webhook_id).throttled == 2
+
+
+def test_deliveries_are_allowed_when_redis_is_down(guard, monkeypatch):
+    def unavailable(self, *args, **kwargs):
+        raise redis.ConnectionError("redis unavailable")
+
+    monkeypatch.setattr(type(guard.client.pipeline()), "execute", unavailable)
+
+    assert all(admission.allowed for admission in guard.admit([uuid4(), uuid4()]))
+    guard.report([(uuid4(), False)])
+
+
+def test_open_circuits_hold_deliveries_back_without_using_an_attempt(db, guard, webhook_endpoints):
+    hook = WebhookService(db).create(WebhookCreate(name="hook", target_url=URL, event="product.batch"))
+    db.commit()
+    _fail(guard, hook.id, 3)
+
+    dispatch_webhook_event("product.batch", {"created": 1})
+
+    assert webhook_endpoints.requests == []
+    retry = db.scalars(select(WebhookRetry)).one()
+    assert (retry.attempts, retry.last_error) == (0, "circuit open")
+
+
+async def test_circuit_state_is_exposed_and_can_be_reset(client, guard):
+    response = await client.post(
+        "/webhooks/", json={"name": "hook", "target_url": URL, "event": "product.batch"}
+    )
+    webhook_id = response.json()["id"]
+    _fail(guard, webhook_id, 3)
+    guard.admit([webhook_id])
+
+    circuit = (await client.get(f"/webhooks/{webhook_id}/circuit")).json()
+    assert (circuit["state"], circuit["consecutive_failures"], circuit["short_circuited"]) == ("open", 3, 1)
+
+    reset = await client.post(f"/webhooks/{webhook_id}/circuit/reset")
+    assert reset.json()["state"] == "closed"
+    assert (await client.get(f"/webhooks/{uuid4()}/circuit")).status_code == 404
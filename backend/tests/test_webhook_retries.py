@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, text
+
+from product_importer.db.session import SessionLocal, get_engine
+from product_importer.models.webhook import Webhook, WebhookDelivery, WebhookRetry
+from product_importer.schemas.webhook import WebhookCreate
+from product_importer.services import webhook_service
+from product_importer.services.webhook_service import WebhookService, retry_delay
+from product_importer.workers.tasks.webhooks import retry_webhook_deliveries
+
+URL = "https://hooks.example.com/"
+
+
+@pytest.fixture
+def hook(db) -> Webhook:
+    webhook = WebhookService(db).create(WebhookCreate(name="hook", target_url=URL, event="product.batch"))
+    db.commit()
+    return webhook
+
+
+def _retry(db, hook: Webhook, *, attempts: int = 1, due_in: float = -1) -> WebhookRetry:
+    retry = WebhookRetry(
+        webhook_id=hook.id,
+        event="product.batch",
+        payload={"created": attempts},
+        attempts=attempts,
+        next_attempt_at=datetime.now(timezone.utc) + timedelta(seconds=due_in),
+    )
+    db.add(retry)
+    db.commit()
+    return retry
+
+
+def _retries(db) -> list[WebhookRetry]:
+    db.expire_all()
+    return db.scalars(select(WebhookRetry)).all()
+
+
+def test_backoff_doubles_with_jitter_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(webhook_service.settings, "webhook_retry_base_seconds", 10)
+    monkeypatch.setattr(webhook_service.settings, "webhook_retry_max_backoff_seconds", 60)
+
+    for attempts, ceiling in ((1, 10), (2, 20), (3, 40), (4, 60), (9, 60)):
+        delays = [retry_delay(attempts) for _ in range(50)]
+        assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+
+
+def test_due_retries_are_delivered_and_removed(db, hook, webhook_endpoints):
+    _retry(db, hook)
+    _retry(db, hook, due_in=600)
+
+    assert retry_webhook_deliveries() == 1
+
+    assert [retry.next_attempt_at > datetime.now(timezone.utc) for retry in _retries(db)] == [True]
+    assert [str(request.url) for request in webhook_endpoints.requests] == [URL]
+    assert db.scalar(select(WebhookDelivery.status)) == "success"
+
+
+def test_failed_retries_back_off_until_they_give_up(db, hook, webhook_endpoints, monkeypatch):
+    monkeypatch.setattr(webhook_service.settings, "webhook_max_retries", 2)
+    webhook_endpoints.responses[URL] = 502
+    retry = _retry(db, hook)
+
+    assert retry_webhook_deliveries() == 1
+    (pending,) = _retries(db)
+    assert (pending.attempts, pending.last_error) == (2, "HTTP 502")
+    assert pending.next_attempt_at > datetime.now(timezone.utc)
+
+    db.execute(
+        text(f"UPDATE {WebhookRetry.__table__.fullname} SET next_attempt_at = now() WHERE id = :id"),
+        {"id": retry.id},
+    )
+    db.commit()
+    assert retry_webhook_deliveries() == 1
+    assert _retries(db) == []
+
+
+def test_no_transaction_is_held_while_delivering(db, hook, webhook_endpoints):
+    retry = _retry(db, hook)
+    seen = {}
+
+    def while_delivering(request):
+        with get_engine().connect() as connection:
+            seen["idle_in_transaction"] = connection.scalar(
+                text(
+                    "SELECT count(*) FROM pg_stat_activity "
+                    "WHERE datname = current_database() AND state LIKE 'idle in transaction%'"
+                )
+            )
+        with SessionLocal() as other:
+            # A concurrent sweep neither waits on nor re-claims the leased row.
+            other.execute(text("SET lock_timeout = '200ms'"))
+            seen["claimed_again"] = WebhookService(other).claim_due_retries(10)
+            row = other.get(WebhookRetry, retry.id, with_for_update={"nowait": True})
+            seen["leased_until"] = row.next_attempt_at
+
+    webhook_endpoints.on_request = while_delivering
+
+    assert retry_webhook_deliveries() == 1
+
+    assert seen["idle_in_transaction"] == 0
+    assert seen["claimed_again"] == []
+    assert seen["leased_until"] > datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert _retries(db) == []
+
+
+def test_retries_of_disabled_webhooks_are_dropped(db, hook, webhook_endpoints):
+    _retry(db, hook)
+    hook.is_enabled = False
+    db.commit()
+
+    assert retry_webhook_deliveries() == 0
+    assert _retries(db) == []
+    assert webhook_endpoints.requests == []
+
+
+def test_webhook_deleted_during_delivery(db, hook, webhook_endpoints):
+    _retry(db, hook)
+    webhook_endpoints.responses[URL] = 500
+
+    def delete_webhook(request):
+        with SessionLocal() as other:
+            WebhookService(other).delete(hook.id)
+            other.commit()
+
+    webhook_endpoints.on_request = delete_webhook
+
+    assert retry_webhook_deliveries() == 1
+    assert _retries(db) == []
+    assert db.scalar(select(WebhookDelivery.id)) is None
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from product_importer.models.webhook import Webhook, WebhookLatencyRollup
+from product_importer.services.delivery_logs import DeliveryLogService
+from product_importer.services.webhook_stats import (
+    OVERFLOW_BUCKET_MS,
+    build_stats,
+    latency_bucket,
+    prune_rollups,
+)
+
+
+def _hook(db, name: str = "hook") -> Webhook:
+    webhook = Webhook(name=name, target_url=f"https://{name}.example.com/", event="product.batch")
+    db.add(webhook)
+    db.commit()
+    return webhook
+
+
+def _deliver(db, hook: Webhook, *latencies: int, status: str = "success") -> None:
+    DeliveryLogService(db).record(
+        {"webhook_id": hook.id, "event": "product.batch", "payload": {}, "status": status, "response_time_ms": ms}
+        for ms in latencies
+    )
+    db.commit()
+
+
+def test_latencies_fall_into_the_next_bucket_up():
+    assert [latency_bucket(ms) for ms in (None, 0, 25, 26, 9999, 30000)] == [25, 25, 25, 50, 10000, 30000]
+    assert latency_bucket(30001) == OVERFLOW_BUCKET_MS
+
+
+def test_percentiles_come_from_the_histogram():
+    stats = build_stats(None, 10, [(25, 90, 90, 900), (250, 9, 5, 1800), (OVERFLOW_BUCKET_MS, 1, 0, 60000)])
+
+    assert (stats.deliveries, stats.successes, stats.success_rate) == (100, 95, 0.95)
+    assert (stats.p50_ms, stats.p95_ms, stats.p99_ms) == (25, 250, 250)
+    assert stats.throughput_per_minute == 10
+    assert stats.avg_ms == pytest.approx(627)
+    assert build_stats(None, 5, []).p50_ms is None
+
+
+def test_deliveries_are_folded_into_minute_rollups(db):
+    hook = _hook(db)
+    _deliver(db, hook, 10, 20, 300)
+    _deliver(db, hook, 15, status="failed")
+
+    rows = db.execute(
+        select(WebhookLatencyRollup.le_ms, WebhookLatencyRollup.deliveries, WebhookLatencyRollup.successes)
+        .order_by(WebhookLatencyRollup.le_ms)
+    ).all()
+    assert [tuple(row) for row in rows] == [(25, 3, 2), (500, 1, 1)]
+
+
+async def test_webhook_stats_cover_the_requested_window(db, client):
+    hook = _hook(db)
+    _deliver(db, hook, *[20] * 18, 700, 700)
+    db.add(
+        WebhookLatencyRollup(
+            webhook_id=hook.id,
+            minute=datetime.now(timezone.utc).replace(second=0, microsecond=0) - timedelta(hours=2),
+            le_ms=5000,
+            deliveries=20,
+            successes=0,
+            total_ms=80000,
+        )
+    )
+    db.commit()
+
+    recent = (await client.get(f"/webhooks/{hook.id}/stats", params={"window_minutes": 60})).json()
+    assert (recent["deliveries"], recent["success_rate"], recent["p50_ms"], recent["p95_ms"]) == (20, 1.0, 25, 1000)
+    assert recent["throughput_per_minute"] == pytest.approx(20 / 60)
+
+    wider = (await client.get(f"/webhooks/{hook.id}/stats", params={"window_minutes": 180})).json()
+    assert (wider["deliveries"], wider["success_rate"], wider["p95_ms"]) == (40, 0.5, 5000)
+
+    assert (await client.get(f"/webhooks/{uuid4()}/stats")).status_code == 404
+    assert (await client.get(f"/webhooks/{hook.id}/stats", params={"window_minutes": 0})).status_code == 422
+
+
+async def test_fleet_stats_list_the_slowest_webhooks_first(db, client):
+    fast, slow = _hook(db, "fast"), _hook(db, "slow")
+    _deliver(db, fast, 10, 10, 10)
+    _deliver(db, slow, 2000)
+
+    stats = (await client.get("/webhooks/stats")).json()
+
+    assert stats["overall"]["deliveries"] == 4
+    assert [entry["webhook_id"] for entry in stats["webhooks"]] == [str(slow.id), str(fast.id)]
+
+
+def test_old_rollups_are_pruned(db):
+    hook = _hook(db)
+    _deliver(db, hook, 10)
+    db.add(
+        WebhookLatencyRollup(
+            webhook_id=hook.id,
+            minute=datetime.now(timezone.utc) - timedelta(days=8),
+            le_ms=25,
+            deliveries=1,
+            successes=1,
+            total_ms=10,
+        )
+    )
+    db.commit()
+
+    prune_rollups(db, retention_days=7)
+    db.commit()
+
+    assert db.scalar(select(func.count()).select_from(WebhookLatencyRollup)) == 1
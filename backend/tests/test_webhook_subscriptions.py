@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from product_importer.schemas.webhook import WebhookCreate, WebhookUpdate
+from product_importer.services.webhook_service import WebhookService
+from product_importer.services.webhook_subscriptions import (
+    SUBSCRIPTIONS_CHANNEL,
+    SubscriptionIndex,
+    subscriptions,
+)
+
+
+def _hook(event_name: str = "product.batch", **fields) -> WebhookCreate:
+    return WebhookCreate(name=event_name, target_url="https://hooks.example.com/", event=event_name, **fields)
+
+
+@pytest.fixture
+def webhook_queries():
+    """Number of queries on the webhooks table issued by the code under test."""
+
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and ".webhooks" in statement.split("WHERE", 1)[0]:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", capture)
+
+
+def _eventually(check, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if check():
+            return True
+        time.sleep(0.02)
+    return check()
+
+
+def test_events_are_matched_from_memory(db, webhook_queries):
+    WebhookService(db).create(_hook())
+    WebhookService(db).create(_hook("product.deleted", is_enabled=False))
+    db.commit()
+    index = subscriptions()
+
+    for _ in range(5):
+        assert len(index.targets_for("product.batch")) == 1
+        assert not index.has_subscribers("product.deleted")
+
+    assert len(webhook_queries) == 1
+
+
+def test_expired_index_is_reloaded(db, webhook_queries):
+    index = SubscriptionIndex(ttl_seconds=0)
+    assert not index.has_subscribers("product.batch")
+
+    WebhookService(db).create(_hook())
+    db.commit()
+
+    assert index.has_subscribers("product.batch")
+    assert len(webhook_queries) == 2
+
+
+def test_committed_changes_are_published(db, fake_redis):
+    pubsub = fake_redis.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(SUBSCRIPTIONS_CHANNEL)
+    service = WebhookService(db)
+
+    service.create(_hook())
+    db.rollback()
+    assert pubsub.get_message(timeout=0.1) is None
+
+    hook = service.create(_hook())
+    db.commit()
+    service.update(hook.id, WebhookUpdate(name="renamed"))
+    service.update(hook.id, WebhookUpdate(is_enabled=False))
+    db.commit()
+
+    messages = [pubsub.get_message(timeout=0.5) for _ in range(3)]
+    assert [message and message["data"] for message in messages] == [b"changed", b"changed", None]
+
+
+async def test_api_changes_invalidate_every_process_index(client):
+    index = subscriptions()
+    assert not index.has_subscribers("product.batch")
+
+    response = await client.post(
+        "/webhooks/", json={"name": "a", "target_url": "https://hooks.example.com/", "event": "product.batch"}
+    )
+    assert response.status_code == 201
+    assert _eventually(lambda: index.has_subscribers("product.batch"))
+
+    await client.patch(f"/webhooks/{response.json()['id']}", json={"is_enabled": False})
+    assert _eventually(lambda: not index.has_subscribers("product.batch"))
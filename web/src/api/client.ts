@@ -7,6 +7,25 @@ export const apiClient = axios.create({
   withCredentials: false,
 });
 
+// After a write the API returns how long reads should skip the (possibly lagging)
+// read replica; cross-origin requests carry no cookies, so the pin is sent as a header.
+let readPrimaryUntil = 0;
+
+apiClient.interceptors.response.use((response) => {
+  const pinSeconds = Number(response.headers["x-primary-pin-seconds"]);
+  if (pinSeconds > 0) {
+    readPrimaryUntil = Date.now() + pinSeconds * 1000;
+  }
+  return response;
+});
+
+apiClient.interceptors.request.use((config) => {
+  if (Date.now() < readPrimaryUntil) {
+    config.headers.set("X-Read-Primary", "1");
+  }
+  return config;
+});
+
 export const apiErrorMessage = (error: unknown): string => {
   if (axios.isAxiosError(error)) {
     return (
@@ -1,6 +1,6 @@
 import { apiClient } from "./client";
 import type {
-  BulkDeleteResponse,
+  BulkDeleteJob,
   Product,
   ProductCreateInput,
   ProductListResponse,
@@ -45,8 +45,8 @@ export const deleteProduct = async (productId: number): Promise<void> => {
 
 export const bulkDeleteProducts = async (
   confirmationText: string
-): Promise<BulkDeleteResponse> => {
-  const { data } = await apiClient.post<BulkDeleteResponse>(
+): Promise<BulkDeleteJob> => {
+  const { data } = await apiClient.post<BulkDeleteJob>(
     "/products/bulk-delete",
     {
       confirmation_text: confirmationText,
@@ -54,3 +54,8 @@ export const bulkDeleteProducts = async (
   );
   return data;
 };
+
+export const fetchBulkDeleteJob = async (jobId: string): Promise<BulkDeleteJob> => {
+  const { data } = await apiClient.get<BulkDeleteJob>(`/products/bulk-delete/${jobId}`);
+  return data;
+};
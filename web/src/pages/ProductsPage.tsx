@@ -1,5 +1,5 @@
 import type { FormEvent } from "react";
-import { useMemo, useState } from "react";
+import { useEffect, useMemo, useState } from "react";
 import {
   useMutation,
   useQuery,
@@ -9,10 +9,12 @@ import {
   bulkDeleteProducts,
   createProduct,
   deleteProduct,
+  fetchBulkDeleteJob,
   fetchProducts,
   updateProduct,
 } from "../api/products";
 import type {
+  BulkDeleteJob,
   Product,
   ProductCreateInput,
   ProductListResponse,
@@ -29,6 +31,29 @@ interface ProductModalState {
 }
 
 const PAGE_SIZE = 10;
+const POLL_INTERVAL = 2_000;
+
+function isFinished(job?: BulkDeleteJob) {
+  return job?.status === "completed" || job?.status === "failed";
+}
+
+function bulkDeleteProgress(job: BulkDeleteJob) {
+  const deleted = job.deleted_rows.toLocaleString();
+  const rows =
+    job.total_rows === null ? deleted : `${deleted} / ${job.total_rows.toLocaleString()}`;
+  switch (job.status) {
+    case "queued":
+      return "Bulk delete queued...";
+    case "running":
+      return `Deleting products... ${rows} rows`;
+    case "retrying":
+      return `Bulk delete hit an error and will retry (${rows} rows deleted): ${job.error ?? "unknown error"}`;
+    case "completed":
+      return `Bulk delete completed, ${deleted} rows deleted.`;
+    case "failed":
+      return `Bulk delete failed after ${deleted} rows: ${job.error ?? "unknown error"}`;
+  }
+}
 
 export function ProductsPage() {
   const queryClient = useQueryClient();
@@ -44,6 +69,7 @@ export function ProductsPage() {
   });
   const [confirmationText, setConfirmationText] = useState("");
   const [bulkDeleteMessage, setBulkDeleteMessage] = useState<string | null>(null);
+  const [bulkDeleteJobId, setBulkDeleteJobId] = useState<string | null>(null);
 
   const productsQuery = useQuery<ProductListResponse>({
     queryKey: ["products", page, filters],
@@ -86,16 +112,46 @@ export function ProductsPage() {
   const bulkDeleteMutation = useMutation({
     mutationFn: () => bulkDeleteProducts(confirmationText),
     onSuccess: (data) => {
-      setBulkDeleteMessage(`${data.deleted_count} products deleted.`);
+      setBulkDeleteJobId(data.id);
+      setBulkDeleteMessage(null);
       setConfirmationText("");
-      queryClient.invalidateQueries({ queryKey: ["products"] });
     },
-    onError: (error) => setBulkDeleteMessage(apiErrorMessage(error)),
+    onError: (error) => {
+      setBulkDeleteJobId(null);
+      setBulkDeleteMessage(apiErrorMessage(error));
+    },
   });
 
+  const bulkDeleteJobQuery = useQuery({
+    queryKey: ["bulk-delete-job", bulkDeleteJobId],
+    queryFn: () => fetchBulkDeleteJob(bulkDeleteJobId as string),
+    enabled: Boolean(bulkDeleteJobId),
+    refetchInterval: (query) => (isFinished(query.state.data) ? false : POLL_INTERVAL),
+  });
+  const bulkDeleteJob = bulkDeleteJobQuery.data;
+
+  useEffect(() => {
+    if (isFinished(bulkDeleteJob)) {
+      queryClient.invalidateQueries({ queryKey: ["products"] });
+    }
+  }, [bulkDeleteJob, queryClient]);
+
+  const bulkDeleteStatus = bulkDeleteJob
+    ? bulkDeleteProgress(bulkDeleteJob)
+    : bulkDeleteJobQuery.isError
+      ? apiErrorMessage(bulkDeleteJobQuery.error)
+      : bulkDeleteMessage;
+  const bulkDeleteFailed =
+    bulkDeleteMutation.isError ||
+    bulkDeleteJobQuery.isError ||
+    bulkDeleteJob?.status === "failed" ||
+    bulkDeleteJob?.status === "retrying";
+  const bulkDeleteRunning =
+    Boolean(bulkDeleteJobId) && !isFinished(bulkDeleteJob) && !bulkDeleteJobQuery.isError;
+
   const totalPages = useMemo(() => {
     if (!productsQuery.data) return 1;
-    return Math.max(1, Math.ceil(productsQuery.data.total / PAGE_SIZE));
+    return Math.max(1, Math.ceil((productsQuery.data.total ?? 0) / PAGE_SIZE));
   }, [productsQuery.data]);
 
   const openCreateModal = () => setModal({ open: true, mode: "create" });
@@ -211,19 +267,19 @@ export function ProductsPage() {
             <button
               type="button"
               className="button danger"
-              disabled={confirmationText.toUpperCase() !== "DELETE ALL"}
+              disabled={confirmationText.toUpperCase() !== "DELETE ALL" || bulkDeleteRunning}
               onClick={() => bulkDeleteMutation.mutate()}
             >
               Delete All
             </button>
           </div>
         </div>
-        {bulkDeleteMessage && (
+        {bulkDeleteStatus && (
           <div
-            className={`alert ${bulkDeleteMutation.isError ? "error" : "success"}`}
+            className={`alert ${bulkDeleteFailed ? "error" : "success"}`}
             style={{ marginTop: "12px" }}
           >
-            {bulkDeleteMessage}
+            {bulkDeleteStatus}
           </div>
         )}
       </section>
@@ -41,7 +41,8 @@ export interface Product {
 
 export interface ProductListResponse {
   items: Product[];
-  total: number;
+  total: number | null;
+  total_exact: boolean;
   page: number;
   page_size: number;
 }
@@ -63,8 +64,17 @@ export interface ProductUpdateInput {
   is_active?: boolean;
 }
 
-export interface BulkDeleteResponse {
-  deleted_count: number;
+export type BulkDeleteStatus = "queued" | "running" | "retrying" | "completed" | "failed";
+
+export interface BulkDeleteJob {
+  id: string;
+  status: BulkDeleteStatus;
+  strategy: string | null;
+  total_rows: number | null;
+  deleted_rows: number;
+  error: string | null;
+  created_at: string;
+  updated_at: string;
 }
 
 export interface Webhook {